@@ -1,14 +1,36 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 import time
-import matplotlib.pyplot as plt
-import networkx as nx
-from src.parsers import ParserFactory
-from src.algorithms import AlgorithmFactory
+import os
+import shutil
+import tempfile
+from src.parsers import ParserFactory, BinaryGraphParser, get_graph_cache, graph_to_archive
+from src.algorithms import AlgorithmFactory, EuclideanHeuristic, distance_matrix, matrix_eccentricity
 from src.visualization.graph_visualizer import GraphVisualizer
+from src.visualization.layout_engine import compute_layout
+from src.visualization.frame_scheduler import FrameScheduler
+from src.visualization.frame_exporter import export_animation, GIF, MP4, PNG
+from src.instrumentation import Instrumentation, use_instrumentation, timed
 
+# Algoritmos de caminho mínimo que aceitam um nó de destino (obrigatório nos dois últimos)
+TARGET_ALGORITHMS = ["Dijkstra", "Dijkstra (bidirecional)", "A*"]
 
-def main():
+# Árvore geradora mínima: Prim cobre o componente do nó inicial; Kruskal e Borůvka, o grafo todo (floresta)
+MST_ALGORITHMS = ["MST (Prim)", "MST (Kruskal)", "MST (Borůvka)"]
+
+
+def create_algorithm(algorithm_type: str, target=None):
+    # O A* estima a distância restante pelas posições do layout exibido
+    heuristic = None
+    if algorithm_type == "A*":
+        visualizer = st.session_state.visualizer
+        positions = visualizer.layout or compute_layout(st.session_state.csr_graph, visualizer.layout_type)
+        heuristic = EuclideanHeuristic(positions)
+    return AlgorithmFactory.create_algorithm(algorithm_type, target, heuristic)
+
+
+def render_app():
     st.set_page_config(page_title="Visualizador de Algoritmos de Grafos", layout="wide")
     st.title("Visualizador Educacional de Algoritmos de Grafos")
 
@@ -21,9 +43,19 @@ def main():
         st.session_state.graph_loaded = False
     if 'graph' not in st.session_state:
         st.session_state.graph = None
+    if 'csr_graph' not in st.session_state:
+        st.session_state.csr_graph = None
     if 'algorithm_type' not in st.session_state:
         st.session_state.algorithm_type = None
 
+    # Reprodução: trace calculado uma vez, passo atual e estado de play/pause
+    if 'trace' not in st.session_state:
+        st.session_state.trace = None
+        st.session_state.trace_start = None
+    if 'playing' not in st.session_state:
+        st.session_state.playing = False
+        st.session_state.scheduler = FrameScheduler()
+
     # Entradas da barra lateral
     with st.sidebar:
         st.header("Configuração")
@@ -31,23 +63,41 @@ def main():
         # Passo 1: Seleção de formato
         format_type = st.selectbox(
             "Formato do Grafo",
-            ["Lista de Arestas", "Matriz de Adjacência", "Lista de Adjacência"],
-            help="Selecione o formato do seu arquivo CSV"
+            ["Lista de Arestas", "Matriz de Adjacência", "Lista de Adjacência", "Grafo Binário"],
+            help="Selecione o formato do seu arquivo CSV (ou um grafo binário .zip exportado pelo app)"
         )
+        is_binary = format_type == "Grafo Binário"
 
         # Passo 2: Upload de arquivo
         uploaded_file = st.file_uploader(
-            "Carregar Arquivo CSV",
-            type=['csv'],
-            help="Carregue um arquivo CSV no formato selecionado"
+            "Carregar Arquivo Binário (.zip)" if is_binary else "Carregar Arquivo CSV",
+            type=['zip'] if is_binary else ['csv'],
+            help="Carregue um arquivo no formato selecionado"
         )
 
+        # Leitura em blocos para arquivos grandes
+        streaming = False
+        if not is_binary:
+            streaming = st.checkbox(
+                "Leitura em blocos (arquivos grandes)",
+                value=False,
+                help="Lê o CSV em blocos, sem carregar a tabela inteira na memória"
+            )
+
         # Passo 3: Seleção de algoritmo
         algorithm_type = st.selectbox(
             "Algoritmo",
-            ["BFS", "DFS", "Dijkstra", "MST (Prim)"],
-            help="Escolha o algoritmo de travessia para visualizar"
+            ["BFS", "DFS", "Dijkstra", "Dijkstra (bidirecional)", "A*"] + MST_ALGORITHMS,
+            help="Escolha o algoritmo de travessia para visualizar (o bidirecional e o A* exigem um nó de destino)"
+        )
+
+        # Algoritmo de posicionamento dos nós
+        layout_type = st.selectbox(
+            "Layout",
+            ["Automático", "Spring (NetworkX)", "Força (grade)", "Espectral", "Hierárquico (BFS)"],
+            help="Automático usa o spring layout em grafos pequenos e o layout de força por grade nos grandes"
         )
+        st.session_state.visualizer.set_layout_type(layout_type)
 
         # Passo 4: Controle de velocidade
         speed = st.slider(
@@ -59,9 +109,32 @@ def main():
         )
         sleep_duration = (11 - speed) * 0.1  # Converter para segundos
 
+        # Duração alvo: passos são agrupados por quadro quando a renderização atrasa
+        target_duration = st.number_input(
+            "Duração Total da Animação (s)",
+            min_value=0.0,
+            value=0.0,
+            step=5.0,
+            help="0 = usar a velocidade acima. Com um valor, a animação termina nesse tempo, agrupando passos se necessário"
+        )
+
         # Passo 5: Botão executar
         execute = st.button("Carregar e Executar (Clique duas vezes)", type="primary")
 
+        # Medição opcional de desempenho (painel no fim da página)
+        st.divider()
+        perf_enabled = st.checkbox(
+            "Medir desempenho",
+            key="perf_enabled",
+            help="Cronometra leitura, passos do algoritmo, renderização e envio dos quadros"
+        )
+        if perf_enabled:
+            st.checkbox(
+                "Capturar cProfile",
+                key="perf_profile",
+                help="Perfil completo de chamadas (deixa a execução mais lenta)"
+            )
+
     # Área de conteúdo principal - Instruções (mostrar apenas quando nenhum grafo estiver carregado)
     if not st.session_state.graph_loaded:
         st.markdown("""
@@ -146,37 +219,69 @@ def main():
     # Lógica principal de execução - Carregar grafo
     if execute:
         if uploaded_file is None:
-            st.error("Por favor, carregue um arquivo CSV")
+            st.error("Por favor, carregue um arquivo CSV" if not is_binary else "Por favor, carregue um grafo binário (.zip)")
         else:
             try:
-                # Processar CSV
-                df = pd.read_csv(uploaded_file)
-
-                # Mostrar dados carregados
-                with st.expander("Ver Dados Carregados"):
-                    st.dataframe(df)
-
-                # Processar grafo
                 parser = ParserFactory.create_parser(format_type)
-                graph = parser.parse(df)
+
+                def parse_upload():
+                    uploaded_file.seek(0)
+                    if isinstance(parser, BinaryGraphParser):
+                        # Formato binário: arrays mapeados em memória, sem reprocessar texto
+                        return parser.parse_file(uploaded_file)
+
+                    if streaming:
+                        # Processar CSV em blocos, com progresso pela posição no arquivo
+                        load_progress = st.progress(0.0, text="Lendo arquivo em blocos...")
+                        file_size = max(uploaded_file.size, 1)
+
+                        def report_progress(rows):
+                            fraction = min(uploaded_file.tell() / file_size, 1.0)
+                            load_progress.progress(fraction, text=f"{rows} linhas processadas")
+
+                        parsed = parser.parse_stream(uploaded_file, progress=report_progress)
+                        load_progress.empty()
+                        return parsed
+
+                    # Processar CSV
+                    df = pd.read_csv(uploaded_file)
+
+                    # Mostrar dados carregados
+                    with st.expander("Ver Dados Carregados"):
+                        st.dataframe(df)
+
+                    # Processar grafo
+                    return parser.parse_csr(df)
+
+                # Reaproveitar o grafo se o mesmo arquivo já foi processado neste formato
+                # (e pelo mesmo caminho do parser: em blocos os rótulos chegam como texto)
+                csr_graph, from_cache = get_graph_cache().get_or_parse(
+                    uploaded_file.getvalue(), format_type, parse_upload,
+                    variant='stream' if streaming and not is_binary else ''
+                )
+                if from_cache:
+                    st.caption("Grafo recuperado do cache (arquivo já processado anteriormente)")
+                graph = csr_graph.to_networkx()  # Adaptador usado pelo visualizador
 
                 # Resetar layout do visualizador para novo grafo
                 st.session_state.visualizer.reset_layout()
 
-                # Armazenar no estado da sessão
+                # Armazenar no estado da sessão (descartando a reprodução do grafo anterior)
+                st.session_state.trace = None
+                st.session_state.playing = False
                 st.session_state.graph = graph
+                st.session_state.csr_graph = csr_graph
                 st.session_state.algorithm_type = algorithm_type
                 st.session_state.graph_loaded = True
 
                 st.success(f"Grafo carregado: {len(graph.nodes())} nós, {len(graph.edges())} arestas")
 
                 # Verificar se grafo é ponderado
-                edge_weights = nx.get_edge_attributes(graph, 'weight')
-                if edge_weights:
-                    weights = list(edge_weights.values())
-                    all_ones = all(w == 1.0 for w in weights)
+                weights = csr_graph.edge_weight
+                if len(weights):
+                    all_ones = bool((weights == 1.0).all())
                     if not all_ones:
-                        st.info(f"Grafo PONDERADO detectado. Pesos: {min(weights):.2f} a {max(weights):.2f}")
+                        st.info(f"Grafo PONDERADO detectado. Pesos: {weights.min():.2f} a {weights.max():.2f}")
                     else:
                         st.info("Grafo NÃO ponderado (todos os pesos = 1)")
 
@@ -194,6 +299,19 @@ def main():
 
         st.info(f"Grafo carregado: {len(graph.nodes())} nós, {len(graph.edges())} arestas")
 
+        # Exportar no formato binário para recarregar instantaneamente depois
+        # (o arquivo só é montado quando pedido)
+        if not is_binary:
+            with st.expander("Exportar Grafo Binário"):
+                st.caption("Recarregue este arquivo com o formato 'Grafo Binário' para evitar reprocessar o CSV")
+                if st.button("Gerar arquivo binário"):
+                    st.download_button(
+                        "Baixar grafo em formato binário (.zip)",
+                        data=graph_to_archive(st.session_state.csr_graph),
+                        file_name="grafo_binario.zip",
+                        mime="application/zip"
+                    )
+
         # Selecionar nó inicial
         nodes = list(graph.nodes())
         if not nodes:
@@ -201,110 +319,311 @@ def main():
         else:
             start_node = st.selectbox("Selecione o Nó Inicial", nodes)
 
-            # Botão Iniciar Animação
+            # Destino: Dijkstra para ao visitá-lo; bidirecional e A* precisam dele
+            target_node = None
+            if st.session_state.algorithm_type in TARGET_ALGORITHMS:
+                if st.session_state.algorithm_type == "Dijkstra":
+                    target_node = st.selectbox("Nó de Destino (opcional)", [None] + nodes,
+                                               format_func=lambda node: "(nenhum)" if node is None else str(node))
+                else:
+                    target_node = st.selectbox("Nó de Destino", nodes, index=len(nodes) - 1)
+
+            # BFS: um quadro por nível em vez de um por nó
+            level_playback = st.session_state.algorithm_type == "BFS" and st.checkbox(
+                "Animar por nível",
+                help="Cada quadro mostra um nível inteiro da BFS concluído (útil em grafos grandes)"
+            )
+
+            # Exportar a animação completa (quadros renderizados em paralelo)
+            with st.expander("Exportar Animação"):
+                export_format = st.selectbox(
+                    "Formato",
+                    ["GIF", "MP4", "Sequência PNG (.zip)"],
+                    help="MP4 requer o ffmpeg instalado; sem ele, a sequência de PNGs é gerada"
+                )
+                export_fps = st.slider("Quadros por segundo", min_value=1, max_value=30, value=2)
+
+                if st.button("Exportar"):
+                    format_key = {"GIF": GIF, "MP4": MP4}.get(export_format, PNG)
+                    export_progress = st.progress(0.0, text="Renderizando quadros...")
+                    with tempfile.TemporaryDirectory() as export_dir:
+                        result = export_animation(
+                            st.session_state.csr_graph,
+                            st.session_state.algorithm_type,
+                            start_node,
+                            os.path.join(export_dir, "animacao" if format_key == PNG else f"animacao.{format_key}"),
+                            format=format_key,
+                            fps=export_fps,
+                            layout_type=st.session_state.visualizer.layout_type,
+                            progress=lambda done, total: export_progress.progress(
+                                done / total, text=f"{done}/{total} quadros"
+                            ),
+                            target=target_node
+                        )
+                        export_progress.empty()
+
+                        if result.format == PNG:
+                            if format_key == MP4:
+                                st.warning("ffmpeg não encontrado: exportando a sequência de PNGs")
+                            archive = shutil.make_archive(os.path.join(export_dir, "quadros"), 'zip', result.path)
+                            with open(archive, 'rb') as f:
+                                data, file_name, mime = f.read(), "quadros.zip", "application/zip"
+                        else:
+                            with open(result.path, 'rb') as f:
+                                data = f.read()
+                            file_name = os.path.basename(result.path)
+                            mime = "image/gif" if result.format == GIF else "video/mp4"
+
+                    st.download_button(f"Baixar {file_name} ({result.frames} quadros)", data=data, file_name=file_name, mime=mime)
+
+            # Distâncias de todos os nós para todos (processos em paralelo, matriz em disco)
+            with st.expander("Distâncias entre Todos os Pares"):
+                st.caption("Caminhos mínimos a partir de cada nó, calculados em paralelo; a matriz é gravada em disco (.npy)")
+                if st.button("Calcular Distâncias"):
+                    csr_graph = st.session_state.csr_graph
+                    apsp_progress = st.progress(0.0, text="Calculando...")
+                    with tempfile.TemporaryDirectory() as apsp_dir:
+                        matrix_path = os.path.join(apsp_dir, "distancias.npy")
+                        distances = distance_matrix(
+                            csr_graph,
+                            output_path=matrix_path,
+                            progress=lambda done, total: apsp_progress.progress(
+                                done / total, text=f"{done}/{total} origens"
+                            )
+                        )
+                        apsp_progress.empty()
+
+                        # Excentricidade por linha, lida em blocos de linhas do arquivo mapeado
+                        eccentricities, connected = matrix_eccentricity(distances)
+                        labels = csr_graph.labels
+
+                        col_d, col_r, col_c = st.columns(3)
+                        col_d.metric("Diâmetro", f"{eccentricities.max():.2f}")
+                        col_r.metric("Raio", f"{eccentricities.min():.2f}")
+                        col_c.metric("Centro", ", ".join(
+                            str(labels[i]) for i in np.flatnonzero(eccentricities == eccentricities.min())[:5]
+                        ))
+                        if not connected:
+                            st.caption("Grafo desconexo: valores calculados dentro do componente de cada nó")
+
+                        if distances.nbytes <= 200 * 2 ** 20:
+                            with open(matrix_path, 'rb') as f:
+                                st.download_button(
+                                    "Baixar Matriz de Distâncias (.npy)", data=f.read(),
+                                    file_name="distancias.npy", mime="application/octet-stream"
+                                )
+                        del distances
+
+            # Botão Iniciar Animação: calcular o trace completo uma única vez
             if st.button("Iniciar Animação", type="primary"):
-                # Loop de animação
-                st.subheader(f"Executando {st.session_state.algorithm_type} a partir do nó {start_node}")
-                animation_placeholder = st.empty()
-
-                # Criar instância do algoritmo
-                algorithm = AlgorithmFactory.create_algorithm(st.session_state.algorithm_type)
-
-                # Criar barra de progresso
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-
+                algorithm = create_algorithm(st.session_state.algorithm_type, target_node)
+                st.session_state.trace = algorithm.build_trace(st.session_state.csr_graph, start_node)
+                st.session_state.trace_frames = None
+                if level_playback:
+                    # Passo final de cada nível, pela BFS vetorizada
+                    level_offsets = algorithm.run(st.session_state.csr_graph, start_node).level_offsets
+                    st.session_state.trace_frames = (level_offsets[1:] - 1).tolist()
+                st.session_state.trace_start = start_node
+                st.session_state.trace_target = target_node
+                st.session_state.playback_step = 1
+                st.session_state.playing = True
+                st.session_state.scheduler = FrameScheduler()
+
+            trace = st.session_state.trace
+            if (trace is not None and st.session_state.trace_start == start_node
+                    and st.session_state.get('trace_target') == target_node):
+                destination = f" até o nó {target_node}" if target_node is not None else ""
+                st.subheader(f"Executando {st.session_state.algorithm_type} a partir do nó {start_node}{destination}")
+                # Quadros: todos os passos do trace ou, por nível, o último de cada nível
+                frames = st.session_state.get('trace_frames')
+                total_steps = len(frames) if frames is not None else len(trace)
+                step_label = "Nível" if frames is not None else "Passo"
                 total_nodes = len(graph.nodes())
-                step = 0
-
-                for state in algorithm.traverse(graph, start_node):
-                    step += 1
-
-                    # Atualizar status
-                    status_text.text(f"Passo {step}: Visitando nó {state.current}")
-
-                    # Renderizar estado atual
-                    fig = st.session_state.visualizer.render(graph, state)
-                    animation_placeholder.pyplot(fig)
-
-                    # Atualizar progresso
-                    progress = len(state.visited) / total_nodes
-                    progress_bar.progress(progress)
 
-                    # Controlar velocidade
-                    time.sleep(sleep_duration)
+                # Avanço agendado pela reexecução anterior (antes de criar o slider)
+                if 'playback_next' in st.session_state:
+                    st.session_state.playback_step = st.session_state.pop('playback_next')
 
-                    # Limpar figura matplotlib
-                    plt.close(fig)
+                scheduler = st.session_state.scheduler
 
-                # Completar
-                progress_bar.progress(1.0)
-                status_text.text("")
-                st.success(f"Travessia completa! Visitados {len(state.visited)} de {total_nodes} nós.")
+                def toggle_playback():
+                    scheduler.reset()
+                    st.session_state.playing = not st.session_state.playing
+                    if st.session_state.playing and st.session_state.get('playback_step', 1) >= total_steps:
+                        st.session_state.playback_step = 1
 
-                # Mostrar ordem de travessia
-                st.write("**Ordem de Travessia:**", " → ".join(map(str, state.visited)))
-
-                # ====== ESTATÍSTICAS RESUMIDAS ======
-                st.divider()
-                st.subheader("📊 Estatísticas da Travessia")
-
-                # Métricas em colunas
-                col1, col2, col3 = st.columns(3)
-
-                with col1:
-                    st.metric(
-                        "Nós Visitados",
-                        f"{len(state.visited)}/{total_nodes}",
-                        f"{len(state.visited)/total_nodes*100:.1f}%"
+                # Controles: reproduzir/pausar e slider para voltar ou saltar a qualquer passo
+                col_play, col_step = st.columns([1, 5])
+                with col_play:
+                    st.button(
+                        "⏸ Pausar" if st.session_state.playing else "▶ Reproduzir",
+                        on_click=toggle_playback
                     )
+                with col_step:
+                    if total_steps > 1:
+                        st.slider(
+                            step_label, min_value=1, max_value=total_steps, key="playback_step", on_change=scheduler.reset
+                        )
+                step = st.session_state.get('playback_step', 1)
+
+                # Um quadro por reexecução: estado reconstruído a partir do checkpoint mais próximo
+                scheduler.begin_frame()
+                state = trace.state(frames[step - 1] if frames is not None else step - 1)
+                st.text(f"{step_label} {step}/{total_steps}: Visitando nó {state.current}")
+                frame = st.session_state.visualizer.render_frame(graph, state)
+                with timed('streamlit_push'):
+                    st.image(frame, use_column_width=True)
+                st.progress(len(state.visited) / total_nodes)
+
+                if step < total_steps:
+                    if st.session_state.playing:
+                        # Controlar velocidade: pausa só com folga no orçamento do quadro;
+                        # se a renderização atrasar, avançar vários passos de uma vez
+                        stride, pause = scheduler.end_frame(
+                            FrameScheduler.step_time(total_steps, sleep_duration, target_duration)
+                        )
+                        if stride > 1:
+                            st.caption(f"Renderização abaixo do ritmo alvo: {stride} passos por quadro")
+                        time.sleep(pause)
+                        st.session_state.playback_next = min(step + stride, total_steps)
+                        st.rerun()
+                else:
+                    st.session_state.playing = False
+
+                    # Resumo pela execução rápida do algoritmo (só o resultado, sem estados)
+                    result = create_algorithm(st.session_state.algorithm_type, target_node).run(
+                        st.session_state.csr_graph, st.session_state.trace_start
+                    )
+                    visited_count = len(state.visited)
+                    st.success(f"Travessia completa! Visitados {visited_count} de {total_nodes} nós.")
+
+                    # Caminho mínimo até o destino, reconstruído pelos predecessores
+                    if target_node is not None:
+                        if result.path:
+                            st.info(
+                                f"🎯 **Caminho até `{target_node}`:** {' → '.join(map(str, result.path))} "
+                                f"(custo **{result.path_cost:.2f}**)"
+                            )
+                        else:
+                            st.warning(f"Não há caminho de `{start_node}` até `{target_node}`.")
+
+                    # Mostrar ordem de travessia
+                    st.write("**Ordem de Travessia:**", " → ".join(map(str, trace.visited_order)))
+
+                    # ====== ESTATÍSTICAS RESUMIDAS ======
+                    st.divider()
+                    st.subheader("📊 Estatísticas da Travessia")
 
-                with col2:
-                    edges_count = len(state.visited_edges) if state.visited_edges else 0
-                    st.metric("Arestas Percorridas", edges_count)
-
-                with col3:
-                    unvisited_count = total_nodes - len(state.visited)
-                    if unvisited_count > 0:
-                        st.metric("Nós Não Alcançados", unvisited_count, delta_color="inverse")
-                    else:
-                        st.metric("Cobertura", "100%", delta_color="normal")
+                    # Métricas em colunas
+                    col1, col2, col3 = st.columns(3)
 
-                # ====== CUSTO TOTAL (para Dijkstra e MST) ======
-                if st.session_state.algorithm_type in ["Dijkstra", "MST (Prim)"]:
-                    st.divider()
+                    with col1:
+                        st.metric(
+                            "Nós Visitados",
+                            f"{visited_count}/{total_nodes}",
+                            f"{visited_count/total_nodes*100:.1f}%"
+                        )
 
-                    if state.visited_edges:
-                        total_cost = sum(
-                            graph[edge[0]][edge[1]].get('weight', 1.0)
-                            for edge in state.visited_edges
+                    with col2:
+                        edges_count = len(result.tree_edges()[1])
+                        st.metric("Arestas Percorridas", edges_count)
+
+                    with col3:
+                        unvisited_count = total_nodes - visited_count
+                        if unvisited_count > 0:
+                            st.metric("Nós Não Alcançados", unvisited_count, delta_color="inverse")
+                        else:
+                            st.metric("Cobertura", "100%", delta_color="normal")
+
+                    # ====== CUSTO TOTAL (para Dijkstra e MST) ======
+                    if st.session_state.algorithm_type in TARGET_ALGORITHMS + MST_ALGORITHMS:
+                        st.divider()
+
+                        if edges_count:
+                            total_cost = result.total_weight
+
+                            # Com destino, o custo é o do caminho (acima): o peso da árvore
+                            # explorada depende da variante da busca e não é um custo
+                            if st.session_state.algorithm_type in TARGET_ALGORITHMS:
+                                if target_node is None:
+                                    st.info(f"🌲 **Peso da Árvore de Caminhos Explorada:** {total_cost:.2f}")
+                                    st.caption("Soma dos pesos das arestas pelas quais cada nó visitado foi alcançado")
+
+                            elif st.session_state.algorithm_type in MST_ALGORITHMS:
+                                st.success(f"🌳 **Peso Total da MST:** {total_cost:.2f}")
+                                st.caption("Soma dos pesos das arestas na Árvore Geradora Mínima")
+
+                            # Detalhes das arestas (expansível)
+                            with st.expander("Ver Detalhes das Arestas"):
+                                st.write("**Arestas Percorridas:**")
+                                edge_weights = result.edge_weights().tolist()
+                                for i, (edge, weight) in enumerate(zip(result.edge_labels(), edge_weights), 1):
+                                    st.write(f"{i}. `{edge[0]}` ↔ `{edge[1]}` (peso: **{weight:.2f}**)")
+
+                    # ====== ALERTA PARA GRAFOS DESCONECTADOS ======
+                    # Com destino a busca para antes: nós não visitados não indicam desconexão
+                    unvisited_nodes = result.unreachable if target_node is None else []
+                    if unvisited_nodes:
+                        st.divider()
+                        st.warning(
+                            f"⚠️ **Grafo Desconectado!** "
+                            f"Nós não alcançáveis a partir de `{start_node}`: "
+                            f"{', '.join(map(str, sorted(unvisited_nodes)))}"
                         )
+                        st.caption("Estes nós não possuem caminho conectado ao nó inicial escolhido.")
 
-                        if st.session_state.algorithm_type == "Dijkstra":
-                            st.info(f"🎯 **Custo Total do Caminho:** {total_cost:.2f}")
-                            st.caption("Soma dos pesos das arestas no caminho de exploração de Dijkstra")
 
-                        elif st.session_state.algorithm_type == "MST (Prim)":
-                            st.success(f"🌳 **Peso Total da MST:** {total_cost:.2f}")
-                            st.caption("Soma dos pesos das arestas na Árvore Geradora Mínima")
+def render_performance_panel(instrumentation: Instrumentation):
+    with st.expander("⏱ Performance", expanded=False):
+        rows = instrumentation.summary_rows()
+        if not rows:
+            st.info("Nenhuma medida ainda: carregue um grafo ou inicie a animação.")
+        else:
+            st.dataframe(pd.DataFrame(rows).round(3), hide_index=True, use_container_width=True)
+
+            report = instrumentation.report()
+            if report['counters']:
+                st.write("**Contadores:**")
+                st.json(report['counters'])
+
+            # Histograma (baldes log2) da fase escolhida
+            phase = st.selectbox("Histograma da fase", [row['fase'] for row in rows])
+            histogram = report['phases'][phase]['histogram']
+            st.bar_chart(pd.DataFrame(
+                {'chamadas': [bucket['count'] for bucket in histogram]},
+                index=[f"< {bucket['high_seconds'] * 1000:.3g} ms" for bucket in histogram]
+            ))
+
+            if report['profile']:
+                with st.expander("cProfile (acumulado)"):
+                    st.code(report['profile'])
+
+        col_reset, col_export = st.columns(2)
+        with col_reset:
+            st.button("Zerar medidas", on_click=instrumentation.reset)
+        with col_export:
+            st.download_button(
+                "Exportar JSON",
+                data=instrumentation.to_json(),
+                file_name="performance.json",
+                mime="application/json"
+            )
 
-                        # Detalhes das arestas (expansível)
-                        with st.expander("Ver Detalhes das Arestas"):
-                            st.write("**Arestas Percorridas:**")
-                            for i, edge in enumerate(state.visited_edges, 1):
-                                weight = graph[edge[0]][edge[1]].get('weight', 1.0)
-                                st.write(f"{i}. `{edge[0]}` ↔ `{edge[1]}` (peso: **{weight:.2f}**)")
 
-                # ====== ALERTA PARA GRAFOS DESCONECTADOS ======
-                unvisited_nodes = set(graph.nodes()) - set(state.visited)
-                if unvisited_nodes:
-                    st.divider()
-                    st.warning(
-                        f"⚠️ **Grafo Desconectado!** "
-                        f"Nós não alcançáveis a partir de `{start_node}`: "
-                        f"{', '.join(map(str, sorted(unvisited_nodes)))}"
-                    )
-                    st.caption("Estes nós não possuem caminho conectado ao nó inicial escolhido.")
+def main():
+    # Instrumentação da sessão: ativa só quando marcada na barra lateral
+    if 'instrumentation' not in st.session_state:
+        st.session_state.instrumentation = Instrumentation()
+    instrumentation = st.session_state.instrumentation
+    enabled = st.session_state.get('perf_enabled', False)
+    profile = enabled and st.session_state.get('perf_profile', False)
+
+    with use_instrumentation(instrumentation if enabled else None):
+        with instrumentation.profiling(profile):
+            render_app()
+
+    if enabled:
+        render_performance_panel(instrumentation)
 
 
 if __name__ == "__main__":
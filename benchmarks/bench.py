@@ -0,0 +1,241 @@
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import numpy as np
+import pandas as pd
+from benchmarks.graphs import GENERATORS, generate, write_formats
+from src.algorithms import AlgorithmFactory
+from src.models.csr_graph import CSRGraph
+from src.parsers import ParserFactory
+from src.visualization.graph_visualizer import GraphVisualizer
+
+# Harness de benchmarks: parsers, algoritmos e renderização em grafos sintéticos.
+#   python -m benchmarks.bench --output resultados.json
+#   python -m benchmarks.bench --output novo.json --compare resultados.json
+
+DEFAULT_EDGES = [100, 1_000, 10_000, 100_000, 1_000_000]
+ALGORITHMS = ["BFS", "DFS", "Dijkstra", "MST (Prim)", "MST (Kruskal)", "MST (Borůvka)"]
+
+# traverse() monta um GraphState completo por passo (O(V²) no total):
+# acima deste tamanho só o build_trace() é medido
+DEFAULT_MAX_TRAVERSE_NODES = 20_000
+# Renderizar grafos grandes com matplotlib não é um cenário realista
+DEFAULT_MAX_RENDER_NODES = 2_000
+DEFAULT_RENDER_FRAMES = 20
+
+
+def measure(function: Callable[[], Any], repeat: int, memory: bool) -> Dict[str, Any]:
+    # Menor tempo entre `repeat` execuções; pico de memória (tracemalloc) numa execução à parte
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - started)
+
+    result = {'seconds': min(times), 'mean_seconds': sum(times) / len(times)}
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            function()
+            result['peak_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def _parse_dataframe(format_type: str, path: str) -> Callable[[], Any]:
+    parser = ParserFactory.create_parser(format_type)
+    return lambda: parser.parse_csr(pd.read_csv(path))
+
+
+def _parse_stream(format_type: str, path: str) -> Callable[[], Any]:
+    parser = ParserFactory.create_parser(format_type)
+    return lambda: parser.parse_stream(path)
+
+
+def _traverse(csr: CSRGraph, algorithm_type: str, start) -> Callable[[], Any]:
+    def run():
+        for _ in AlgorithmFactory.create_algorithm(algorithm_type).traverse(csr, start):
+            pass
+    return run
+
+
+def _build_trace(csr: CSRGraph, algorithm_type: str, start) -> Callable[[], Any]:
+    return lambda: AlgorithmFactory.create_algorithm(algorithm_type).build_trace(csr, start)
+
+
+def _render(csr: CSRGraph, states: List, frames: int) -> Callable[[], Any]:
+    graph = csr.to_networkx()
+
+    def run():
+        visualizer = GraphVisualizer()
+        visualizer.render_frame(graph, states[0])  # Figura, artistas e layout
+        for state in states[1:frames + 1]:
+            visualizer.render_frame(graph, state)
+    return run
+
+
+def run_benchmarks(args) -> Dict[str, Any]:
+    results = []
+
+    def record(graph, benchmark: str, measured: Dict[str, Any], **extra):
+        entry = {
+            'graph': graph.name, 'kind': graph.kind, 'nodes': graph.num_nodes, 'edges': graph.num_edges,
+            'benchmark': benchmark, **measured, **extra
+        }
+        results.append(entry)
+        peak = f" pico {entry['peak_bytes'] / 2 ** 20:8.1f} MB" if 'peak_bytes' in entry else ''
+        print(f"{graph.name:28s} {benchmark:36s} {entry['seconds'] * 1000:10.2f} ms{peak}", file=sys.stderr)
+
+    with tempfile.TemporaryDirectory(prefix='graph_bench_') as directory:
+        for num_edges in args.edges:
+            for kind in args.kinds:
+                graph = generate(kind, num_edges)
+                files = write_formats(graph, directory)
+
+                # Parsers: leitura completa (como o app) e em blocos
+                for format_type, path in files.items():
+                    record(
+                        graph, f"parse:{format_type}",
+                        measure(_parse_dataframe(format_type, path), args.repeat, args.memory)
+                    )
+                    record(
+                        graph, f"parse_stream:{format_type}",
+                        measure(_parse_stream(format_type, path), args.repeat, args.memory)
+                    )
+
+                labels = graph.labels()
+                csr = CSRGraph.from_edges(labels[graph.sources], labels[graph.targets], graph.weights)
+                start = csr.labels[0]
+
+                for algorithm_type in ALGORITHMS:
+                    record(
+                        graph, f"build_trace:{algorithm_type}",
+                        measure(_build_trace(csr, algorithm_type, start), args.repeat, args.memory)
+                    )
+                    if graph.num_nodes <= args.max_traverse_nodes:
+                        record(
+                            graph, f"traverse:{algorithm_type}",
+                            measure(_traverse(csr, algorithm_type, start), args.repeat, args.memory)
+                        )
+
+                # Renderização: primeiro quadro (layout + cena) e custo médio por quadro seguinte
+                if graph.num_nodes <= args.max_render_nodes:
+                    trace = AlgorithmFactory.create_algorithm("BFS").build_trace(csr, start)
+                    states = list(trace.states(0, args.render_frames + 1))
+                    frames = len(states) - 1
+                    first = measure(_render(csr, states, 0), 1, args.memory)
+                    record(graph, "render:first_frame", first)
+                    if frames:
+                        total = measure(_render(csr, states, frames), 1, False)
+                        per_frame = max(total['seconds'] - first['seconds'], 0.0) / frames
+                        record(
+                            graph, "render:per_frame",
+                            {'seconds': per_frame, 'mean_seconds': per_frame}, frames=frames
+                        )
+
+    return {'meta': _metadata(args), 'results': results}
+
+
+def _metadata(args) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'repeat': args.repeat
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float,
+            min_seconds: float = 0.0) -> List[Dict[str, Any]]:
+    # Razão tempo atual / tempo da baseline para cada (grafo, benchmark) presente nas duas.
+    # Medidas abaixo de min_seconds nas duas execuções são ruído e não contam como regressão.
+    previous = {(r['graph'], r['benchmark']): r for r in baseline['results']}
+    rows = []
+    for result in current['results']:
+        old = previous.get((result['graph'], result['benchmark']))
+        if old is None or old['seconds'] <= 0:
+            continue
+        ratio = result['seconds'] / old['seconds']
+        rows.append({
+            'graph': result['graph'],
+            'benchmark': result['benchmark'],
+            'baseline_seconds': old['seconds'],
+            'seconds': result['seconds'],
+            'ratio': ratio,
+            'regression': ratio > threshold and max(result['seconds'], old['seconds']) >= min_seconds
+        })
+    return rows
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks.bench',
+        description="Mede parsers, algoritmos e renderização em grafos sintéticos."
+    )
+    parser.add_argument('--edges', type=lambda v: int(float(v)), nargs='+', default=DEFAULT_EDGES,
+                        help="Tamanhos (número de arestas), ex.: --edges 1e2 1e4")
+    parser.add_argument('--kinds', nargs='+', choices=sorted(GENERATORS), default=list(GENERATORS),
+                        help="Tipos de grafo sintético")
+    parser.add_argument('--repeat', type=int, default=3, help="Execuções por medida (vale a menor)")
+    parser.add_argument('--no-memory', dest='memory', action='store_false', help="Não medir o pico de memória")
+    parser.add_argument('--max-traverse-nodes', type=int, default=DEFAULT_MAX_TRAVERSE_NODES)
+    parser.add_argument('--max-render-nodes', type=int, default=DEFAULT_MAX_RENDER_NODES)
+    parser.add_argument('--render-frames', type=int, default=DEFAULT_RENDER_FRAMES)
+    parser.add_argument('-o', '--output', default='benchmark_results.json', help="Arquivo JSON de resultados")
+    parser.add_argument('--compare', metavar='BASELINE', help="JSON de uma execução anterior para comparar")
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help="Razão de tempo acima da qual uma medida conta como regressão")
+    parser.add_argument('--min-seconds', type=float, default=0.005,
+                        help="Medidas mais rápidas que isso (nas duas execuções) não contam como regressão")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+    report = run_benchmarks(args)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare(report, baseline, args.threshold, args.min_seconds)
+        report['comparison'] = {'baseline': args.compare, 'threshold': args.threshold, 'rows': rows}
+
+        regressions = [row for row in rows if row['regression']]
+        for row in sorted(rows, key=lambda r: -r['ratio']):
+            flag = 'REGRESSÃO' if row['regression'] else ''
+            print(f"{row['graph']:28s} {row['benchmark']:36s} {row['ratio']:6.2f}x {flag}", file=sys.stderr)
+        print(
+            f"{len(regressions)} regressões acima de {args.threshold:.2f}x em {len(rows)} medidas",
+            file=sys.stderr
+        )
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if args.compare and any(row['regression'] for row in report['comparison']['rows']):
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
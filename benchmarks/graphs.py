@@ -0,0 +1,164 @@
+import csv
+import math
+import os
+from dataclasses import dataclass
+from typing import Callable, Dict
+import numpy as np
+import pandas as pd
+
+# Grafos sintéticos para os benchmarks, gerados direto em arrays NumPy
+# (o gerador não deve dominar o tempo nos tamanhos grandes)
+
+SEED = 42
+
+# Limites para escrever os formatos que crescem com V² (matriz) ou com o grau máximo (lista)
+MAX_MATRIX_NODES = 2000
+MAX_LIST_DEGREE = 256
+
+
+@dataclass
+class SyntheticGraph:
+    kind: str
+    num_nodes: int
+    sources: np.ndarray
+    targets: np.ndarray
+    weights: np.ndarray
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.sources)
+
+    @property
+    def name(self) -> str:
+        return f"{self.kind}-{self.num_edges}"
+
+    def labels(self) -> np.ndarray:
+        return np.array([f"v{i}" for i in range(self.num_nodes)], dtype=object)
+
+    def max_degree(self) -> int:
+        degree = (
+            np.bincount(self.sources, minlength=self.num_nodes)
+            + np.bincount(self.targets, minlength=self.num_nodes)
+        )
+        return int(degree.max()) if self.num_nodes else 0
+
+
+def _weights(rng: np.random.Generator, m: int) -> np.ndarray:
+    return np.round(rng.uniform(1.0, 10.0, m), 2)
+
+
+def path_graph(m: int, rng: np.random.Generator) -> SyntheticGraph:
+    src = np.arange(m, dtype=np.int64)
+    return SyntheticGraph('path', m + 1, src, src + 1, _weights(rng, m))
+
+
+def grid_graph(m: int, rng: np.random.Generator) -> SyntheticGraph:
+    # Grade s x s com 2·s·(s-1) ≈ m arestas
+    side = max(2, math.ceil((1 + math.sqrt(1 + 2 * m)) / 2))
+    ids = np.arange(side * side, dtype=np.int64).reshape(side, side)
+    src = np.concatenate([ids[:, :-1].ravel(), ids[:-1, :].ravel()])
+    dst = np.concatenate([ids[:, 1:].ravel(), ids[1:, :].ravel()])
+    return SyntheticGraph('grid', side * side, src, dst, _weights(rng, len(src)))
+
+
+def erdos_renyi_graph(m: int, rng: np.random.Generator) -> SyntheticGraph:
+    # G(n, m) com grau médio 8: pares aleatórios sem laços nem repetições
+    n = max(10, m // 4)
+    src = rng.integers(0, n, int(m * 1.2) + 10)
+    dst = rng.integers(0, n, len(src))
+    keep = src != dst
+    src, dst = src[keep], dst[keep]
+    key = np.minimum(src, dst) * n + np.maximum(src, dst)
+    _, first = np.unique(key, return_index=True)
+    first = np.sort(first)[:m]
+    return SyntheticGraph('erdos_renyi', n, src[first], dst[first], _weights(rng, len(first)))
+
+
+def barabasi_albert_graph(m: int, rng: np.random.Generator, attach: int = 3) -> SyntheticGraph:
+    # Ligação preferencial: cada novo nó escolhe `attach` vizinhos proporcionalmente ao grau
+    n = max(attach + 1, m // attach + 1)
+    src = []
+    dst = []
+    repeated = list(range(attach))
+    for node in range(attach, n):
+        picks = set()
+        while len(picks) < attach:
+            picks.update(repeated[i] for i in rng.integers(0, len(repeated), attach - len(picks)))
+        for target in picks:
+            src.append(node)
+            dst.append(target)
+        repeated.extend(picks)
+        repeated.extend([node] * attach)
+    src = np.array(src[:m], dtype=np.int64)
+    dst = np.array(dst[:m], dtype=np.int64)
+    return SyntheticGraph('barabasi_albert', n, src, dst, _weights(rng, len(src)))
+
+
+def dense_graph(m: int, rng: np.random.Generator) -> SyntheticGraph:
+    # Grafo completo com n·(n-1)/2 ≈ m arestas (caso típico da matriz de adjacência)
+    n = max(2, round((1 + math.sqrt(1 + 8 * m)) / 2))
+    src, dst = np.triu_indices(n, k=1)
+    return SyntheticGraph('dense', n, src.astype(np.int64), dst.astype(np.int64), _weights(rng, len(src)))
+
+
+GENERATORS: Dict[str, Callable[[int, np.random.Generator], SyntheticGraph]] = {
+    'path': path_graph,
+    'grid': grid_graph,
+    'erdos_renyi': erdos_renyi_graph,
+    'barabasi_albert': barabasi_albert_graph,
+    'dense': dense_graph
+}
+
+
+def generate(kind: str, num_edges: int) -> SyntheticGraph:
+    return GENERATORS[kind](num_edges, np.random.default_rng(SEED))
+
+
+# ====== Arquivos CSV nos formatos do app ======
+
+def write_edge_list(graph: SyntheticGraph, path: str) -> str:
+    labels = graph.labels()
+    pd.DataFrame({
+        'origem': labels[graph.sources],
+        'destino': labels[graph.targets],
+        'peso': graph.weights
+    }).to_csv(path, index=False)
+    return path
+
+
+def write_adjacency_matrix(graph: SyntheticGraph, path: str) -> str:
+    labels = graph.labels()
+    matrix = np.zeros((graph.num_nodes, graph.num_nodes))
+    matrix[graph.sources, graph.targets] = graph.weights
+    matrix[graph.targets, graph.sources] = graph.weights
+    pd.DataFrame(matrix, index=labels, columns=labels).to_csv(path)
+    return path
+
+
+def write_adjacency_list(graph: SyntheticGraph, path: str) -> str:
+    labels = graph.labels()
+    rows = [[label] for label in labels]
+    for u, v, w in zip(graph.sources.tolist(), graph.targets.tolist(), graph.weights.tolist()):
+        rows[u].extend((labels[v], w))
+        rows[v].extend((labels[u], w))
+
+    width = max(len(row) for row in rows)
+    header = ['nó'] + [f"{name}{i}" for i in range(1, (width - 1) // 2 + 1) for name in ('vizinho', 'peso')]
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for row in rows:
+            writer.writerow(row + [''] * (width - len(row)))
+    return path
+
+
+def write_formats(graph: SyntheticGraph, directory: str) -> Dict[str, str]:
+    # Arquivo de cada formato suportado pelo tamanho do grafo (formato do app -> caminho)
+    files = {"Lista de Arestas": write_edge_list(graph, os.path.join(directory, f"{graph.name}_arestas.csv"))}
+    if graph.num_nodes <= MAX_MATRIX_NODES:
+        path = os.path.join(directory, f"{graph.name}_matriz.csv")
+        files["Matriz de Adjacência"] = write_adjacency_matrix(graph, path)
+    if graph.max_degree() <= MAX_LIST_DEGREE:
+        path = os.path.join(directory, f"{graph.name}_lista.csv")
+        files["Lista de Adjacência"] = write_adjacency_list(graph, path)
+    return files
@@ -1,22 +1,36 @@
 from .bfs import BFSAlgorithm
 from .dfs import DFSAlgorithm
 from .dijkstra import DijkstraAlgorithm
+from .bidirectional_dijkstra import BidirectionalDijkstraAlgorithm
+from .astar import AStarAlgorithm, EuclideanHeuristic
 from .mst_prim import PrimMSTAlgorithm
+from .mst_kruskal import KruskalMSTAlgorithm
+from .mst_boruvka import BoruvkaMSTAlgorithm
+from .all_pairs import distance_matrix, eccentricity, matrix_eccentricity
 
 
 class AlgorithmFactory:
 
     @staticmethod
-    def create_algorithm(algo_type: str):
+    def create_algorithm(algo_type: str, target=None, heuristic=None):
+        # target: nó de destino (caminho mínimo ponto a ponto); heuristic: estimativa do A*
         algorithms = {
             "BFS": BFSAlgorithm(),
             "DFS": DFSAlgorithm(),
-            "Dijkstra": DijkstraAlgorithm(),
-            "MST (Prim)": PrimMSTAlgorithm()
+            "Dijkstra": DijkstraAlgorithm(target),
+            "Dijkstra (bidirecional)": BidirectionalDijkstraAlgorithm(target),
+            "A*": AStarAlgorithm(target, heuristic),
+            "MST (Prim)": PrimMSTAlgorithm(),
+            "MST (Kruskal)": KruskalMSTAlgorithm(),
+            "MST (Borůvka)": BoruvkaMSTAlgorithm()
         }
         if algo_type not in algorithms:
             raise ValueError(f"Algoritmo desconhecido: {algo_type}")
         return algorithms[algo_type]
 
 
-__all__ = ['AlgorithmFactory', 'BFSAlgorithm', 'DFSAlgorithm', 'DijkstraAlgorithm', 'PrimMSTAlgorithm']
+__all__ = [
+    'AlgorithmFactory', 'BFSAlgorithm', 'DFSAlgorithm', 'DijkstraAlgorithm', 'BidirectionalDijkstraAlgorithm',
+    'AStarAlgorithm', 'EuclideanHeuristic', 'PrimMSTAlgorithm', 'KruskalMSTAlgorithm',
+    'BoruvkaMSTAlgorithm', 'distance_matrix', 'eccentricity', 'matrix_eccentricity'
+]
@@ -0,0 +1,251 @@
+import heapq
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from src.models.csr_graph import CSRGraph
+
+# Caminhos mínimos a partir de muitas origens (até todos os pares).
+# Os arrays de adjacência ficam em memória compartilhada, lidos sem cópia por
+# todos os processos; cada processo calcula blocos de linhas (origens) e os
+# grava direto numa matriz .npy mapeada em memória, que pode ser maior que a RAM.
+
+# Memória alvo de um bloco de linhas por processo
+DEFAULT_TILE_BYTES = 64 * 2 ** 20
+
+# Blocos por processo: mais blocos que processos equilibram a carga
+TILES_PER_WORKER = 4
+
+
+class SharedGraph:
+    # Offsets, vizinhos e pesos do CSR copiados uma vez para blocos de shared_memory.
+    # `spec` descreve os blocos para que outros processos os abram pelo nome.
+
+    FIELDS = ('offsets', 'neighbors', 'weights')
+
+    def __init__(self, graph: CSRGraph):
+        self.num_nodes = graph.num_nodes
+        self._blocks: List[shared_memory.SharedMemory] = []
+        self.spec: Dict[str, Tuple[str, Tuple[int, ...], str]] = {}
+        # Offsets e vizinhos com o mesmo tipo inteiro: a matriz esparsa do scipy
+        # usa os blocos sem converter (e sem copiar) em cada processo
+        index_dtype = np.int32 if len(graph.neighbors) < 2 ** 31 and graph.num_nodes < 2 ** 31 else np.int64
+        dtypes = {'offsets': index_dtype, 'neighbors': index_dtype, 'weights': np.float64}
+        try:
+            for name in self.FIELDS:
+                array = np.ascontiguousarray(getattr(graph, name), dtype=dtypes[name])
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                self.spec[name] = (block.name, array.shape, array.dtype.str)
+        except BaseException:
+            self.close()
+            raise
+
+    @staticmethod
+    def attach(spec: Dict[str, Tuple[str, Tuple[int, ...], str]]):
+        # Abrir os blocos num processo trabalhador: (blocos, {campo: array sem cópia})
+        blocks = []
+        arrays = {}
+        for name, (block_name, shape, dtype) in spec.items():
+            block = shared_memory.SharedMemory(name=block_name)
+            blocks.append(block)
+            arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+        return blocks, arrays
+
+    def close(self) -> None:
+        # Liberar os blocos (apenas o processo que os criou)
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self) -> 'SharedGraph':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ====== Núcleos de cálculo ======
+
+def _scipy_kernel(arrays: Dict[str, np.ndarray], num_nodes: int) -> Optional[Callable]:
+    # Dijkstra do scipy (em C) sobre uma matriz esparsa que aponta para a memória
+    # compartilhada; None se o scipy não estiver instalado
+    try:
+        from scipy import sparse
+        from scipy.sparse.csgraph import dijkstra
+    except ImportError:
+        return None
+
+    matrix = sparse.csr_matrix(
+        (arrays['weights'], arrays['neighbors'], arrays['offsets']),
+        shape=(num_nodes, num_nodes),
+        copy=False
+    )
+    return lambda sources: dijkstra(matrix, directed=True, indices=sources)
+
+
+def _python_kernel(arrays: Dict[str, np.ndarray], num_nodes: int) -> Callable:
+    # Dijkstra com heap em laço Python (listas convertidas uma vez por processo)
+    offsets = arrays['offsets'].tolist()
+    neighbors = arrays['neighbors'].tolist()
+    weights = arrays['weights'].tolist()
+    heappush, heappop = heapq.heappush, heapq.heappop
+
+    def single(source: int) -> List[float]:
+        distances = [float('inf')] * num_nodes
+        distances[source] = 0.0
+        visited = bytearray(num_nodes)
+        pq = [(0.0, source)]
+        while pq:
+            current_dist, current = heappop(pq)
+            if visited[current]:
+                continue
+            visited[current] = 1
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[i]
+                new_dist = current_dist + weights[i]
+                if new_dist < distances[neighbor]:
+                    distances[neighbor] = new_dist
+                    heappush(pq, (new_dist, neighbor))
+        return distances
+
+    return lambda sources: np.array([single(source) for source in sources], dtype=np.float64)
+
+
+# ====== Processos trabalhadores ======
+
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(spec: Dict, num_nodes: int, sources: np.ndarray, output_path: Optional[str]) -> None:
+    blocks, arrays = SharedGraph.attach(spec)
+    _worker['blocks'] = blocks  # Manter os blocos abertos enquanto o processo viver
+    _worker['sources'] = sources
+    _worker['kernel'] = _scipy_kernel(arrays, num_nodes) or _python_kernel(arrays, num_nodes)
+    _worker['output'] = None if output_path is None else np.load(output_path, mmap_mode='r+')
+
+
+def _solve_tile(start: int, stop: int) -> Tuple[int, int, np.ndarray]:
+    # Linhas [start, stop) da matriz; devolve a excentricidade de cada origem
+    # (maior distância finita: dentro do componente da origem)
+    distances = _worker['kernel'](_worker['sources'][start:stop])
+    output = _worker['output']
+    if output is not None:
+        output[start:stop] = distances
+        output.flush()
+    return start, stop, _row_eccentricity(distances)
+
+
+def _row_eccentricity(distances: np.ndarray) -> np.ndarray:
+    # Maior distância finita de cada linha (0 se a origem não alcança ninguém)
+    finite = np.where(np.isinf(distances), -np.inf, distances)
+    return finite.max(axis=1, initial=0.0)
+
+
+def _tiles(rows: int, tile_rows: int) -> List[Tuple[int, int]]:
+    return [(start, min(start + tile_rows, rows)) for start in range(0, rows, tile_rows)]
+
+
+def _run(
+    graph: CSRGraph,
+    sources: np.ndarray,
+    output_path: Optional[str],
+    workers: Optional[int],
+    tile_rows: Optional[int],
+    progress: Optional[Callable[[int, int], None]]
+) -> np.ndarray:
+    rows = len(sources)
+    workers = workers or os.cpu_count() or 1
+    if tile_rows is None:
+        # Blocos limitados pela memória alvo e pequenos o bastante para dividir a carga
+        by_memory = max(1, DEFAULT_TILE_BYTES // max(graph.num_nodes * 8, 1))
+        tile_rows = max(1, min(by_memory, -(-rows // (workers * TILES_PER_WORKER))))
+
+    eccentricity = np.zeros(rows)
+    done = 0
+    with SharedGraph(graph) as shared:
+        initargs = (shared.spec, graph.num_nodes, sources, output_path)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+            futures = [pool.submit(_solve_tile, start, stop) for start, stop in _tiles(rows, max(1, tile_rows))]
+            for future in as_completed(futures):
+                start, stop, tile_eccentricity = future.result()
+                eccentricity[start:stop] = tile_eccentricity
+                done += stop - start
+                if progress is not None:
+                    progress(done, rows)
+    return eccentricity
+
+
+def _source_ids(graph: CSRGraph, sources: Optional[Sequence[Any]]) -> np.ndarray:
+    if sources is None:
+        return np.arange(graph.num_nodes, dtype=np.int64)
+    ids = []
+    for node in sources:
+        node_id = graph.index.get(node)
+        if node_id is None:
+            raise ValueError(f"Nó de origem '{node}' não encontrado no grafo")
+        ids.append(node_id)
+    return np.array(ids, dtype=np.int64)
+
+
+def distance_matrix(
+    graph,
+    sources: Optional[Sequence[Any]] = None,
+    output_path: Optional[str] = None,
+    workers: Optional[int] = None,
+    tile_rows: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> np.memmap:
+    # Matriz (origens x nós) de distâncias mínimas, gravada em `output_path`
+    # (.npy; padrão: arquivo temporário) e devolvida mapeada em memória.
+    # Linha i = origem sources[i] (padrão: todos os nós, na ordem dos rótulos).
+    # Nós inalcançáveis ficam com inf.
+    csr = CSRGraph.of(graph)
+    ids = _source_ids(csr, sources)
+    if output_path is None:
+        handle, output_path = tempfile.mkstemp(prefix='distances_', suffix='.npy')
+        os.close(handle)
+
+    matrix = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float64, shape=(len(ids), csr.num_nodes))
+    del matrix  # Os processos gravam pelo próprio mapeamento
+    if len(ids) and csr.num_nodes:
+        _run(csr, ids, output_path, workers, tile_rows, progress)
+    return np.load(output_path, mmap_mode='r')
+
+
+def eccentricity(
+    graph,
+    sources: Optional[Sequence[Any]] = None,
+    workers: Optional[int] = None,
+    tile_rows: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> Dict[Any, float]:
+    # Excentricidade de cada origem sem guardar a matriz: maior distância mínima
+    # até um nó alcançável (em grafos desconexos, dentro do componente da origem)
+    csr = CSRGraph.of(graph)
+    ids = _source_ids(csr, sources)
+    if not len(ids):
+        return {}
+    values = _run(csr, ids, None, workers, tile_rows, progress)
+    labels = csr.labels
+    return {labels[i]: float(value) for i, value in zip(ids.tolist(), values.tolist())}
+
+
+def matrix_eccentricity(distances: np.ndarray, tile_rows: Optional[int] = None) -> Tuple[np.ndarray, bool]:
+    # Excentricidade de cada linha de uma matriz já calculada (ex.: a devolvida
+    # por distance_matrix, mapeada em memória) e se todos os pares se alcançam.
+    # Lida em blocos de linhas: a memória usada não depende do número de origens.
+    rows, columns = distances.shape
+    if tile_rows is None:
+        tile_rows = max(1, DEFAULT_TILE_BYTES // max(columns * 8, 1))
+    values = np.zeros(rows)
+    connected = True
+    for start, stop in _tiles(rows, max(1, tile_rows)):
+        block = np.asarray(distances[start:stop])
+        values[start:stop] = _row_eccentricity(block)
+        connected = connected and not np.isinf(block).any()
+    return values, connected
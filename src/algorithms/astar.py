@@ -0,0 +1,109 @@
+import heapq
+from typing import Any, Callable, Generator, Mapping, Optional, Union
+import numpy as np
+from .dijkstra import DijkstraAlgorithm
+from src.models.csr_graph import CSRGraph
+from src.models.traversal_trace import TraversalTrace
+from src.models.traversal_result import ShortestPathResult
+
+# Heurística: recebe o grafo e o id do destino e devolve uma estimativa
+# (limite inferior) da distância de cada nó até o destino
+Heuristic = Callable[[CSRGraph, int], np.ndarray]
+
+
+class EuclideanHeuristic:
+    # Distância euclidiana entre as posições do layout, escalada pelo menor
+    # peso/comprimento entre as arestas do grafo: assim nunca superestima o
+    # custo restante (heurística consistente) e o A* continua exato.
+
+    def __init__(self, positions: Union[np.ndarray, Mapping[Any, Any]]):
+        # Array (n, 2) na ordem dos ids do grafo ou dicionário rótulo -> (x, y)
+        self.positions = positions
+
+    def _coordinates(self, graph: CSRGraph) -> np.ndarray:
+        if isinstance(self.positions, Mapping):
+            return np.array([self.positions[label] for label in graph.labels], dtype=np.float64)
+        coordinates = np.asarray(self.positions, dtype=np.float64)
+        if coordinates.shape != (graph.num_nodes, 2):
+            raise ValueError("Posições do layout não correspondem aos nós do grafo")
+        return coordinates
+
+    def __call__(self, graph: CSRGraph, target: int) -> np.ndarray:
+        coordinates = self._coordinates(graph)
+        lengths = np.hypot(*(coordinates[graph.edge_src] - coordinates[graph.edge_dst]).T)
+        drawn = lengths > 0
+        if not drawn.any():
+            return np.zeros(graph.num_nodes)
+        scale = max(float(np.min(np.asarray(graph.edge_weight, dtype=np.float64)[drawn] / lengths[drawn])), 0.0)
+        return scale * np.hypot(*(coordinates - coordinates[target]).T)
+
+
+class AStarAlgorithm(DijkstraAlgorithm):
+    # Busca A*: Dijkstra guiado por uma estimativa da distância até o destino.
+    # A fila é ordenada por g + h (a prioridade exibida é essa soma).
+
+    def __init__(self, target: Any = None, heuristic: Optional[Heuristic] = None):
+        super().__init__(target)
+        self.heuristic = heuristic
+
+    def _estimates(self, graph: CSRGraph, target: int):
+        if self.heuristic is None:
+            return [0.0] * graph.num_nodes  # Sem heurística: Dijkstra com parada no destino
+        return np.asarray(self.heuristic(graph, target), dtype=np.float64).tolist()
+
+    def _search(self, graph: CSRGraph, start: int, trace: Optional[TraversalTrace], order: list,
+                previous: list, distances: list) -> Generator[None, None, None]:
+        offsets, neighbors, weights = graph.adjacency_lists()
+        rank = graph.rank
+        target = self._target_id(graph)
+        if target is None:
+            raise ValueError("O A* precisa de um nó de destino")
+        estimate = self._estimates(graph, target)
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        distances[start] = 0
+        visited = bytearray(graph.num_nodes)
+
+        # Fila de prioridade: (g + h, rank do nó, nó)
+        pq = [(estimate[start], rank[start], start)]
+        if trace is not None:
+            trace.push(start, estimate[start])
+
+        while pq:
+            _, _, current = heappop(pq)
+            if trace is not None:
+                trace.pop()
+            if visited[current]:
+                continue
+
+            visited[current] = 1
+            order.append(current)
+            if trace is not None:
+                trace.step(current, previous[current])
+                yield
+            if current == target:
+                return
+
+            current_dist = distances[current]
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[i]
+                if not visited[neighbor]:
+                    new_dist = current_dist + weights[i]
+                    if new_dist < distances[neighbor]:
+                        distances[neighbor] = new_dist
+                        previous[neighbor] = current
+                        priority = new_dist + estimate[neighbor]
+                        heappush(pq, (priority, rank[neighbor], neighbor))
+                        if trace is not None:
+                            trace.push(neighbor, priority)
+
+    def record(self, graph: CSRGraph, start: int, trace: TraversalTrace) -> Generator[None, None, None]:
+        n = graph.num_nodes
+        yield from self._search(graph, start, trace, [], [-1] * n, [float('inf')] * n)
+
+    def solve(self, graph: CSRGraph, start: int) -> ShortestPathResult:
+        n = graph.num_nodes
+        order, previous, distances = [], [-1] * n, [float('inf')] * n
+        for _ in self._search(graph, start, None, order, previous, distances):
+            pass
+        return ShortestPathResult.settled(graph, start, order, previous, distances, self._target_id(graph))
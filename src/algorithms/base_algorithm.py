@@ -1,11 +1,58 @@
 from abc import ABC, abstractmethod
-from typing import Generator
+from typing import Generator, Union
 import networkx as nx
+from src.models.csr_graph import CSRGraph
 from src.models.graph_state import GraphState
+from src.models.traversal_trace import TraversalTrace, FIFO, PRIORITY
+from src.models.traversal_result import TraversalResult
+from src.instrumentation import instrumented, count
 
 
 class BaseAlgorithm(ABC):
 
+    # Tipo de fronteira usado para reconstruir a fila/pilha de cada passo
+    frontier_kind = FIFO
+
     @abstractmethod
-    def traverse(self, graph: nx.Graph, start_node) -> Generator[GraphState, None, None]:
+    def record(self, graph: CSRGraph, start: int, trace: TraversalTrace) -> Generator[None, None, None]:
+        # Executar o algoritmo sobre ids inteiros, gravando os deltas no trace (um yield por passo)
         pass
+
+    @abstractmethod
+    def solve(self, graph: CSRGraph, start: int) -> TraversalResult:
+        # Mesmo algoritmo de record(), em laço direto: só o resultado final, sem trace
+        pass
+
+    def _prepare(self, graph: Union[nx.Graph, CSRGraph], start_node):
+        csr = CSRGraph.of(graph)
+        order_key = csr.rank if self.frontier_kind == PRIORITY else None
+        trace = TraversalTrace(graph, csr.labels, self.frontier_kind, order_key)
+        return csr, trace
+
+    def _start_id(self, csr: CSRGraph, start_node) -> int:
+        start = csr.index.get(start_node)
+        if start is None:
+            raise ValueError(f"Nó inicial '{start_node}' não encontrado no grafo")
+        return start
+
+    def _recording(self, csr: CSRGraph, start_node, trace: TraversalTrace) -> Generator[None, None, None]:
+        yield from self.record(csr, self._start_id(csr, start_node), trace)
+
+    def traverse(self, graph: Union[nx.Graph, CSRGraph], start_node) -> Generator[GraphState, None, None]:
+        csr, trace = self._prepare(graph, start_node)
+        return trace.follow(self._recording(csr, start_node, trace))
+
+    @instrumented('build_trace')
+    def build_trace(self, graph: Union[nx.Graph, CSRGraph], start_node) -> TraversalTrace:
+        # Executar a travessia completa sem materializar os estados intermediários
+        csr, trace = self._prepare(graph, start_node)
+        for _ in self._recording(csr, start_node, trace):
+            pass
+        count('trace_steps', len(trace))
+        return trace
+
+    @instrumented('run')
+    def run(self, graph: Union[nx.Graph, CSRGraph], start_node) -> TraversalResult:
+        # Execução rápida: mesma ordem de visita da travessia, sem estados nem trace
+        csr = CSRGraph.of(graph)
+        return self.solve(csr, self._start_id(csr, start_node))
@@ -1,52 +1,227 @@
 from collections import deque
-from typing import Generator
+from typing import Generator, Tuple, Union
 import networkx as nx
+import numpy as np
 from .base_algorithm import BaseAlgorithm
+from src.models.csr_graph import CSRGraph
 from src.models.graph_state import GraphState
+from src.models.traversal_result import BFSResult
+from src.models.traversal_trace import TraversalTrace, FIFO
+
+# A partir deste número de nós, run() expande a BFS um nível inteiro por vez
+# com operações vetorizadas; abaixo disso o laço Python é mais rápido
+LEVEL_SYNC_MIN_NODES = 1000
+
+# Níveis com menos entradas de adjacência que isto são expandidos em laço
+# Python (o custo fixo das operações vetorizadas domina em níveis pequenos)
+SMALL_LEVEL_ENTRIES = 256
+
+
+def _gather(offsets: np.ndarray, nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Índices das entradas de adjacência de `nodes`, concatenadas na ordem
+    # dada, e o grau de cada nó
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+    shift = np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    return shift + np.arange(len(shift), dtype=np.int64), counts
 
 
 class BFSAlgorithm(BaseAlgorithm):
     # Implementação do algoritmo de Busca em Largura (BFS)
 
-    def traverse(self, graph: nx.Graph, start_node) -> Generator[GraphState, None, None]:
+    frontier_kind = FIFO
+
+    def record(self, graph: CSRGraph, start: int, trace: TraversalTrace) -> Generator[None, None, None]:
+        offsets, neighbors, _ = graph.adjacency_lists()
 
-        if start_node not in graph.nodes():
-            raise ValueError(f"Nó inicial '{start_node}' não encontrado no grafo")
+        visited = bytearray(graph.num_nodes)     # Para verificação O(1)
+        discovered = bytearray(graph.num_nodes)  # Já entrou na fila (equivale a "está na fila ou visitado")
+        parent = [-1] * graph.num_nodes          # Rastrear pai de cada nó
 
-        visited_set = set()  # Para verificação O(1)
-        visited_order = []   # Para manter ordem cronológica
-        queue = deque([start_node])
-        visited_edges = []  # Rastrear arestas visitadas
-        parent = {start_node: None}  # Rastrear pai de cada nó
+        queue = deque([start])
+        discovered[start] = 1
+        trace.push(start)
 
         while queue:
             current = queue.popleft()
+            trace.pop()
+
+            if not visited[current]:
+                visited[current] = 1
 
-            if current not in visited_set:
-                visited_set.add(current)
-                visited_order.append(current)  # Adicionar na lista (ordem garantida)
-
-                # Obter nó anterior
-                previous = parent[current]
-
-                # Adicionar aresta às visitadas se houver nó anterior
-                if previous is not None:
-                    edge = tuple(sorted([previous, current], key=str))  # Aresta não direcionada
-                    if edge not in visited_edges:
-                        visited_edges.append(edge)
-
-                # Produzir estado com informações da aresta
-                yield GraphState(
-                    visited=list(visited_order),  # Usar lista ordenada
-                    current=current,
-                    queue_or_stack=list(queue),
-                    graph=graph,
-                    previous=previous,
-                    visited_edges=list(visited_edges)
-                )
+                # Registrar passo: o trace deriva a aresta (anterior, atual)
+                trace.step(current, parent[current])
+                yield
 
                 # Adicionar vizinhos não visitados à fila
-                for neighbor in graph.neighbors(current):
-                    if neighbor not in visited_set and neighbor not in queue:
+                for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                    if not discovered[neighbor]:
+                        discovered[neighbor] = 1
                         queue.append(neighbor)
+                        trace.push(neighbor)
                         parent[neighbor] = current  # Rastrear pai
+
+    def solve(self, graph: CSRGraph, start: int) -> BFSResult:
+        if graph.num_nodes >= LEVEL_SYNC_MIN_NODES:
+            return self._solve_levels(graph, start)
+
+        offsets, neighbors, _ = graph.adjacency_lists()
+        discovered = bytearray(graph.num_nodes)
+        parent = [-1] * graph.num_nodes
+
+        # Cada nó entra na fila uma única vez: a ordem de descoberta é a ordem de
+        # visita, e cada nível é o trecho descoberto pelo nível anterior
+        order = [start]
+        level_offsets = [0]
+        discovered[start] = 1
+        head = 0
+        while head < len(order):
+            level_end = len(order)
+            level_offsets.append(level_end)
+            while head < level_end:
+                current = order[head]
+                head += 1
+                for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                    if not discovered[neighbor]:
+                        discovered[neighbor] = 1
+                        parent[neighbor] = current
+                        order.append(neighbor)
+
+        return BFSResult(
+            graph, start, np.array(order, dtype=np.int64), np.array(parent, dtype=np.int64),
+            level_offsets=np.array(level_offsets, dtype=np.int64)
+        )
+
+    def _solve_levels(self, graph: CSRGraph, start: int) -> BFSResult:
+        # BFS por níveis: cada nível é expandido de uma vez sobre os arrays CSR.
+        # O próximo nível sai na mesma ordem da fila da BFS passo a passo:
+        # por posição do pai no nível atual e, para o mesmo pai, pela ordem
+        # das suas entradas de adjacência.
+        n = graph.num_nodes
+        offsets = np.asarray(graph.offsets, dtype=np.int64)
+        neighbors = np.asarray(graph.neighbors, dtype=np.int64)
+        degree = np.diff(offsets)
+
+        # Mapa de descobertos (um byte por nó), visto como array booleano sem cópia
+        discovered_bytes = bytearray(n)
+        discovered = np.frombuffer(discovered_bytes, dtype=bool)
+        position = np.full(n, -1, dtype=np.int64)  # Posição de cada nó no nível atual
+        parent = np.full(n, -1, dtype=np.int64)
+
+        # Níveis pequenos ficam em listas Python (seguidos, numa lista só; os
+        # nós descobertos neles e seus pais em outras duas); níveis grandes, em arrays
+        adjacency_offsets, adjacency, _ = graph.adjacency_lists()
+        parts = []
+        small = []
+        children = []
+        parents = []
+        level_offsets = [0]
+
+        frontier = [start]
+        frontier_entries = int(degree[start])
+        discovered_bytes[start] = 1
+        pending_entries = int(degree.sum()) - frontier_entries  # Entradas dos nós não descobertos
+        while len(frontier):
+            level_offsets.append(level_offsets[-1] + len(frontier))
+
+            if frontier_entries < SMALL_LEVEL_ENTRIES:
+                # Nível pequeno em laço Python
+                small.extend(frontier)
+                found = []
+                frontier_entries = 0
+                for current in frontier:
+                    for neighbor in adjacency[adjacency_offsets[current]:adjacency_offsets[current + 1]]:
+                        if not discovered_bytes[neighbor]:
+                            discovered_bytes[neighbor] = 1
+                            found.append(neighbor)
+                            parents.append(current)
+                            frontier_entries += adjacency_offsets[neighbor + 1] - adjacency_offsets[neighbor]
+                children.extend(found)
+                frontier = found
+                pending_entries -= frontier_entries
+                continue
+
+            if small:
+                parts.append(np.array(small, dtype=np.int64))
+                small = []
+            if children:
+                parent[children] = parents
+                children, parents = [], []
+            frontier = np.asarray(frontier, dtype=np.int64)
+            parts.append(frontier)
+
+            # Direção: de cima para baixo percorre as entradas do nível; de baixo
+            # para cima, as dos nós ainda não descobertos (mais a varredura do
+            # mapa). Sem parada antecipada por nó, vale a de menos entradas.
+            if frontier_entries > pending_entries + n:
+                frontier, frontier_parents = self._bottom_up(graph, neighbors, offsets, frontier, discovered, position)
+            else:
+                frontier, frontier_parents = self._top_down(neighbors, offsets, frontier, discovered)
+
+            discovered[frontier] = True
+            parent[frontier] = frontier_parents
+            frontier_entries = int(degree[frontier].sum())
+            pending_entries -= frontier_entries
+            if frontier_entries < SMALL_LEVEL_ENTRIES:
+                frontier = frontier.tolist()
+
+        parts.append(np.array(small, dtype=np.int64))
+        if children:
+            parent[children] = parents
+        return BFSResult(
+            graph, start, np.concatenate(parts), parent, level_offsets=np.array(level_offsets, dtype=np.int64)
+        )
+
+    @staticmethod
+    def _top_down(neighbors, offsets, frontier, discovered):
+        # Vizinhos do nível na ordem da fila; cada nó novo fica com a primeira
+        # ocorrência (o primeiro pai que o alcança)
+        entries, counts = _gather(offsets, frontier)
+        found = neighbors[entries]
+        fresh = ~discovered[found]
+        found = found[fresh]
+        parents = np.repeat(frontier, counts)[fresh]
+        _, first = np.unique(found, return_index=True)
+        first.sort()
+        return found[first], parents[first]
+
+    @staticmethod
+    def _bottom_up(graph, neighbors, offsets, frontier, discovered, position):
+        # Cada nó não descoberto procura, entre seus vizinhos, o do nível atual
+        # que vem primeiro na fila; a entrada espelhada (pai -> nó) dá a ordem
+        # entre os filhos de um mesmo pai
+        position[frontier] = np.arange(len(frontier))
+        pending = np.flatnonzero(~discovered)
+        entries, counts = _gather(offsets, pending)
+        rank = position[neighbors[entries]]
+        hit = rank >= 0
+        found = np.repeat(pending, counts)[hit]
+        rank = rank[hit]
+        mirror = graph.mirror_entries()[entries[hit]]
+        position[frontier] = -1
+
+        by_queue = np.lexsort((mirror, rank))
+        _, first = np.unique(found[by_queue], return_index=True)
+        first = by_queue[np.sort(first)]
+        return found[first], frontier[rank[first]]
+
+    def traverse_levels(self, graph: Union[nx.Graph, CSRGraph], start_node) -> Generator[GraphState, None, None]:
+        # Um estado por nível (ao fim da visita de cada nível), para animar a
+        # BFS em grafos grandes sem um quadro por nó. Uma única travessia: os
+        # níveis saem dos pais gravados no trace (nível = nível do pai + 1)
+        csr, trace = self._prepare(graph, start_node)
+        for _ in self._recording(csr, start_node, trace):
+            pass
+
+        current, previous = trace.step_ids
+        level = [0] * csr.num_nodes
+        last = 0
+        for k in range(len(trace)):
+            node = current[k]
+            if previous[k] != -1:
+                level[node] = level[previous[k]] + 1
+            if level[node] != last:
+                yield trace.state(k - 1)
+                last = level[node]
+        if len(trace):
+            yield trace.state(len(trace) - 1)
@@ -0,0 +1,156 @@
+import heapq
+from typing import Generator, Optional
+from .dijkstra import DijkstraAlgorithm
+from src.models.csr_graph import CSRGraph
+from src.models.traversal_trace import TraversalTrace
+from src.models.traversal_result import ShortestPathResult
+
+FORWARD = 0
+BACKWARD = 1
+
+
+class _BidirectionalSearch:
+    # Duas buscas de Dijkstra, a partir da origem e do destino, avançando sempre
+    # a de menor distância na fila. Para quando a soma dos topos das duas filas
+    # alcança o melhor caminho já encontrado entre elas.
+
+    def __init__(self, graph: CSRGraph, start: int, target: int):
+        n = graph.num_nodes
+        self.graph = graph
+        self.start = start
+        self.target = target
+        self.distances = ([float('inf')] * n, [float('inf')] * n)
+        self.previous = ([-1] * n, [-1] * n)
+        self.settled = (bytearray(n), bytearray(n))
+        self.order = []
+        self.side = []              # Busca que visitou cada nó da ordem
+        self.best = float('inf')    # Melhor caminho origem -> destino encontrado
+        self.meeting = None         # Aresta (nó da ida, nó da volta) desse caminho
+
+    def steps(self, trace: Optional[TraversalTrace]) -> Generator[None, None, None]:
+        offsets, neighbors, weights = self.graph.adjacency_lists()
+        rank = self.graph.rank
+        heappush, heappop = heapq.heappush, heapq.heappop
+        distances, previous, settled = self.distances, self.previous, self.settled
+        start, target = self.start, self.target
+
+        if start == target:
+            distances[FORWARD][start] = 0
+            settled[FORWARD][start] = 1
+            self.order.append(start)
+            self.side.append(FORWARD)
+            self.best = 0
+            if trace is not None:
+                trace.step(start)
+                yield
+            return
+
+        distances[FORWARD][start] = 0
+        distances[BACKWARD][target] = 0
+        queues = ([(0, rank[start], start)], [(0, rank[target], target)])
+        if trace is not None:
+            trace.push(start, 0)
+            trace.push(target, 0)
+
+        # Se uma das filas esvaziar, aquele componente foi todo visitado e o
+        # melhor caminho (se existir) já foi encontrado
+        while queues[FORWARD] and queues[BACKWARD]:
+            forward, backward = queues
+            if forward[0][0] + backward[0][0] >= self.best:
+                break
+
+            # Avançar a busca com o menor topo (a mesma ordem da fila única exibida)
+            side = FORWARD if forward[0][:2] <= backward[0][:2] else BACKWARD
+            other = 1 - side
+            current_dist, _, current = heappop(queues[side])
+            if trace is not None:
+                trace.pop()
+            if settled[side][current]:
+                continue
+
+            settled[side][current] = 1
+            self.order.append(current)
+            self.side.append(side)
+            if trace is not None:
+                trace.step(current, previous[side][current])
+                yield
+
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[i]
+                new_dist = current_dist + weights[i]
+
+                # Aresta que liga as duas buscas: candidata a melhor caminho
+                through = new_dist + distances[other][neighbor]
+                if through < self.best:
+                    self.best = through
+                    self.meeting = (current, neighbor) if side == FORWARD else (neighbor, current)
+
+                if not settled[side][neighbor] and new_dist < distances[side][neighbor]:
+                    distances[side][neighbor] = new_dist
+                    previous[side][neighbor] = current
+                    heappush(queues[side], (new_dist, rank[neighbor], neighbor))
+                    if trace is not None:
+                        trace.push(neighbor, new_dist)
+
+    def path(self) -> list:
+        # Ids do melhor caminho origem -> destino (vazio se não houver)
+        if self.start == self.target:
+            return [self.start]
+        if self.meeting is None:
+            return []
+        forward_end, backward_start = self.meeting
+        head = []
+        node = forward_end
+        while node != -1:
+            head.append(node)
+            node = self.previous[FORWARD][node]
+        tail = []
+        node = backward_start
+        while node != -1:
+            tail.append(node)
+            node = self.previous[BACKWARD][node]
+        return head[::-1] + tail
+
+    def result(self) -> ShortestPathResult:
+        # Pais e distâncias definitivas da ida; nós da volta apontam para o
+        # destino, exceto os do caminho, religados à origem para path_to(destino)
+        n = self.graph.num_nodes
+        previous = [-1] * n
+        distances = [float('inf')] * n
+        for node, side in zip(self.order, self.side):
+            previous[node] = self.previous[side][node]
+            if side == FORWARD:
+                distances[node] = self.distances[FORWARD][node]
+
+        path = self.path()
+        extra = [node for node in path if not (self.settled[FORWARD][node] or self.settled[BACKWARD][node])]
+        on_tail = False
+        for k, node in enumerate(path):
+            if k:
+                previous[node] = path[k - 1]
+            # Até o encontro vale a distância da ida; depois, o total menos a volta
+            on_tail = on_tail or (self.meeting is not None and node == self.meeting[1])
+            distances[node] = self.best - self.distances[BACKWARD][node] if on_tail else self.distances[FORWARD][node]
+
+        return ShortestPathResult.settled(self.graph, self.start, self.order + extra, previous, distances, self.target)
+
+
+class BidirectionalDijkstraAlgorithm(DijkstraAlgorithm):
+    # Dijkstra bidirecional: exige um destino; visita os nós das duas buscas
+    # intercalados, em ordem crescente de distância à sua origem
+
+    def _required_target(self, graph: CSRGraph) -> int:
+        target = self._target_id(graph)
+        if target is None:
+            raise ValueError("O Dijkstra bidirecional precisa de um nó de destino")
+        return target
+
+    def record(self, graph: CSRGraph, start: int, trace: TraversalTrace) -> Generator[None, None, None]:
+        search = _BidirectionalSearch(graph, start, self._required_target(graph))
+        yield from search.steps(trace)
+
+    def solve(self, graph: CSRGraph, start: int) -> ShortestPathResult:
+        search = _BidirectionalSearch(graph, start, self._required_target(graph))
+        for _ in search.steps(None):
+            pass
+        return search.result()
@@ -1,52 +1,65 @@
 from typing import Generator
-import networkx as nx
+import numpy as np
 from .base_algorithm import BaseAlgorithm
-from src.models.graph_state import GraphState
+from src.models.csr_graph import CSRGraph
+from src.models.traversal_result import TraversalResult
+from src.models.traversal_trace import TraversalTrace, LIFO
 
 
 class DFSAlgorithm(BaseAlgorithm):
     # Implementação do algoritmo de Busca em Profundidade (DFS)
 
-    def traverse(self, graph: nx.Graph, start_node) -> Generator[GraphState, None, None]:
+    frontier_kind = LIFO
 
-        if start_node not in graph.nodes():
-            raise ValueError(f"Nó inicial '{start_node}' não encontrado no grafo")
+    def record(self, graph: CSRGraph, start: int, trace: TraversalTrace) -> Generator[None, None, None]:
+        offsets, neighbors, _ = graph.adjacency_lists()
 
-        visited_set = set()  # Para verificação O(1)
-        visited_order = []   # Para manter ordem cronológica
-        stack = [start_node]
-        visited_edges = []  # Rastrear arestas visitadas
-        parent = {start_node: None}  # Rastrear pai de cada nó
+        visited = bytearray(graph.num_nodes)     # Para verificação O(1)
+        discovered = bytearray(graph.num_nodes)  # Já entrou na pilha (equivale a "está na pilha ou visitado")
+        parent = [-1] * graph.num_nodes          # Rastrear pai de cada nó
+
+        stack = [start]
+        discovered[start] = 1
+        trace.push(start)
 
         while stack:
             current = stack.pop()
+            trace.pop()
+
+            if not visited[current]:
+                visited[current] = 1
 
-            if current not in visited_set:
-                visited_set.add(current)
-                visited_order.append(current)  # Adicionar na lista (ordem garantida)
-
-                # Obter nó anterior
-                previous = parent[current]
-
-                # Adicionar aresta às visitadas se houver nó anterior
-                if previous is not None:
-                    edge = tuple(sorted([previous, current], key=str))  # Aresta não direcionada
-                    if edge not in visited_edges:
-                        visited_edges.append(edge)
-
-                # Produzir estado com informações da aresta
-                yield GraphState(
-                    visited=list(visited_order),  # Usar lista ordenada
-                    current=current,
-                    queue_or_stack=list(stack),
-                    graph=graph,
-                    previous=previous,
-                    visited_edges=list(visited_edges)
-                )
+                # Registrar passo: o trace deriva a aresta (anterior, atual)
+                trace.step(current, parent[current])
+                yield
 
                 # Adicionar vizinhos não visitados à pilha (em ordem reversa para travessia consistente)
-                neighbors = list(graph.neighbors(current))
-                for neighbor in reversed(neighbors):
-                    if neighbor not in visited_set and neighbor not in stack:
+                for neighbor in reversed(neighbors[offsets[current]:offsets[current + 1]]):
+                    if not discovered[neighbor]:
+                        discovered[neighbor] = 1
                         stack.append(neighbor)
+                        trace.push(neighbor)
                         parent[neighbor] = current  # Rastrear pai
+
+    def solve(self, graph: CSRGraph, start: int) -> TraversalResult:
+        offsets, neighbors, _ = graph.adjacency_lists()
+        visited = bytearray(graph.num_nodes)
+        discovered = bytearray(graph.num_nodes)
+        parent = [-1] * graph.num_nodes
+
+        order = []
+        stack = [start]
+        discovered[start] = 1
+        while stack:
+            current = stack.pop()
+            if visited[current]:
+                continue
+            visited[current] = 1
+            order.append(current)
+            for neighbor in reversed(neighbors[offsets[current]:offsets[current + 1]]):
+                if not discovered[neighbor]:
+                    discovered[neighbor] = 1
+                    stack.append(neighbor)
+                    parent[neighbor] = current
+
+        return TraversalResult(graph, start, np.array(order, dtype=np.int64), np.array(parent, dtype=np.int64))
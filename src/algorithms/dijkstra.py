@@ -1,68 +1,148 @@
 import heapq
-from typing import Generator
-import networkx as nx
+from typing import Any, Generator, Optional
+import numpy as np
 from .base_algorithm import BaseAlgorithm
-from src.models.graph_state import GraphState
+from src.models.csr_graph import CSRGraph
+from src.models.traversal_result import ShortestPathResult
+from src.models.traversal_trace import TraversalTrace, PRIORITY
 
 
 class DijkstraAlgorithm(BaseAlgorithm):
     # Implementação do algoritmo de Dijkstra para caminho mínimo
 
-    def traverse(self, graph: nx.Graph, start_node) -> Generator[GraphState, None, None]:
+    frontier_kind = PRIORITY
 
-        if start_node not in graph.nodes():
-            raise ValueError(f"Nó inicial '{start_node}' não encontrado no grafo")
+    def __init__(self, target: Any = None):
+        # Nó de destino opcional: a busca para assim que ele é definitivamente visitado
+        self.target = target
+
+    def _target_id(self, graph: CSRGraph) -> Optional[int]:
+        if self.target is None:
+            return None
+        target = graph.index.get(self.target)
+        if target is None:
+            raise ValueError(f"Nó de destino '{self.target}' não encontrado no grafo")
+        return target
+
+    def record(self, graph: CSRGraph, start: int, trace: TraversalTrace) -> Generator[None, None, None]:
+        offsets, neighbors, weights = graph.adjacency_lists()
+        rank = graph.rank  # Desempate pelo rótulo do nó
+        target = self._target_id(graph)
 
         # Estruturas de dados do Dijkstra
-        distances = {node: float('inf') for node in graph.nodes()}
-        distances[start_node] = 0
-        previous = {start_node: None}
+        distances = [float('inf')] * graph.num_nodes
+        distances[start] = 0
+        previous = [-1] * graph.num_nodes
 
-        visited_set = set()  # Para verificação O(1)
-        visited_order = []   # Para manter ordem cronológica
-        visited_edges = []
+        visited = bytearray(graph.num_nodes)  # Para verificação O(1)
 
-        # Fila de prioridade: (distância, nó)
-        pq = [(0, start_node)]
+        # Fila de prioridade: (distância, rank do nó, nó)
+        pq = [(0, rank[start], start)]
+        trace.push(start, 0)
 
         while pq:
-            current_dist, current = heapq.heappop(pq)
+            current_dist, _, current = heapq.heappop(pq)
+            trace.pop()
 
             # Pular se já visitado
-            if current in visited_set:
+            if visited[current]:
                 continue
 
-            visited_set.add(current)
-            visited_order.append(current)  # Adicionar na lista (ordem garantida)
-
-            # Adicionar aresta visitada
-            if previous.get(current) is not None:
-                edge = tuple(sorted([previous[current], current], key=str))
-                if edge not in visited_edges:
-                    visited_edges.append(edge)
+            visited[current] = 1
 
-            # Criar estrutura de dados para exibição da fila
-            queue_display = [node for _, node in sorted(pq)]
+            # Registrar passo (a fila exibida é reconstruída pelo trace)
+            trace.step(current, previous[current])
+            yield
 
-            # Yield estado atual
-            yield GraphState(
-                visited=list(visited_order),  # Usar lista ordenada
-                current=current,
-                queue_or_stack=queue_display,
-                graph=graph,
-                previous=previous.get(current),
-                visited_edges=list(visited_edges)
-            )
+            # Destino visitado: a distância dele já é definitiva
+            if current == target:
+                return
 
             # Relaxar arestas dos vizinhos
-            for neighbor in graph.neighbors(current):
-                if neighbor not in visited_set:
-                    # Obter peso da aresta
-                    weight = graph[current][neighbor].get('weight', 1.0)
-                    new_dist = current_dist + weight
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[i]
+                if not visited[neighbor]:
+                    new_dist = current_dist + weights[i]
 
                     # Atualizar distância se for menor
                     if new_dist < distances[neighbor]:
                         distances[neighbor] = new_dist
                         previous[neighbor] = current
-                        heapq.heappush(pq, (new_dist, neighbor))
+                        heapq.heappush(pq, (new_dist, rank[neighbor], neighbor))
+                        trace.push(neighbor, new_dist)
+
+    def solve(self, graph: CSRGraph, start: int) -> ShortestPathResult:
+        if graph.prefers_dense():
+            return self._solve_dense(graph, start)
+
+        offsets, neighbors, weights = graph.adjacency_lists()
+        rank = graph.rank
+        target = self._target_id(graph)
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        distances = [float('inf')] * graph.num_nodes
+        distances[start] = 0
+        previous = [-1] * graph.num_nodes
+        visited = bytearray(graph.num_nodes)
+
+        order = []
+        pq = [(0, rank[start], start)]
+        while pq:
+            current_dist, _, current = heappop(pq)
+            if visited[current]:
+                continue
+            visited[current] = 1
+            order.append(current)
+            if current == target:
+                break
+
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[i]
+                if not visited[neighbor]:
+                    new_dist = current_dist + weights[i]
+                    if new_dist < distances[neighbor]:
+                        distances[neighbor] = new_dist
+                        previous[neighbor] = current
+                        heappush(pq, (new_dist, rank[neighbor], neighbor))
+
+        return ShortestPathResult.settled(graph, start, order, previous, distances, target)
+
+    def _solve_dense(self, graph: CSRGraph, start: int) -> ShortestPathResult:
+        # Variante O(V²) para grafos densos: a cada passo, o nó de menor
+        # distância é achado por varredura do array e o relaxamento é uma
+        # única operação vetorizada sobre a linha dele na matriz de pesos
+        matrix = graph.dense_weights()
+        rank = np.asarray(graph.rank)
+        target = self._target_id(graph)
+        n = graph.num_nodes
+
+        distances = np.full(n, np.inf)
+        distances[start] = 0.0
+        previous = np.full(n, -1, dtype=np.int64)
+        visited = np.zeros(n, dtype=bool)
+        frontier = distances.copy()  # Distâncias dos nós ainda não visitados (inf nos demais)
+
+        order = []
+        for _ in range(n):
+            current = int(np.argmin(frontier))
+            current_dist = frontier[current]
+            if current_dist == np.inf:
+                break
+            # Empate na distância: menor rótulo, como no heap
+            ties = np.flatnonzero(frontier == current_dist)
+            if len(ties) > 1:
+                current = int(ties[np.argmin(rank[ties])])
+
+            visited[current] = True
+            frontier[current] = np.inf
+            order.append(current)
+            if current == target:
+                break
+
+            candidate = current_dist + matrix[current]
+            better = (candidate < distances) & ~visited
+            distances[better] = candidate[better]
+            previous[better] = current
+            frontier[better] = candidate[better]
+
+        return ShortestPathResult.settled(graph, start, order, previous, distances, target)
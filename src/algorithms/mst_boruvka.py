@@ -0,0 +1,67 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Optional
+import numpy as np
+from .spanning_forest import SpanningForestAlgorithm, sorted_edges
+from src.models.csr_graph import CSRGraph
+from src.models.union_find import UnionFind
+
+# Abaixo disso as arestas de cada rodada são processadas num único bloco
+MIN_EDGES_PER_WORKER = 50_000
+
+
+def _cheapest(components: np.ndarray, ranks: np.ndarray, num_nodes: int, sentinel: int) -> np.ndarray:
+    # Menor rank de aresta incidente a cada componente (sentinel = nenhuma)
+    order = np.lexsort((ranks, components))
+    components = components[order]
+    first = np.r_[True, components[1:] != components[:-1]]
+    best = np.full(num_nodes, sentinel, dtype=np.int64)
+    best[components[first]] = ranks[order][first]
+    return best
+
+
+class BoruvkaMSTAlgorithm(SpanningForestAlgorithm):
+    # Implementação do algoritmo de Borůvka: a cada rodada, cada componente
+    # escolhe sua aresta mais barata para fora, em operações vetorizadas sobre
+    # todas as arestas (em blocos paralelos: o NumPy libera o GIL na ordenação)
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+
+    def _round_cheapest(self, pool, components: np.ndarray, ranks: np.ndarray, num_nodes: int,
+                        sentinel: int) -> np.ndarray:
+        chunks = max(1, min(self.workers, len(ranks) // MIN_EDGES_PER_WORKER))
+        bounds = np.linspace(0, len(ranks), chunks + 1).astype(np.int64)
+        parts = [(components[:, a:b].ravel(), np.tile(ranks[a:b], 2)) for a, b in zip(bounds[:-1], bounds[1:])]
+        if pool is None or chunks == 1:
+            results = [_cheapest(c, r, num_nodes, sentinel) for c, r in parts]
+        else:
+            results = list(pool.map(lambda part: _cheapest(*part, num_nodes, sentinel), parts))
+        return np.minimum.reduce(results)
+
+    def forest_edges(self, graph: CSRGraph) -> np.ndarray:
+        # Rank = posição na ordem (peso, inserção): ordem total, sem empates
+        candidates = sorted_edges(graph)
+        ranks = np.arange(len(candidates), dtype=np.int64)
+        endpoints = np.vstack([graph.edge_src[candidates], graph.edge_dst[candidates]]).astype(np.int64)
+
+        union_find = UnionFind(graph.num_nodes)
+        accepted = []
+        with ThreadPoolExecutor(max_workers=self.workers) if self.workers > 1 else nullcontext() as pool:
+            while len(ranks):
+                components = union_find.roots()[endpoints]
+
+                # Só arestas entre componentes diferentes continuam candidatas
+                crossing = components[0] != components[1]
+                ranks, endpoints, components = ranks[crossing], endpoints[:, crossing], components[:, crossing]
+                if not len(ranks):
+                    break
+
+                best = self._round_cheapest(pool, components, ranks, graph.num_nodes, len(candidates))
+                chosen = np.unique(best[best < len(candidates)])  # Em ordem de rank
+                for rank in chosen.tolist():
+                    u, v = graph.edge_src[candidates[rank]], graph.edge_dst[candidates[rank]]
+                    if union_find.union(int(u), int(v)):
+                        accepted.append(rank)
+        return candidates[np.array(accepted, dtype=np.int64)]
@@ -0,0 +1,24 @@
+import numpy as np
+from .spanning_forest import SpanningForestAlgorithm, sorted_edges
+from src.models.csr_graph import CSRGraph
+from src.models.union_find import UnionFind
+
+
+class KruskalMSTAlgorithm(SpanningForestAlgorithm):
+    # Implementação do algoritmo de Kruskal: arestas ordenadas de uma vez pelo
+    # NumPy e aceitas se ligam componentes diferentes (union-find)
+
+    def forest_edges(self, graph: CSRGraph) -> np.ndarray:
+        candidates = sorted_edges(graph)
+        sources = graph.edge_src[candidates].tolist()
+        targets = graph.edge_dst[candidates].tolist()
+
+        components = UnionFind(graph.num_nodes)
+        union = components.union
+        accepted = []
+        for position, (u, v) in enumerate(zip(sources, targets)):
+            if union(u, v):
+                accepted.append(position)
+                if components.components == 1:
+                    break  # Grafo conexo: árvore completa
+        return candidates[np.array(accepted, dtype=np.int64)]
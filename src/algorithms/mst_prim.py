@@ -1,59 +1,132 @@
 import heapq
 from typing import Generator
-import networkx as nx
+import numpy as np
 from .base_algorithm import BaseAlgorithm
-from src.models.graph_state import GraphState
+from src.models.csr_graph import CSRGraph
+from src.models.traversal_result import SpanningTreeResult
+from src.models.traversal_trace import TraversalTrace, PRIORITY
 
 
 class PrimMSTAlgorithm(BaseAlgorithm):
     # Implementação do algoritmo de Prim para Árvore Geradora Mínima (MST)
 
-    def traverse(self, graph: nx.Graph, start_node) -> Generator[GraphState, None, None]:
+    frontier_kind = PRIORITY
 
-        if start_node not in graph.nodes():
-            raise ValueError(f"Nó inicial '{start_node}' não encontrado no grafo")
+    def record(self, graph: CSRGraph, start: int, trace: TraversalTrace) -> Generator[None, None, None]:
+        offsets, neighbors, weights = graph.adjacency_lists()
+        rank = graph.rank  # Desempate pelo rótulo do nó
+        num_nodes = graph.num_nodes
 
         # Estruturas do Prim
-        visited_set = set()  # Para verificação O(1)
-        visited_order = []   # Para manter ordem cronológica
-        visited_edges = []  # Arestas da MST
-        parent = {start_node: None}
+        visited = bytearray(num_nodes)  # Para verificação O(1)
+        visited_count = 0
 
-        # Fila de prioridade: (peso, nó_destino, nó_origem)
-        pq = [(0, start_node, None)]
+        # Fila de prioridade: (peso, rank do destino, rank da origem, nó_destino, nó_origem)
+        pq = [(0, rank[start], -1, start, -1)]
+        trace.push(start, 0)
 
-        while pq and len(visited_set) < len(graph.nodes()):
-            weight, current, prev = heapq.heappop(pq)
+        while pq and visited_count < num_nodes:
+            _, _, _, current, prev = heapq.heappop(pq)
+            trace.pop()
 
             # Pular se já visitado
-            if current in visited_set:
+            if visited[current]:
                 continue
 
-            visited_set.add(current)
-            visited_order.append(current)  # Adicionar na lista (ordem garantida)
-
-            # Adicionar aresta à MST (exceto primeiro nó)
-            if prev is not None:
-                edge = tuple(sorted([prev, current], key=str))
-                if edge not in visited_edges:
-                    visited_edges.append(edge)
-                    parent[current] = prev
-
-            # Criar display da fila
-            queue_display = [node for _, node, _ in sorted(pq)]
-
-            # Yield estado
-            yield GraphState(
-                visited=list(visited_order),  # Usar lista ordenada
-                current=current,
-                queue_or_stack=queue_display,
-                graph=graph,
-                previous=prev,
-                visited_edges=list(visited_edges)
-            )
+            visited[current] = 1
+            visited_count += 1
+
+            # Registrar passo: a aresta (prev, atual) entra na MST (exceto primeiro nó)
+            trace.step(current, prev)
+            yield
 
             # Adicionar arestas dos vizinhos não visitados
-            for neighbor in graph.neighbors(current):
-                if neighbor not in visited_set:
-                    edge_weight = graph[current][neighbor].get('weight', 1.0)
-                    heapq.heappush(pq, (edge_weight, neighbor, current))
+            current_rank = rank[current]
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[i]
+                if not visited[neighbor]:
+                    heapq.heappush(pq, (weights[i], rank[neighbor], current_rank, neighbor, current))
+                    trace.push(neighbor, weights[i])
+
+    def solve(self, graph: CSRGraph, start: int) -> SpanningTreeResult:
+        if graph.prefers_dense():
+            return self._solve_dense(graph, start)
+
+        offsets, neighbors, weights = graph.adjacency_lists()
+        rank = graph.rank
+        num_nodes = graph.num_nodes
+        heappush, heappop = heapq.heappush, heapq.heappop
+
+        visited = bytearray(num_nodes)
+        parent = [-1] * num_nodes
+        order = []
+        tree_weights = []  # Peso da aresta que trouxe cada nó (exceto o inicial)
+
+        pq = [(0, rank[start], -1, start, -1)]
+        while pq and len(order) < num_nodes:
+            weight, _, _, current, prev = heappop(pq)
+            if visited[current]:
+                continue
+            visited[current] = 1
+            order.append(current)
+            parent[current] = prev
+            if prev != -1:
+                tree_weights.append(weight)
+
+            current_rank = rank[current]
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = neighbors[i]
+                if not visited[neighbor]:
+                    heappush(pq, (weights[i], rank[neighbor], current_rank, neighbor, current))
+
+        return SpanningTreeResult(
+            graph, start, np.array(order, dtype=np.int64), np.array(parent, dtype=np.int64),
+            weights=np.array(tree_weights, dtype=np.float64)
+        )
+
+    def _solve_dense(self, graph: CSRGraph, start: int) -> SpanningTreeResult:
+        # Variante O(V²) para grafos densos: key[v] guarda a aresta mais leve
+        # da árvore até v, atualizada com um mínimo vetorizado sobre a linha do
+        # nó que entrou. Desempates iguais aos do heap (rótulo do destino, depois da origem).
+        matrix = graph.dense_weights()
+        rank = np.asarray(graph.rank)
+        n = graph.num_nodes
+
+        key = np.full(n, np.inf)
+        key[start] = 0.0
+        source = np.full(n, -1, dtype=np.int64)
+        source_rank = np.full(n, -1, dtype=np.int64)
+        visited = np.zeros(n, dtype=bool)
+        frontier = key.copy()
+
+        order = []
+        tree_weights = []
+        for _ in range(n):
+            current = int(np.argmin(frontier))
+            weight = frontier[current]
+            if weight == np.inf:
+                break
+            ties = np.flatnonzero(frontier == weight)
+            if len(ties) > 1:
+                current = int(ties[np.argmin(rank[ties])])
+
+            visited[current] = True
+            frontier[current] = np.inf
+            order.append(current)
+            if source[current] != -1:
+                tree_weights.append(weight)
+
+            row = matrix[current]
+            better = ~visited & ((row < key) | ((row == key) & (rank[current] < source_rank) & (row < np.inf)))
+            key[better] = row[better]
+            source[better] = current
+            source_rank[better] = rank[current]
+            frontier[better] = row[better]
+
+        parent = np.full(n, -1, dtype=np.int64)
+        order = np.array(order, dtype=np.int64)
+        parent[order] = source[order]
+        return SpanningTreeResult(
+            graph, start, order, parent,
+            weights=np.array(tree_weights, dtype=np.float64)
+        )
@@ -0,0 +1,69 @@
+from abc import abstractmethod
+from typing import Generator, Iterator, Tuple
+import numpy as np
+from .base_algorithm import BaseAlgorithm
+from src.models.csr_graph import CSRGraph
+from src.models.traversal_trace import TraversalTrace, FIFO
+from src.models.traversal_result import SpanningTreeResult
+
+
+def sorted_edges(graph: CSRGraph) -> np.ndarray:
+    # Índices das arestas (sem laços) em ordem crescente de peso; empates pela
+    # ordem de inserção, o que dá uma ordem total e uma floresta determinística
+    candidates = np.flatnonzero(graph.edge_src != graph.edge_dst)
+    order = np.argsort(np.asarray(graph.edge_weight)[candidates], kind='stable')
+    return candidates[order]
+
+
+class SpanningForestAlgorithm(BaseAlgorithm):
+    # Árvore geradora mínima de cada componente (floresta), a partir das arestas
+    # escolhidas por forest_edges(). O nó inicial não influencia o resultado.
+    # Cada aresta aceita é um passo; nós isolados entram ao final.
+
+    frontier_kind = FIFO  # Sem fronteira de nós: a fila exibida fica vazia
+
+    @abstractmethod
+    def forest_edges(self, graph: CSRGraph) -> np.ndarray:
+        # Índices das arestas da floresta, na ordem em que foram aceitas
+        pass
+
+    def _steps(self, graph: CSRGraph, edges: np.ndarray) -> Iterator[Tuple[int, int]]:
+        # Passos (atual, anterior): o nó novo de cada aresta é o atual; se os
+        # dois forem novos, o primeiro entra sozinho antes; se nenhum for, a
+        # aresta liga duas árvores já visitadas
+        seen = bytearray(graph.num_nodes)
+        sources = graph.edge_src[edges].tolist()
+        targets = graph.edge_dst[edges].tolist()
+        for u, v in zip(sources, targets):
+            if seen[v] and not seen[u]:
+                u, v = v, u
+            if not seen[u]:
+                seen[u] = 1
+                yield u, -1
+            seen[v] = 1
+            yield v, u
+        for node in range(graph.num_nodes):
+            if not seen[node]:
+                yield node, -1
+
+    def record(self, graph: CSRGraph, start: int, trace: TraversalTrace) -> Generator[None, None, None]:
+        for current, previous in self._steps(graph, self.forest_edges(graph)):
+            trace.step(current, previous)
+            yield
+
+    def solve(self, graph: CSRGraph, start: int) -> SpanningTreeResult:
+        edges = self.forest_edges(graph)
+        order = []
+        parent = np.full(graph.num_nodes, -1, dtype=np.int64)
+        seen = bytearray(graph.num_nodes)
+        for current, previous in self._steps(graph, edges):
+            if not seen[current]:
+                seen[current] = 1
+                order.append(current)
+                parent[current] = previous
+        return SpanningTreeResult(
+            graph, start, np.array(order, dtype=np.int64), parent,
+            weights=np.asarray(graph.edge_weight, dtype=np.float64)[edges],
+            sources=graph.edge_src[edges].astype(np.int64),
+            targets=graph.edge_dst[edges].astype(np.int64)
+        )
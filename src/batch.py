@@ -0,0 +1,213 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from src.algorithms import AlgorithmFactory, EuclideanHeuristic
+from src.models.csr_graph import CSRGraph
+from src.parsers import ParserFactory, BinaryGraphParser
+from src.visualization.layout_engine import compute_layout
+
+# Execução em lote sem interface nem renderização:
+#   python -m src.batch grafos/*.csv matriz.csv:"Matriz de Adjacência" -a BFS -a Dijkstra -s A -o resultados.jsonl
+# Cada linha do JSON Lines é uma travessia (arquivo, algoritmo, nó inicial).
+# O formato de cada arquivo vem do sufixo `:formato`, da extensão (.zip e
+# diretórios são grafos binários) ou, por fim, de --format.
+
+ALGORITHMS = ["BFS", "DFS", "Dijkstra", "MST (Prim)", "MST (Kruskal)", "MST (Borůvka)"]
+
+# Só fazem sentido com um nó de destino (--target)
+TARGET_ALGORITHMS = ["Dijkstra (bidirecional)", "A*"]
+
+BINARY_FORMAT = "Grafo Binário"
+
+
+@dataclass
+class BatchJob:
+    path: str
+    format_type: str
+    algorithms: List[str]
+    starts: List[str]      # Vazio = primeiro nó do grafo
+    all_starts: bool = False
+    target: Optional[str] = None
+
+
+def _known_format(format_type: str) -> bool:
+    try:
+        ParserFactory.create_parser(format_type)
+    except ValueError:
+        return False
+    return True
+
+
+def split_format(arg: str, default: str) -> Tuple[str, str]:
+    # "caminho:formato" -> (caminho, formato); sem sufixo válido, o formato é
+    # inferido (.zip/diretório = grafo binário) ou fica o padrão
+    path, sep, format_type = arg.rpartition(':')
+    if sep and path and _known_format(format_type) and not os.path.exists(arg):
+        return path, format_type
+    if os.path.isdir(arg) or arg.lower().endswith('.zip'):
+        return arg, BINARY_FORMAT
+    return arg, default
+
+
+def _load(path: str, format_type: str) -> CSRGraph:
+    parser = ParserFactory.create_parser(format_type)
+    if isinstance(parser, BinaryGraphParser):
+        return parser.parse_file(path)
+    return parser.parse_stream(path)  # Em blocos: memória limitada em arquivos grandes
+
+
+def _resolve_start(graph: CSRGraph, start: str, by_text: Dict[str, Any]):
+    # Nós iniciais chegam como texto; rótulos de grafos binários podem ser números
+    if start in graph.index:
+        return start
+    return by_text.get(start, start)
+
+
+def _create_algorithm(graph: CSRGraph, algorithm_type: str, target):
+    # O A* estima a distância restante pelas posições do layout (cache em disco)
+    heuristic = EuclideanHeuristic(compute_layout(graph)) if algorithm_type == "A*" else None
+    return AlgorithmFactory.create_algorithm(algorithm_type, target, heuristic)
+
+
+def _summarize(graph: CSRGraph, algorithm_type: str, start, target=None) -> Dict[str, Any]:
+    # Custo total = soma dos pesos das arestas percorridas (como no resumo do app);
+    # com destino, só o caminho e o custo dele
+    uses_target = target is not None and algorithm_type in ("Dijkstra", *TARGET_ALGORITHMS)
+    result = _create_algorithm(graph, algorithm_type, target if uses_target else None).run(graph, start)
+    summary = {
+        'algorithm': algorithm_type,
+        'start': start,
+        'visit_order': result.visited_order,
+        'edges': len(result.tree_edges()[1])
+    }
+    if uses_target:
+        path = result.path
+        summary.update(target=target, path=path, path_cost=result.path_cost if path else None)
+    else:
+        summary.update(total_cost=result.total_weight, unreachable=result.unreachable)
+    return summary
+
+
+def run_job(job: BatchJob) -> List[Dict[str, Any]]:
+    # Um arquivo por tarefa: o grafo é lido uma vez para todas as travessias dele
+    base = {'file': job.path, 'format': job.format_type}
+    started = time.perf_counter()
+    try:
+        graph = _load(job.path, job.format_type)
+    except (OSError, ValueError) as e:
+        return [{**base, 'error': str(e)}]
+
+    base.update(nodes=graph.num_nodes, graph_edges=graph.num_edges)
+    by_text = {str(label): label for label in graph.labels}
+    if job.all_starts:
+        starts = list(graph.labels)
+    elif job.starts:
+        starts = [_resolve_start(graph, start, by_text) for start in job.starts]
+    else:
+        starts = graph.labels[:1]
+    target = None if job.target is None else _resolve_start(graph, job.target, by_text)
+
+    results = []
+    for algorithm_type in job.algorithms:
+        for start in starts:
+            try:
+                results.append({**base, **_summarize(graph, algorithm_type, start, target)})
+            except ValueError as e:
+                results.append({**base, 'algorithm': algorithm_type, 'start': start, 'error': str(e)})
+
+    elapsed = time.perf_counter() - started
+    for result in results:
+        result['file_seconds'] = round(elapsed, 6)
+    return results
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='python -m src.batch',
+        description="Executa travessias em lote (sem renderização) e grava os resultados em JSON Lines."
+    )
+    parser.add_argument(
+        'files', nargs='+',
+        help="Arquivos CSV (ou grafos binários .zip/diretórios), opcionalmente como caminho:formato"
+    )
+    parser.add_argument(
+        '-f', '--format', default="Lista de Arestas",
+        help="Formato padrão dos arquivos sem sufixo, como no app "
+             "(ex.: 'Lista de Arestas', 'Matriz de Adjacência', 'Lista de Adjacência')"
+    )
+    parser.add_argument(
+        '-a', '--algorithm', action='append', choices=ALGORITHMS + TARGET_ALGORITHMS, dest='algorithms',
+        help="Algoritmo (pode repetir; padrão: todos, e os de destino só com --target)"
+    )
+    parser.add_argument(
+        '-s', '--start', action='append', default=[], dest='starts',
+        help="Nó inicial (pode repetir; padrão: primeiro nó de cada grafo)"
+    )
+    parser.add_argument(
+        '-t', '--target',
+        help="Nó de destino: Dijkstra, Dijkstra (bidirecional) e A* gravam o caminho mínimo até ele"
+    )
+    parser.add_argument('--all-starts', action='store_true', help="Usar todos os nós como inicial")
+    parser.add_argument('-o', '--output', default='-', help="Arquivo JSON Lines de saída (padrão: stdout)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Processos (padrão: núcleos da CPU)")
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        ParserFactory.create_parser(args.format)
+    except ValueError as e:
+        print(f"Erro: {e}", file=sys.stderr)
+        return 2
+
+    if args.target is None:
+        needs_target = [name for name in args.algorithms or [] if name in TARGET_ALGORITHMS]
+        if needs_target:
+            parser.error(f"{', '.join(needs_target)} exige --target")
+        algorithms = args.algorithms or ALGORITHMS
+    else:
+        algorithms = args.algorithms or ALGORITHMS + TARGET_ALGORITHMS
+
+    jobs = [
+        BatchJob(path, format_type, algorithms, args.starts, args.all_starts, args.target)
+        for path, format_type in (split_format(arg, args.format) for arg in args.files)
+    ]
+    workers = args.workers or os.cpu_count() or 1
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    started = time.perf_counter()
+    runs = errors = steps = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # map preserva a ordem dos arquivos enquanto os processos trabalham em paralelo
+            for results in pool.map(run_job, jobs):
+                for result in results:
+                    output.write(json.dumps(result, ensure_ascii=False, default=str) + '\n')
+                    if 'error' in result:
+                        errors += 1
+                    else:
+                        runs += 1
+                        steps += len(result['visit_order'])
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    print(
+        f"{len(jobs)} arquivos, {runs} travessias ({errors} erros) em {elapsed:.2f}s: "
+        f"{runs / elapsed:.1f} travessias/s, {steps / elapsed:,.0f} nós visitados/s",
+        file=sys.stderr
+    )
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,207 @@
+import cProfile
+import functools
+import io
+import json
+import math
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Instrumentação opcional dos caminhos quentes (parsers, passos dos algoritmos,
+# renderização, envio ao Streamlit). Desativada, cada ponto de medição custa
+# apenas a consulta da instância ativa da thread.
+
+# Histograma de durações em baldes log2: balde i cobre [1 µs·2^(i-1), 1 µs·2^i)
+BUCKET_BASE = 1e-6
+NUM_BUCKETS = 32
+
+
+class PhaseStats:
+    # Estatísticas de uma fase sem guardar cada medida: contagem, soma, extremos e histograma
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.buckets = [0] * NUM_BUCKETS
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        bucket = 0 if seconds < BUCKET_BASE else int(math.log2(seconds / BUCKET_BASE)) + 1
+        self.buckets[min(bucket, NUM_BUCKETS - 1)] += 1
+
+    @staticmethod
+    def bucket_bounds(bucket: int) -> tuple:
+        low = 0.0 if bucket == 0 else BUCKET_BASE * 2 ** (bucket - 1)
+        return low, BUCKET_BASE * 2 ** bucket
+
+    def percentile(self, q: float) -> float:
+        # Aproximado pelo limite superior do balde (limitado pelo máximo observado)
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for bucket, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= target:
+                return min(self.bucket_bounds(bucket)[1], self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'total_seconds': self.total,
+            'mean_seconds': self.total / self.count if self.count else 0.0,
+            'min_seconds': self.min if self.count else 0.0,
+            'p50_seconds': self.percentile(0.5),
+            'p95_seconds': self.percentile(0.95),
+            'max_seconds': self.max,
+            'histogram': [
+                {'low_seconds': low, 'high_seconds': high, 'count': hits}
+                for bucket, hits in enumerate(self.buckets) if hits
+                for low, high in [self.bucket_bounds(bucket)]
+            ]
+        }
+
+
+class Instrumentation:
+    # Coletor de medidas de uma sessão: timers por fase, contadores e cProfile opcional
+
+    def __init__(self):
+        self.phases: Dict[str, PhaseStats] = {}
+        self.counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._profiler: Optional[cProfile.Profile] = None
+        self._has_profile = False
+
+    def record(self, phase: str, seconds: float) -> None:
+        with self._lock:
+            stats = self.phases.get(phase)
+            if stats is None:
+                stats = self.phases[phase] = PhaseStats()
+            stats.add(seconds)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    @contextmanager
+    def timer(self, phase: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(phase, time.perf_counter() - started)
+
+    @contextmanager
+    def profiling(self, enabled: bool = True) -> Iterator[None]:
+        # Capturar cProfile do bloco (acumulado entre capturas até reset())
+        if not enabled:
+            yield
+            return
+        if self._profiler is None:
+            self._profiler = cProfile.Profile()
+        try:
+            self._profiler.enable()
+        except ValueError:
+            # Outro profiler já ativo no processo: seguir sem captura
+            yield
+            return
+        try:
+            yield
+        finally:
+            self._profiler.disable()
+            self._has_profile = True
+
+    def profile_report(self, limit: int = 30, sort: str = 'cumulative') -> str:
+        if not self._has_profile:
+            return ''
+        output = io.StringIO()
+        pstats.Stats(self._profiler, stream=output).sort_stats(sort).print_stats(limit)
+        return output.getvalue()
+
+    def report(self) -> Dict[str, Any]:
+        with self._lock:
+            phases = {name: stats.to_dict() for name, stats in self.phases.items()}
+            counters = dict(self.counters)
+        return {'phases': phases, 'counters': counters, 'profile': self.profile_report()}
+
+    def to_json(self) -> str:
+        return json.dumps(self.report(), indent=2, ensure_ascii=False)
+
+    def summary_rows(self) -> List[Dict[str, Any]]:
+        # Uma linha por fase, em milissegundos, ordenadas pelo tempo total
+        rows = []
+        for name, stats in self.report()['phases'].items():
+            rows.append({
+                'fase': name,
+                'chamadas': stats['count'],
+                'total (ms)': stats['total_seconds'] * 1000,
+                'média (ms)': stats['mean_seconds'] * 1000,
+                'p50 (ms)': stats['p50_seconds'] * 1000,
+                'p95 (ms)': stats['p95_seconds'] * 1000,
+                'máx (ms)': stats['max_seconds'] * 1000
+            })
+        return sorted(rows, key=lambda row: -row['total (ms)'])
+
+    def reset(self) -> None:
+        with self._lock:
+            self.phases.clear()
+            self.counters.clear()
+        self._profiler = None
+        self._has_profile = False
+
+
+# ====== Instância ativa (por thread: cada sessão do Streamlit roda na sua) ======
+
+_active = threading.local()
+
+
+def current() -> Optional[Instrumentation]:
+    return getattr(_active, 'instrumentation', None)
+
+
+@contextmanager
+def use_instrumentation(instrumentation: Optional[Instrumentation]) -> Iterator[Optional[Instrumentation]]:
+    previous = current()
+    _active.instrumentation = instrumentation
+    try:
+        yield instrumentation
+    finally:
+        _active.instrumentation = previous
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    instrumentation = current()
+    if instrumentation is None:
+        yield
+        return
+    with instrumentation.timer(phase):
+        yield
+
+
+def count(name: str, amount: int = 1) -> None:
+    instrumentation = current()
+    if instrumentation is not None:
+        instrumentation.count(name, amount)
+
+
+def instrumented(phase: str) -> Callable:
+    # Decorador: mede cada chamada da função na fase indicada
+    def decorate(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            instrumentation = current()
+            if instrumentation is None:
+                return function(*args, **kwargs)
+            with instrumentation.timer(phase):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorate
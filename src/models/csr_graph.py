@@ -0,0 +1,362 @@
+import hashlib
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+import networkx as nx
+
+
+# Grafos densos (ex.: vindos de matriz de adjacência) com até DENSE_MAX_NODES nós
+# usam as variantes O(V²) vetorizadas de Prim e Dijkstra sobre a matriz de pesos
+DENSE_MIN_DENSITY = 0.25
+DENSE_MAX_NODES = 4000
+
+
+def _index_dtype(n: int):
+    # Ids de nós cabem em int32 na prática; usar int64 apenas quando necessário
+    return np.int32 if n < 2 ** 31 else np.int64
+
+
+def _as_array(values) -> np.ndarray:
+    # Listas Python viram arrays de objetos para não converter rótulos mistos em texto
+    if isinstance(values, (np.ndarray, pd.Series, pd.Index)):
+        return np.asarray(values)
+    values = list(values)
+    array = np.empty(len(values), dtype=object)
+    array[:] = values
+    return array
+
+
+def factorize_appearance(sources, targets, nodes=None) -> Tuple[np.ndarray, List[Any]]:
+    # Internar rótulos em ordem de primeira aparição: `nodes` (opcional, com
+    # repetições) vem primeiro e depois as extremidades intercaladas (origem, destino).
+    # Retorna os códigos das extremidades intercaladas e a lista de rótulos únicos.
+    sources = _as_array(sources)
+    targets = _as_array(targets)
+    if len(sources) != len(targets):
+        raise ValueError("Origens e destinos devem ter o mesmo tamanho")
+
+    interleaved = np.empty(2 * len(sources), dtype=np.result_type(sources, targets))
+    interleaved[0::2] = sources
+    interleaved[1::2] = targets
+
+    if nodes is not None:
+        nodes = _as_array(nodes)
+        appearance = np.concatenate([nodes.astype(object), interleaved.astype(object)])
+        head = len(nodes)
+    else:
+        appearance = interleaved
+        head = 0
+
+    codes, uniques = pd.factorize(appearance, sort=False)
+    return codes[head:], uniques.tolist()
+
+
+class CSRGraph:
+    # Grafo não direcionado compacto compartilhado por parsers e algoritmos.
+    # Rótulos dos nós são internados como ids inteiros (ordem de primeira aparição,
+    # igual à ordem de nós do NetworkX) e a adjacência fica em formato CSR:
+    # vizinhos de u = neighbors[offsets[u]:offsets[u + 1]], na ordem de inserção.
+
+    def __init__(
+        self,
+        labels: List[Any],
+        offsets: np.ndarray,
+        neighbors: np.ndarray,
+        weights: np.ndarray,
+        edge_src: np.ndarray,
+        edge_dst: np.ndarray,
+        edge_weight: np.ndarray
+    ):
+        self.labels = labels
+        self.index: Dict[Any, int] = {label: i for i, label in enumerate(labels)}
+
+        # Adjacência (duas entradas por aresta, uma para laços)
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.weights = weights
+
+        # Arestas únicas na ordem de inserção (usadas pelo adaptador NetworkX)
+        self.edge_src = edge_src
+        self.edge_dst = edge_dst
+        self.edge_weight = edge_weight
+
+        self._lists = None
+        self._dense = None
+        self._mirror = None
+        self._rank = None
+        self._networkx = None
+        self._fingerprint = None
+
+    def __getstate__(self):
+        # Ao enviar para outros processos, não copiar caches reconstruíveis
+        state = self.__dict__.copy()
+        state['_dense'] = None
+        state['_mirror'] = None
+        state['_lists'] = None
+        return state
+
+    def shared_copy(self) -> 'CSRGraph':
+        # Novo objeto sobre os mesmos arrays, rótulos e índice, sem os caches
+        # derivados (listas, matriz densa, espelho, ordem, adaptador NetworkX):
+        # cada usuário do grafo monta e paga pelos seus
+        copy = object.__new__(CSRGraph)
+        copy.__dict__.update(self.__dict__)
+        copy._lists = None
+        copy._dense = None
+        copy._mirror = None
+        copy._rank = None
+        copy._networkx = None
+        return copy
+
+    # ====== Construção ======
+
+    @classmethod
+    def from_ids(cls, labels: List[Any], src: np.ndarray, dst: np.ndarray, weight: np.ndarray) -> 'CSRGraph':
+        # Construir a partir de arestas já internadas, com semântica de nx.Graph.add_edge:
+        # arestas repetidas mantêm a posição da primeira ocorrência e o peso da última
+        n = len(labels)
+        dtype = _index_dtype(n)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        weight = np.asarray(weight, dtype=np.float64)
+
+        if len(src):
+            # Agrupar arestas repetidas; o menor/maior índice de cada grupo dá a
+            # primeira e a última ocorrência sem precisar de ordenação estável
+            key = np.minimum(src, dst) * n + np.maximum(src, dst)
+            by_key = np.argsort(key)
+            sorted_key = key[by_key]
+            starts = np.flatnonzero(np.r_[True, sorted_key[1:] != sorted_key[:-1]])
+            if len(starts) != len(key):
+                first = np.minimum.reduceat(by_key, starts)
+                last = np.maximum.reduceat(by_key, starts)
+                order = np.argsort(first)
+                src, dst, weight = src[first[order]], dst[first[order]], weight[last[order]]
+
+        # Entradas de adjacência nos dois sentidos, intercaladas por aresta e
+        # ordenadas por (origem, ordem de inserção)
+        num_edges = len(src)
+        entry_src = np.empty(2 * num_edges, dtype=np.int64)
+        entry_dst = np.empty(2 * num_edges, dtype=np.int64)
+        entry_src[0::2], entry_src[1::2] = src, dst
+        entry_dst[0::2], entry_dst[1::2] = dst, src
+        entry_edge = np.repeat(np.arange(num_edges, dtype=np.int64), 2)
+
+        # Laços aparecem uma única vez na adjacência
+        keep = np.ones(2 * num_edges, dtype=bool)
+        keep[1::2] = src != dst
+        if not keep.all():
+            entry_src, entry_dst, entry_edge = entry_src[keep], entry_dst[keep], entry_edge[keep]
+        order = np.argsort(entry_src * len(entry_src) + np.arange(len(entry_src)))
+
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(entry_src, minlength=n), out=offsets[1:])
+
+        return cls(
+            labels=labels,
+            offsets=offsets,
+            neighbors=entry_dst[order].astype(dtype),
+            weights=weight[entry_edge[order]],
+            edge_src=src.astype(dtype),
+            edge_dst=dst.astype(dtype),
+            edge_weight=weight
+        )
+
+    @classmethod
+    def from_edges(
+        cls,
+        sources: Iterable,
+        targets: Iterable,
+        weights: Optional[Iterable] = None,
+        nodes: Optional[Iterable] = None
+    ) -> 'CSRGraph':
+        # Construção em lote a partir de colunas de rótulos (ver factorize_appearance)
+        edge_codes, labels = factorize_appearance(sources, targets, nodes)
+        if weights is None:
+            weights = np.ones(len(edge_codes) // 2, dtype=np.float64)
+
+        return cls.from_ids(
+            labels,
+            edge_codes[0::2],
+            edge_codes[1::2],
+            np.asarray(weights, dtype=np.float64)
+        )
+
+    @classmethod
+    def from_networkx(cls, graph: nx.Graph) -> 'CSRGraph':
+        # Preservar exatamente a ordem de nós e de vizinhos do grafo NetworkX
+        labels = list(graph.nodes())
+        index = {label: i for i, label in enumerate(labels)}
+        n = len(labels)
+        dtype = _index_dtype(n)
+        adj = graph.adj
+
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum([len(adj[u]) for u in labels], out=offsets[1:])
+        neighbors = np.fromiter(
+            (index[v] for u in labels for v in adj[u]), dtype=dtype, count=int(offsets[-1])
+        )
+        weights = np.fromiter(
+            (data.get('weight', 1.0) for u in labels for data in adj[u].values()),
+            dtype=np.float64, count=int(offsets[-1])
+        )
+
+        edges = [(index[u], index[v], w) for u, v, w in graph.edges(data='weight', default=1.0)]
+        edge_src = np.fromiter((e[0] for e in edges), dtype=dtype, count=len(edges))
+        edge_dst = np.fromiter((e[1] for e in edges), dtype=dtype, count=len(edges))
+        edge_weight = np.fromiter((e[2] for e in edges), dtype=np.float64, count=len(edges))
+
+        csr = cls(labels, offsets, neighbors, weights, edge_src, edge_dst, edge_weight)
+        csr._networkx = graph
+        return csr
+
+    @classmethod
+    def of(cls, graph) -> 'CSRGraph':
+        # Aceitar tanto CSRGraph quanto nx.Graph nas entradas dos algoritmos
+        if isinstance(graph, CSRGraph):
+            return graph
+        return cls.from_networkx(graph)
+
+    # ====== Consulta ======
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.labels)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.edge_src)
+
+    @property
+    def nbytes(self) -> int:
+        # Estimativa do espaço ocupado pelos arrays (rótulos não incluídos)
+        arrays = (self.offsets, self.neighbors, self.weights, self.edge_src, self.edge_dst, self.edge_weight)
+        return sum(a.nbytes for a in arrays)
+
+    def __contains__(self, node) -> bool:
+        return node in self.index
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def nodes(self) -> List[Any]:
+        return list(self.labels)
+
+    def edges(self) -> List[Tuple[Any, Any]]:
+        labels = self.labels
+        return [(labels[u], labels[v]) for u, v in zip(self.edge_src.tolist(), self.edge_dst.tolist())]
+
+    def neighbor_labels(self, node) -> List[Any]:
+        u = self.index[node]
+        labels = self.labels
+        return [labels[v] for v in self.neighbors[self.offsets[u]:self.offsets[u + 1]].tolist()]
+
+    def weights_between(self, us, vs) -> np.ndarray:
+        # Pesos das arestas (us[i], vs[i]) dados por ids, em lote: busca binária
+        # nas chaves (origem, vizinho) das entradas de adjacência
+        n = max(self.num_nodes, 1)
+        us = np.asarray(us, dtype=np.int64)
+        vs = np.asarray(vs, dtype=np.int64)
+        entry_keys = self.entry_sources() * n + self.neighbors
+        order = np.argsort(entry_keys, kind='stable')
+        sorted_keys = entry_keys[order]
+
+        keys = us * n + vs
+        positions = np.minimum(np.searchsorted(sorted_keys, keys), max(len(sorted_keys) - 1, 0))
+        if len(keys) and (len(sorted_keys) == 0 or (sorted_keys[positions] != keys).any()):
+            raise KeyError("Par de nós sem aresta no grafo")
+        return np.asarray(self.weights)[order[positions]]
+
+    @property
+    def density(self) -> float:
+        # Fração dos pares de nós distintos ligados por uma aresta
+        n = self.num_nodes
+        return 2 * self.num_edges / (n * (n - 1)) if n > 1 else 0.0
+
+    def prefers_dense(self) -> bool:
+        return self.num_nodes <= DENSE_MAX_NODES and self.density >= DENSE_MIN_DENSITY
+
+    def dense_weights(self) -> np.ndarray:
+        # Matriz n x n de pesos (cacheada), inf onde não há aresta; laços ficam de fora
+        if self._dense is None:
+            n = self.num_nodes
+            dense = np.full((n, n), np.inf)
+            src = np.asarray(self.edge_src, dtype=np.int64)
+            dst = np.asarray(self.edge_dst, dtype=np.int64)
+            weight = np.asarray(self.edge_weight, dtype=np.float64)
+            dense[src, dst] = weight
+            dense[dst, src] = weight
+            np.fill_diagonal(dense, np.inf)
+            self._dense = dense
+        return self._dense
+
+    def entry_sources(self) -> np.ndarray:
+        # Origem de cada entrada de adjacência (u de u -> neighbors[i])
+        return np.repeat(np.arange(self.num_nodes, dtype=np.int64), np.diff(self.offsets))
+
+    def mirror_entries(self) -> np.ndarray:
+        # Para cada entrada u -> v, o índice da entrada v -> u (cacheado); laços apontam para si
+        if self._mirror is None:
+            sources = self.entry_sources()
+            targets = np.asarray(self.neighbors, dtype=np.int64)
+            mirror = np.arange(len(targets), dtype=np.int64)
+            # Sem arestas repetidas, cada aresta que não é laço tem exatamente duas
+            # entradas, que ficam vizinhas ao ordenar pelo par (menor, maior)
+            entries = np.flatnonzero(sources != targets)
+            key = np.minimum(sources, targets)[entries] * self.num_nodes + np.maximum(sources, targets)[entries]
+            pairs = entries[np.argsort(key)]
+            mirror[pairs[0::2]] = pairs[1::2]
+            mirror[pairs[1::2]] = pairs[0::2]
+            self._mirror = mirror
+        return self._mirror
+
+    def adjacency_lists(self) -> Tuple[List[int], List[int], List[float]]:
+        # Versões em listas Python (cacheadas) para os laços dos algoritmos,
+        # onde indexar listas é bem mais rápido do que indexar escalares NumPy
+        if self._lists is None:
+            self._lists = (self.offsets.tolist(), self.neighbors.tolist(), self.weights.tolist())
+        return self._lists
+
+    @property
+    def rank(self) -> List[int]:
+        # Posição de cada nó na ordenação dos rótulos, para desempatar filas de
+        # prioridade da mesma forma que as tuplas (peso, rótulo) originais
+        if self._rank is None:
+            labels = self.labels
+            try:
+                order = sorted(range(len(labels)), key=labels.__getitem__)
+            except TypeError:
+                order = sorted(range(len(labels)), key=lambda i: str(labels[i]))
+            rank = [0] * len(labels)
+            for position, node_id in enumerate(order):
+                rank[node_id] = position
+            self._rank = rank
+        return self._rank
+
+    @property
+    def fingerprint(self) -> str:
+        # Hash da estrutura (rótulos e adjacência, sem pesos), estável entre
+        # sessões: identifica o mesmo grafo em caches gravados em disco
+        if self._fingerprint is None:
+            digest = hashlib.sha256()
+            digest.update('\0'.join(map(repr, self.labels)).encode('utf-8'))
+            digest.update(np.ascontiguousarray(self.offsets, dtype=np.int64).tobytes())
+            digest.update(np.ascontiguousarray(self.neighbors, dtype=np.int64).tobytes())
+            self._fingerprint = digest.hexdigest()
+        return self._fingerprint
+
+    # ====== Adaptador ======
+
+    def to_networkx(self) -> nx.Graph:
+        # Grafo NetworkX equivalente (cacheado) para o visualizador
+        if self._networkx is None:
+            labels = self.labels
+            G = nx.Graph()
+            G.add_nodes_from(labels)
+            G.add_weighted_edges_from(zip(
+                [labels[u] for u in self.edge_src.tolist()],
+                [labels[v] for v in self.edge_dst.tolist()],
+                self.edge_weight.tolist()
+            ))
+            self._networkx = G
+        return self._networkx
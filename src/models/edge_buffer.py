@@ -0,0 +1,78 @@
+from typing import Any, Dict, Iterable, List, Optional
+import numpy as np
+from src.models.csr_graph import CSRGraph, factorize_appearance
+
+
+class EdgeBuffer:
+    # Acumulador de arestas para leitura em blocos: rótulos são internados
+    # incrementalmente (ordem de primeira aparição) e as arestas ficam em
+    # arrays NumPy que dobram de capacidade quando enchem.
+
+    def __init__(self, capacity: int = 1024):
+        self.labels: List[Any] = []
+        self.index: Dict[Any, int] = {}
+        self.size = 0
+        self._src = np.empty(capacity, dtype=np.int64)
+        self._dst = np.empty(capacity, dtype=np.int64)
+        self._weight = np.empty(capacity, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.labels)
+
+    def _reserve(self, extra: int) -> None:
+        needed = self.size + extra
+        capacity = len(self._src)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ('_src', '_dst', '_weight'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def _intern(self, uniques: List[Any]) -> np.ndarray:
+        # Mapear os rótulos únicos de um bloco para ids globais
+        index = self.index
+        labels = self.labels
+        found = list(map(index.get, uniques))
+        for i, node_id in enumerate(found):
+            if node_id is None:
+                label = uniques[i]
+                found[i] = index[label] = len(labels)
+                labels.append(label)
+        return np.array(found, dtype=np.int64)
+
+    def add_edges(
+        self,
+        sources: Iterable,
+        targets: Iterable,
+        weights: Optional[Iterable] = None,
+        nodes: Optional[Iterable] = None
+    ) -> None:
+        # Mesma convenção de CSRGraph.from_edges, aplicada bloco a bloco
+        edge_codes, uniques = factorize_appearance(sources, targets, nodes)
+        ids = self._intern(uniques)[edge_codes]
+        count = len(ids) // 2
+        if weights is None:
+            weights = np.ones(count, dtype=np.float64)
+
+        self._reserve(count)
+        end = self.size + count
+        self._src[self.size:end] = ids[0::2]
+        self._dst[self.size:end] = ids[1::2]
+        self._weight[self.size:end] = np.asarray(weights, dtype=np.float64)
+        self.size = end
+
+    def to_csr(self) -> CSRGraph:
+        return CSRGraph.from_ids(
+            list(self.labels),
+            self._src[:self.size],
+            self._dst[:self.size],
+            self._weight[:self.size]
+        )
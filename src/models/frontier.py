@@ -0,0 +1,174 @@
+import heapq
+from array import array
+from bisect import insort
+from collections import deque
+from itertools import islice
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Sequence
+
+# Tipos de fronteira
+FIFO = 'fifo'          # Fila (BFS)
+LIFO = 'lifo'          # Pilha (DFS)
+PRIORITY = 'priority'  # Fila de prioridade (Dijkstra, Prim)
+
+# Nós da fronteira exibidos em cada estado: a visão é mantida a cada operação,
+# então o custo por passo não cresce com o tamanho da fronteira
+DISPLAY_LIMIT = 64
+
+
+class Frontier:
+    # Fronteira de ids de nós com pertinência O(1) (contagem por id) e uma visão
+    # de exibição com os até `display_limit` próximos nós a sair, em ordem.
+    # Na fila de prioridade, os menores itens ficam numa lista ordenada curta e
+    # o restante num heap: push/pop custam O(limite + log n) e a visão, O(limite).
+
+    def __init__(self, kind: str, num_nodes: int, display_limit: int = DISPLAY_LIMIT):
+        if kind not in (FIFO, LIFO, PRIORITY):
+            raise ValueError(f"Tipo de fronteira desconhecido: {kind}")
+        self.kind = kind
+        self.display_limit = max(1, display_limit)
+        self.counts = array('q', [0]) * num_nodes  # Ocorrências de cada id na fronteira
+        self.sequence = 0                          # Desempate final: ordem de inserção
+        self.items = deque()                       # FIFO/LIFO; na prioridade, os menores (ordenados)
+        self.rest: List[tuple] = []                # Prioridade: heap com os demais itens
+
+    def __len__(self) -> int:
+        return len(self.items) + len(self.rest)
+
+    def __contains__(self, node_id: int) -> bool:
+        return self.counts[node_id] > 0
+
+    def push(self, node_id: int, priority: float = 0.0, tiebreak: Any = None) -> None:
+        self.counts[node_id] += 1
+        if self.kind != PRIORITY:
+            self.items.append(node_id)
+            return
+
+        # Mesma ordem das tuplas (prioridade, desempate, nó) do heap do algoritmo
+        item = (priority, tiebreak, self.sequence, node_id)
+        self.sequence += 1
+        top = self.items
+        if len(top) < self.display_limit:
+            insort(top, item)
+        elif item < top[-1]:
+            insort(top, item)
+            heapq.heappush(self.rest, top.pop())
+        else:
+            heapq.heappush(self.rest, item)
+
+    def pop(self) -> int:
+        if self.kind == FIFO:
+            node_id = self.items.popleft()
+        elif self.kind == LIFO:
+            node_id = self.items.pop()
+        else:
+            node_id = self.items.popleft()[3]
+            # Repor a lista curta com o menor do heap (maior que todos os dela)
+            if self.rest:
+                self.items.append(heapq.heappop(self.rest))
+        self.counts[node_id] -= 1
+        return node_id
+
+    def view(self) -> List[int]:
+        # Ids exibidos: início da fila, topo da pilha (de baixo para cima) ou
+        # os menores da fila de prioridade
+        limit = self.display_limit
+        if self.kind == FIFO:
+            return list(islice(self.items, limit))
+        if self.kind == LIFO:
+            return list(islice(reversed(self.items), limit))[::-1]
+        return [item[3] for item in self.items]
+
+    def restore(self, snapshot: tuple) -> None:
+        # Substituir o conteúdo por (sequência, itens, heap restante), no formato
+        # de `items`/`rest`; as contagens saem dos itens, sem varrer todos os nós
+        counts = self.counts
+        priority = self.kind == PRIORITY
+        for item in self._all():
+            counts[item[3] if priority else item] -= 1
+        self.sequence, items, rest = snapshot
+        self.items = deque(items)
+        self.rest = list(rest)
+        for item in self._all():
+            counts[item[3] if priority else item] += 1
+
+    def _all(self) -> Iterator:
+        yield from self.items
+        yield from self.rest
+
+
+class VisitLog:
+    # Sequência só de inserção, com pertinência O(1) por hash (índice criado na
+    # primeira consulta e mantido a partir daí). view() devolve o prefixo atual
+    # sem copiar: estados sucessivos da travessia compartilham a mesma lista.
+
+    def __init__(self, items: Iterable[Hashable] = ()):
+        # Uma lista recebida passa a pertencer ao log (sem cópia)
+        self.items: List[Hashable] = items if isinstance(items, list) else list(items)
+        self._index: Optional[Dict[Hashable, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self.index
+
+    @property
+    def index(self) -> Dict[Hashable, int]:
+        # Posição da primeira ocorrência de cada item
+        if self._index is None:
+            items = self.items
+            self._index = dict(zip(reversed(items), range(len(items) - 1, -1, -1)))
+        return self._index
+
+    def append(self, item: Hashable) -> None:
+        # Acrescentar sem verificar repetição (quem chama garante)
+        if self._index is not None:
+            self._index.setdefault(item, len(self.items))
+        self.items.append(item)
+
+    def add(self, item: Hashable) -> bool:
+        # Acrescentar se ainda não estiver presente; True se foi acrescentado
+        if item in self.index:
+            return False
+        self.append(item)
+        return True
+
+    def view(self) -> 'LogView':
+        return LogView(self, len(self.items))
+
+
+class LogView(Sequence):
+    # Prefixo imutável de um VisitLog (os primeiros `length` itens)
+
+    __slots__ = ('log', 'length')
+
+    def __init__(self, log: VisitLog, length: int):
+        self.log = log
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return self.log.items[slice(*i.indices(self.length))]
+        if i < 0:
+            i += self.length
+        if not 0 <= i < self.length:
+            raise IndexError(i)
+        return self.log.items[i]
+
+    def __iter__(self) -> Iterator:
+        return islice(self.log.items, self.length)
+
+    def __contains__(self, item: Hashable) -> bool:
+        position: Optional[int] = self.log.index.get(item)
+        return position is not None and position < self.length
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LogView, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
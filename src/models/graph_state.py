@@ -1,13 +1,14 @@
 from dataclasses import dataclass
-from typing import List, Any
+from typing import Any, List, Sequence
 import networkx as nx
 
 
 @dataclass
 class GraphState:
-    visited: List[Any]          # Nós visitados até agora
+    visited: Sequence[Any]      # Nós visitados até agora
     current: Any                # Nó atual sendo processado
-    queue_or_stack: List[Any]   # Estado da estrutura de dados auxiliar
+    queue_or_stack: List[Any]   # Estado da estrutura de dados auxiliar (próximos a sair, limitado)
     graph: nx.Graph             # Referência ao grafo NetworkX
     previous: Any = None        # Nó anterior (de onde viemos)
-    visited_edges: List[tuple] = None  # Lista de arestas já percorridas
+    visited_edges: Sequence[tuple] = None  # Arestas já percorridas, sem repetição
+    frontier_size: int = None   # Tamanho total da estrutura auxiliar
@@ -0,0 +1,133 @@
+from dataclasses import dataclass, field
+from typing import Any, List, Optional, Tuple
+import numpy as np
+from src.models.csr_graph import CSRGraph
+
+
+@dataclass
+class TraversalResult:
+    # Resultado final de uma travessia, em arrays de ids (sem estados por passo)
+    graph: CSRGraph
+    start: int
+    order: np.ndarray       # Ids na ordem de visita
+    parent: np.ndarray      # Pai de cada nó na árvore da travessia (-1 = raiz ou não alcançado)
+
+    @property
+    def visited_order(self) -> List[Any]:
+        labels = self.graph.labels
+        return [labels[i] for i in self.order.tolist()]
+
+    @property
+    def reached(self) -> np.ndarray:
+        mask = np.zeros(self.graph.num_nodes, dtype=bool)
+        mask[self.order] = True
+        return mask
+
+    @property
+    def unreachable(self) -> List[Any]:
+        labels = self.graph.labels
+        return [labels[i] for i in np.flatnonzero(~self.reached).tolist()]
+
+    def tree_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Arestas (pai, nó) na ordem em que foram percorridas (raízes não têm pai)
+        nodes = self.order[self.parent[self.order] != -1]
+        return self.parent[nodes], nodes
+
+    def edge_weights(self) -> np.ndarray:
+        sources, targets = self.tree_edges()
+        return self.graph.weights_between(sources, targets)
+
+    @property
+    def total_weight(self) -> float:
+        return float(self.edge_weights().sum())
+
+    def edge_labels(self) -> List[Tuple[Any, Any]]:
+        labels = self.graph.labels
+        sources, targets = self.tree_edges()
+        return [(labels[u], labels[v]) for u, v in zip(sources.tolist(), targets.tolist())]
+
+
+@dataclass
+class BFSResult(TraversalResult):
+    # BFS: a ordem de visita é a concatenação dos níveis; o nível k ocupa
+    # order[level_offsets[k]:level_offsets[k + 1]]
+    level_offsets: np.ndarray = None
+
+    @property
+    def num_levels(self) -> int:
+        return len(self.level_offsets) - 1
+
+    def levels(self) -> List[List[Any]]:
+        labels = self.graph.labels
+        bounds = self.level_offsets.tolist()
+        return [[labels[i] for i in self.order[a:b].tolist()] for a, b in zip(bounds, bounds[1:])]
+
+
+@dataclass
+class ShortestPathResult(TraversalResult):
+    # Dijkstra: distâncias a partir da origem (inf = não alcançado ou não
+    # visitado antes de parar no destino)
+    distances: np.ndarray = None
+    target: Optional[int] = None
+
+    @classmethod
+    def settled(cls, graph: CSRGraph, start: int, order: List[int], previous: List[int],
+                distances: List[float], target: Optional[int] = None) -> 'ShortestPathResult':
+        # Manter só as distâncias definitivas: com parada antecipada, os nós
+        # ainda na fila têm valores provisórios
+        order = np.array(order, dtype=np.int64)
+        parent = np.full(graph.num_nodes, -1, dtype=np.int64)
+        final = np.full(graph.num_nodes, np.inf)
+        parent[order] = np.asarray(previous, dtype=np.int64)[order]
+        final[order] = np.asarray(distances, dtype=np.float64)[order]
+        return cls(graph, start, order, parent, distances=final, target=target)
+
+    @property
+    def predecessors(self) -> np.ndarray:
+        return self.parent
+
+    def distance_to(self, node) -> float:
+        return float(self.distances[self.graph.index[node]])
+
+    def path_to(self, node) -> List[Any]:
+        # Caminho mínimo da origem até `node` (vazio se não alcançável)
+        target = self.graph.index.get(node)
+        if target is None:
+            raise ValueError(f"Nó '{node}' não encontrado no grafo")
+        if not np.isfinite(self.distances[target]):
+            return []
+        path = []
+        while target != -1:
+            path.append(target)
+            target = int(self.parent[target])
+        labels = self.graph.labels
+        return [labels[i] for i in reversed(path)]
+
+    @property
+    def path(self) -> List[Any]:
+        # Caminho até o destino (quando a busca teve um)
+        if self.target is None:
+            return []
+        return self.path_to(self.graph.labels[self.target])
+
+    @property
+    def path_cost(self) -> float:
+        return float(self.distances[self.target]) if self.target is not None else float('nan')
+
+
+@dataclass
+class SpanningTreeResult(TraversalResult):
+    # Árvore (Prim) ou floresta (Kruskal, Borůvka) geradora: arestas na ordem
+    # de inclusão e seus pesos. Sem extremidades explícitas, as arestas saem
+    # dos pais (Prim); numa floresta, uma aresta pode ligar dois nós já visitados.
+    weights: Optional[np.ndarray] = field(default=None)
+    sources: Optional[np.ndarray] = field(default=None)
+    targets: Optional[np.ndarray] = field(default=None)
+
+    def tree_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        if self.sources is None:
+            return super().tree_edges()
+        return self.sources, self.targets
+
+    def edge_weights(self) -> np.ndarray:
+        return self.weights
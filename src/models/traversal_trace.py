@@ -0,0 +1,309 @@
+import time
+from array import array
+from bisect import bisect_right
+from typing import Any, Generator, Iterable, List, Optional, Tuple
+from src.models.frontier import Frontier, VisitLog, LogView, FIFO, LIFO, PRIORITY, DISPLAY_LIMIT
+from src.models.graph_state import GraphState
+from src.instrumentation import instrumented, current
+
+# Passos entre dois checkpoints: acessar um passo qualquer reaplica no máximo
+# esse número de segmentos a partir do checkpoint anterior
+CHECKPOINT_INTERVAL = 256
+
+# Itens de fronteira copiados por checkpoint, no máximo, para cada passo desde
+# o checkpoint anterior: com fronteiras grandes os checkpoints se espaçam e a
+# memória total fica O(passos). A fila (FIFO) é guardada como posições no
+# registro de inserções e não conta.
+CHECKPOINT_FRONTIER_RATIO = 4
+
+
+class TraversalTrace:
+    # Registro compacto de uma travessia: cada passo guarda apenas o que mudou
+    # (nó atual, nó anterior e operações na fronteira) em arrays tipados.
+    # Qualquer GraphState completo pode ser reconstruído sob demanda.
+    # Um passo pode repetir um nó já visitado (ex.: aresta do Kruskal entre duas
+    # árvores): a aresta é registrada e os visitados seguem sem repetição.
+
+    def __init__(
+        self,
+        graph,
+        labels: List[Any],
+        frontier_kind: str = FIFO,
+        order_key: Optional[List[Any]] = None,
+        checkpoint_interval: int = CHECKPOINT_INTERVAL,
+        display_limit: int = DISPLAY_LIMIT
+    ):
+        if frontier_kind not in (FIFO, LIFO, PRIORITY):
+            raise ValueError(f"Tipo de fronteira desconhecido: {frontier_kind}")
+
+        self.graph = graph
+        self.frontier_kind = frontier_kind
+
+        # Tabela de rótulos do grafo: nós são armazenados como ids inteiros
+        self.labels = labels
+
+        # Chave de desempate da fila de prioridade (padrão: o próprio rótulo)
+        self.order_key = order_key if order_key is not None else labels
+
+        # Nós da fronteira exibidos em cada estado (queue_or_stack)
+        self.display_limit = display_limit
+
+        # Um registro por passo (-1 = sem nó anterior)
+        self._current = array('q')
+        self._previous = array('q')
+
+        # Operações na fronteira entre dois passos: inserções seguidas de remoções.
+        # O segmento k contém o que aconteceu antes do passo k ser produzido.
+        self._push_nodes = array('q')
+        self._push_priorities = array('d')
+        self._push_offsets = array('q', [0])
+        self._pop_counts = array('q', [0])
+
+        # Fronteira a cada checkpoint_interval passos ou mais, criada sob
+        # demanda no primeiro acesso aleatório (e estendida se o trace crescer)
+        self.checkpoint_interval = max(1, checkpoint_interval)
+        self._checkpoints: List[tuple] = []
+        self._checkpoint_steps = array('q')
+        self._checkpoint_cursor: Optional['_ReplayCursor'] = None
+
+        # Visitados e arestas de toda a travessia, montados uma vez sob demanda:
+        # o estado do passo k expõe prefixos destes logs (sem cópia)
+        self._visited = VisitLog()
+        self._seen = bytearray(len(labels))  # Ids já presentes em _visited
+        self._visited_edges = VisitLog()
+        self._visited_counts = array('q')    # Tamanho de _visited após cada passo
+        self._edge_counts = array('q')       # Tamanho de _visited_edges após cada passo
+
+    def __len__(self) -> int:
+        return len(self._current)
+
+    def __getstate__(self):
+        # Ao enviar para outros processos, não copiar o que é reconstruível
+        state = self.__dict__.copy()
+        state['_checkpoints'] = []
+        state['_checkpoint_steps'] = array('q')
+        state['_checkpoint_cursor'] = None
+        state['_visited'] = VisitLog()
+        state['_seen'] = bytearray(len(self.labels))
+        state['_visited_edges'] = VisitLog()
+        state['_visited_counts'] = array('q')
+        state['_edge_counts'] = array('q')
+        return state
+
+    # ====== Gravação (chamada pelos algoritmos, com ids de nós) ======
+
+    def push(self, node_id: int, priority: float = 0.0) -> None:
+        self._push_nodes.append(node_id)
+        self._push_priorities.append(priority)
+
+    def pop(self) -> None:
+        self._pop_counts[-1] += 1
+
+    def step(self, current_id: int, previous_id: int = -1) -> None:
+        self._current.append(current_id)
+        self._previous.append(previous_id)
+
+        # Fechar o segmento de operações deste passo e abrir o próximo
+        self._push_offsets.append(len(self._push_nodes))
+        self._pop_counts.append(0)
+
+    # ====== Consulta ======
+
+    @property
+    def step_ids(self) -> Tuple[array, array]:
+        # Ids (atual, anterior) de cada passo, sem converter para rótulos
+        return self._current, self._previous
+
+    @property
+    def visited_order(self) -> List[Any]:
+        self._extend_logs(len(self))
+        return list(self._visited.items)
+
+    @property
+    def visited_edges(self) -> List[tuple]:
+        self._extend_logs(len(self))
+        return list(self._visited_edges.items)
+
+    @instrumented('trace_state')
+    def state(self, step: int) -> GraphState:
+        # Reconstruir o estado de um passo qualquer a partir do checkpoint mais
+        # próximo: reconstrói a fronteira do checkpoint e reaplica os segmentos
+        # até o passo (checkpoint_interval, ou proporcional à fronteira copiada)
+        if step < 0:
+            step += len(self)
+        if not 0 <= step < len(self):
+            raise IndexError(f"Passo {step} fora do intervalo (0 a {len(self) - 1})")
+
+        cursor = self._cursor_at(step)
+        while cursor.position < step:
+            cursor.skip()
+        return cursor.advance()
+
+    def states(self, start: int = 0, stop: Optional[int] = None) -> Generator[GraphState, None, None]:
+        # Estados dos passos [start, stop), sem montar os anteriores a start
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return
+        cursor = self._cursor_at(start)
+        while cursor.position < start:
+            cursor.skip()
+        for _ in range(start, stop):
+            yield cursor.advance()
+
+    def _extend_logs(self, stop: int) -> None:
+        # Acrescentar aos logs os passos [passos já registrados, stop): cada
+        # passo é processado uma única vez em toda a vida do trace
+        labels = self.labels
+        seen = self._seen
+        visited = self._visited
+        visited_edges = self._visited_edges
+        for k in range(len(self._visited_counts), stop):
+            current_id = self._current[k]
+            previous_id = self._previous[k]
+            current = labels[current_id]
+            if not seen[current_id]:
+                seen[current_id] = 1
+                visited.append(current)
+            if previous_id != -1:
+                # Cada passo percorre uma aresta nova: sem verificação de repetição
+                visited_edges.append(tuple(sorted([labels[previous_id], current], key=str)))
+            self._visited_counts.append(len(visited))
+            self._edge_counts.append(len(visited_edges))
+
+    def _cursor_at(self, step: int) -> '_ReplayCursor':
+        # Cursor restaurado do último checkpoint em ou antes de `step`
+        if step == 0:
+            return _ReplayCursor(self)
+
+        if self._checkpoint_cursor is None:
+            self._checkpoint_cursor = _ReplayCursor(self)
+            self._checkpoints.append(self._checkpoint_cursor.snapshot())
+            self._checkpoint_steps.append(0)
+
+        # Estender os checkpoints até o passo pedido. O próximo fica a pelo
+        # menos `interval` passos do anterior e, se a fronteira for grande, a
+        # pelo menos 1/CHECKPOINT_FRONTIER_RATIO do tamanho dela
+        interval = self.checkpoint_interval
+        cursor = self._checkpoint_cursor
+        while cursor.position + interval <= step:
+            last = cursor.position
+            while cursor.position < len(self) and (
+                cursor.position - last < interval
+                or cursor.snapshot_cost() > CHECKPOINT_FRONTIER_RATIO * (cursor.position - last)
+            ):
+                cursor.skip()
+            self._checkpoints.append(cursor.snapshot())
+            self._checkpoint_steps.append(cursor.position)
+
+        checkpoint = bisect_right(self._checkpoint_steps, step) - 1
+        return _ReplayCursor.restore(self, self._checkpoints[checkpoint])
+
+    def follow(self, recording: Iterable) -> Generator[GraphState, None, None]:
+        # Produzir estados à medida que o algoritmo grava cada passo
+        cursor = _ReplayCursor(self)
+        instrumentation = current()
+        if instrumentation is None:
+            for _ in recording:
+                yield cursor.advance()
+            return
+
+        # Instrumentado: tempo do algoritmo até o passo e da montagem do estado
+        started = time.perf_counter()
+        for _ in recording:
+            recorded = time.perf_counter()
+            state = cursor.advance()
+            instrumentation.record('algorithm_step', recorded - started)
+            instrumentation.record('state_replay', time.perf_counter() - recorded)
+            yield state
+            started = time.perf_counter()
+
+
+class _ReplayCursor:
+    # Reaplica os segmentos do trace passo a passo, mantendo apenas a fronteira viva.
+    # Visitados e arestas são prefixos dos logs do trace, compartilhados por
+    # todos os estados: cada passo custa O(1) mais a visão limitada da fronteira.
+
+    def __init__(self, trace: TraversalTrace):
+        self.trace = trace
+        self.position = 0
+        self.frontier = Frontier(trace.frontier_kind, len(trace.labels), trace.display_limit)
+
+    def snapshot_cost(self) -> int:
+        # Itens copiados por snapshot(): a fila é guardada só como posições
+        return 0 if self.trace.frontier_kind == FIFO else len(self.frontier)
+
+    def snapshot(self) -> tuple:
+        # Posição e fronteira em forma compacta, por índice no registro de inserções:
+        # fila = as últimas `tamanho` inserções; pilha = ids dos nós;
+        # prioridade = índices das inserções (a ordem do heap é preservada)
+        frontier = self.frontier
+        kind = self.trace.frontier_kind
+        if kind == FIFO:
+            return self.position, len(frontier)
+        if kind == LIFO:
+            return self.position, array('q', frontier.items)
+        return (
+            self.position,
+            frontier.sequence,
+            array('q', [item[2] for item in frontier.items]),
+            array('q', [item[2] for item in frontier.rest])
+        )
+
+    @classmethod
+    def restore(cls, trace: TraversalTrace, snapshot: tuple) -> '_ReplayCursor':
+        # Custo proporcional ao tamanho da fronteira do checkpoint
+        cursor = cls(trace)
+        cursor.position = position = snapshot[0]
+        kind = trace.frontier_kind
+        if kind == FIFO:
+            pushes = trace._push_offsets[position]
+            cursor.frontier.restore((0, trace._push_nodes[pushes - snapshot[1]:pushes], []))
+        elif kind == LIFO:
+            cursor.frontier.restore((0, snapshot[1], []))
+        else:
+            # Reconstruir as tuplas (prioridade, desempate, inserção, nó) do registro
+            nodes = trace._push_nodes
+            priorities = trace._push_priorities
+            order_key = trace.order_key
+            sequence, top, rest = snapshot[1:]
+            cursor.frontier.restore((
+                sequence,
+                [(priorities[i], order_key[nodes[i]], i, nodes[i]) for i in top],
+                [(priorities[i], order_key[nodes[i]], i, nodes[i]) for i in rest]
+            ))
+        return cursor
+
+    def _apply_segment(self, k: int) -> None:
+        trace = self.trace
+        order_key = trace.order_key
+        frontier = self.frontier
+
+        for i in range(trace._push_offsets[k], trace._push_offsets[k + 1]):
+            node_id = trace._push_nodes[i]
+            # Desempate pelo rótulo, como as tuplas (distância, nó) do heap do algoritmo
+            frontier.push(node_id, trace._push_priorities[i], order_key[node_id])
+
+        for _ in range(trace._pop_counts[k]):
+            frontier.pop()
+
+    def skip(self) -> None:
+        self._apply_segment(self.position)
+        self.position += 1
+
+    def advance(self) -> GraphState:
+        self.skip()
+        trace = self.trace
+        labels = trace.labels
+        k = self.position - 1
+        previous_id = trace._previous[k]
+        trace._extend_logs(self.position)
+
+        return GraphState(
+            visited=LogView(trace._visited, trace._visited_counts[k]),
+            current=labels[trace._current[k]],
+            queue_or_stack=[labels[node_id] for node_id in self.frontier.view()],
+            graph=trace.graph,
+            previous=None if previous_id == -1 else labels[previous_id],
+            visited_edges=LogView(trace._visited_edges, trace._edge_counts[k]),
+            frontier_size=len(self.frontier)
+        )
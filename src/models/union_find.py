@@ -0,0 +1,44 @@
+from array import array
+import numpy as np
+
+
+class UnionFind:
+    # Conjuntos disjuntos sobre ids 0..n-1 em arrays tipados (8 bytes por nó
+    # para o pai, 8 para o tamanho): união por tamanho e compressão de caminho
+
+    def __init__(self, n: int):
+        self.parent = array('q', range(n))
+        self.size = array('q', [1]) * n
+        self.components = n
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        # Divisão do caminho pela metade: cada nó passa a apontar para o avô
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a: int, b: int) -> bool:
+        # Unir os conjuntos de a e b; False se já estavam juntos
+        a = self.find(a)
+        b = self.find(b)
+        if a == b:
+            return False
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.components -= 1
+        return True
+
+    def roots(self) -> np.ndarray:
+        # Raiz de todos os nós de uma vez, comprimindo os caminhos por completo
+        parent = np.frombuffer(self.parent, dtype=np.int64).copy()
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+        self.parent = array('q', parent.tobytes())
+        return parent
@@ -1,6 +1,8 @@
 from .edge_list_parser import EdgeListParser
 from .adjacency_matrix_parser import AdjacencyMatrixParser
 from .adjacency_list_parser import AdjacencyListParser
+from .binary_graph_parser import BinaryGraphParser, save_graph, load_graph, graph_to_archive
+from .graph_cache import GraphCache, get_graph_cache
 
 
 class ParserFactory:
@@ -11,7 +13,8 @@ class ParserFactory:
         format_mapping = {
             "Lista de Arestas": "Edge List",
             "Matriz de Adjacência": "Adjacency Matrix",
-            "Lista de Adjacência": "Adjacency List"
+            "Lista de Adjacência": "Adjacency List",
+            "Grafo Binário": "Binary Graph"
         }
 
         format_key = format_mapping.get(format_type, format_type)
@@ -19,11 +22,16 @@ class ParserFactory:
         parsers = {
             "Edge List": EdgeListParser(),
             "Adjacency Matrix": AdjacencyMatrixParser(),
-            "Adjacency List": AdjacencyListParser()
+            "Adjacency List": AdjacencyListParser(),
+            "Binary Graph": BinaryGraphParser()
         }
         if format_key not in parsers:
             raise ValueError(f"Formato desconhecido: {format_type}")
         return parsers[format_key]
 
 
-__all__ = ['ParserFactory', 'EdgeListParser', 'AdjacencyMatrixParser', 'AdjacencyListParser']
+__all__ = [
+    'ParserFactory', 'EdgeListParser', 'AdjacencyMatrixParser', 'AdjacencyListParser',
+    'BinaryGraphParser', 'save_graph', 'load_graph', 'graph_to_archive',
+    'GraphCache', 'get_graph_cache'
+]
@@ -1,64 +1,61 @@
+import numpy as np
 import pandas as pd
-import networkx as nx
-from .base_parser import BaseParser
+from .base_parser import BaseParser, EdgeTable
 
 
 class AdjacencyListParser(BaseParser):
 
+    empty_message = "Nenhum nó válido encontrado na lista de adjacência"
+
     def validate(self, df: pd.DataFrame) -> None:
         super().validate(df)
         if len(df.columns) < 1:
             raise ValueError("Lista de adjacência deve ter pelo menos 1 coluna (identificador do nó)")
 
-    def parse(self, df: pd.DataFrame) -> nx.Graph:
-        self.validate(df)
-
-        G = nx.Graph()
-
-        node_col = df.columns[0]
-
+    def edge_table(self, df: pd.DataFrame) -> EdgeTable:
         neighbor_cols = df.columns[1:]
         has_weights = (len(neighbor_cols) % 2 == 0) and len(neighbor_cols) > 0
 
-        for _, row in df.iterrows():
-            node = row[node_col]
-
-            if pd.notna(node):
-                G.add_node(node)
-
-                if has_weights:
-                    # Formato com pesos: vizinho1,peso1,vizinho2,peso2,...
-                    for i in range(0, len(neighbor_cols), 2):
-                        neighbor_col = neighbor_cols[i]
-                        weight_col = neighbor_cols[i + 1] if i + 1 < len(neighbor_cols) else None
-
-                        neighbor = row[neighbor_col]
-
-                        if pd.notna(neighbor) and neighbor != '':
-                            neighbor = str(neighbor).strip()
-
-                            if weight_col:
-                                weight = row[weight_col]
-                                try:
-                                    weight = float(weight) if pd.notna(weight) else 1.0
-                                except (ValueError, TypeError):
-                                    weight = 1.0
-                            else:
-                                weight = 1.0
-
-                            if neighbor:
-                                G.add_edge(node, neighbor, weight=weight)
-                else:
-                    # Formato SEM pesos
-                    for col in neighbor_cols:
-                        neighbor = row[col]
-
-                        if pd.notna(neighbor) and neighbor != '':
-                            neighbor = str(neighbor).strip()
-                            if neighbor:
-                                G.add_edge(node, neighbor, weight=1.0)
-
-        if len(G.nodes()) == 0:
-            raise ValueError("Nenhum nó válido encontrado na lista de adjacência")
-
-        return G
+        # Trabalhar sobre o bloco de valores inteiro (mesma conversão de tipos por linha do iterrows)
+        values = df.to_numpy()
+        values = values[pd.notna(values[:, 0])]
+        nodes = values[:, 0]
+
+        if has_weights:
+            # Formato com pesos: vizinho1,peso1,vizinho2,peso2,...
+            neighbor_block = values[:, 1::2]
+            weight_block = values[:, 2::2]
+        else:
+            # Formato SEM pesos
+            neighbor_block = values[:, 1:]
+            weight_block = None
+
+        # Empilhar as colunas de vizinhos em uma tabela longa (linha, posição, vizinho)
+        num_rows, width = neighbor_block.shape
+        row_index = np.repeat(np.arange(num_rows), width)
+        position = np.tile(np.arange(width), num_rows)
+        neighbors = neighbor_block.ravel()
+
+        # Descartar células vazias em lote: NaN, '' e texto só com espaços
+        present = pd.notna(neighbors)
+        stripped = pd.Series(neighbors[present], dtype=object).astype(str).str.strip().to_numpy(dtype=object)
+        keep = np.flatnonzero(present)[stripped != '']
+        targets = stripped[stripped != '']
+        row_index = row_index[keep]
+        position = position[keep]
+
+        if weight_block is not None:
+            # Pesos ausentes ou não numéricos valem 1.0
+            weights = pd.to_numeric(pd.Series(weight_block.ravel()[keep], dtype=object), errors='coerce')
+            weights = weights.fillna(1.0).to_numpy(dtype=np.float64)
+        else:
+            weights = np.ones(len(targets), dtype=np.float64)
+
+        # Ordem de aparição dos nós: cada nó da linha antes dos seus vizinhos
+        appearance_key = np.concatenate([
+            np.arange(num_rows) * (width + 1),
+            row_index * (width + 1) + 1 + position
+        ])
+        appearance = np.concatenate([nodes.astype(object), targets])[np.argsort(appearance_key)]
+
+        return nodes[row_index], targets, weights, appearance
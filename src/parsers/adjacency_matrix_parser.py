@@ -1,46 +1,74 @@
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+import numpy as np
 import pandas as pd
-import networkx as nx
-from .base_parser import BaseParser
+from pandas.api.types import is_numeric_dtype
+from .base_parser import BaseParser, EdgeTable, DEFAULT_CHUNKSIZE
+from src.models.csr_graph import CSRGraph
+from src.models.edge_buffer import EdgeBuffer
+from src.instrumentation import instrumented
 
 
 class AdjacencyMatrixParser(BaseParser):
 
+    empty_message = "Nenhuma aresta válida encontrada na matriz de adjacência"
+
+    # Manter a inferência de tipos nas células: a detecção de rótulos de linha depende dela
+    stream_dtype = None
+
     def validate(self, df: pd.DataFrame) -> None:
         super().validate(df)
+        self._validate_shape(len(df), len(df.columns))
 
-        num_rows = len(df)
-        num_cols = len(df.columns)
-
+    def _validate_shape(self, num_rows: int, num_cols: int) -> None:
         if num_cols != num_rows and num_cols != num_rows + 1:
             raise ValueError(
                 f"Matriz de adjacência deve ser quadrada. Recebido {num_rows} linhas e {num_cols} colunas. "
                 "A matriz deve ter rótulos de nós como índice de linha e cabeçalhos de coluna."
             )
 
-    def parse(self, df: pd.DataFrame) -> nx.Graph:
-
-        self.validate(df)
-
-        G = nx.Graph()
-
+    def _has_row_labels(self, df: pd.DataFrame) -> bool:
         # Verificar se a primeira coluna parece conter rótulos de linha
         first_col = df.columns[0]
-        has_row_labels = (
+        return (
             df[first_col].dtype == 'object' or
             str(first_col).startswith('Unnamed')
         )
 
+    def _col_labels(self, df: pd.DataFrame, has_row_labels: bool) -> List[Any]:
+        if has_row_labels:
+            return df.columns[1:].tolist()
+        # Usar cabeçalhos de coluna como rótulos de linha e coluna
+        return df.columns.tolist()
+
+    def _block(self, df: pd.DataFrame, has_row_labels: bool, row_offset: int, num_labels: int):
+        # Rótulos de linha e dados numéricos de um bloco de linhas da matriz
         if has_row_labels:
             # Usar primeira coluna como rótulos de linha
             row_labels = df.iloc[:, 0].tolist()
-            col_labels = df.columns[1:].tolist()
             matrix_data = df.iloc[:, 1:]
         else:
-            # Usar cabeçalhos de coluna como rótulos de linha e coluna
-            row_labels = df.columns.tolist()
-            col_labels = df.columns.tolist()
+            row_labels = df.columns[row_offset:row_offset + len(df)].tolist()
             matrix_data = df
 
+        # Converter o bloco inteiro para float de uma vez; células não numéricas valem 0
+        matrix_data = matrix_data.iloc[:len(row_labels), :num_labels]
+        if not all(is_numeric_dtype(dtype) for dtype in matrix_data.dtypes):
+            matrix_data = matrix_data.apply(pd.to_numeric, errors='coerce')
+        matrix = matrix_data.to_numpy(dtype=np.float64, na_value=0.0)
+
+        return row_labels, matrix
+
+    def _upper_triangle(self, matrix: np.ndarray, row_offset: int = 0):
+        # Entradas não nulas com i <= j (grafo não direcionado), em ordem de linha;
+        # `row_offset` é o índice global da primeira linha do bloco
+        rows, cols = np.nonzero(np.triu(matrix != 0, k=row_offset))
+        return rows, cols, matrix[rows, cols]
+
+    def _labels_and_matrix(self, df: pd.DataFrame) -> Tuple[List[Any], List[Any], np.ndarray]:
+        has_row_labels = self._has_row_labels(df)
+        col_labels = self._col_labels(df, has_row_labels)
+        row_labels = df.iloc[:, 0].tolist() if has_row_labels else col_labels
+
         # Validar matriz quadrada após extrair rótulos
         if len(row_labels) != len(col_labels):
             raise ValueError(
@@ -48,28 +76,93 @@ class AdjacencyMatrixParser(BaseParser):
                 f"e {len(col_labels)} rótulos de coluna"
             )
 
-        # Criar arestas a partir da matriz
-        for i, row_node in enumerate(row_labels):
-            for j, col_node in enumerate(col_labels):
-                try:
-                    cell_value = matrix_data.iloc[i, j]
-
-                    # Converter para numérico se possível
-                    if pd.notna(cell_value):
-                        try:
-                            cell_value = float(cell_value)
-                        except (ValueError, TypeError):
-                            cell_value = 0
-
-                        # Adicionar aresta se não-zero
-                        if cell_value != 0:
-                            # Para grafo não direcionado
-                            if i <= j:
-                                G.add_edge(row_node, col_node, weight=cell_value)
-                except (IndexError, KeyError):
-                    continue
-
-        if len(G.nodes()) == 0:
-            raise ValueError("Nenhuma aresta válida encontrada na matriz de adjacência")
-
-        return G
+        row_labels, matrix = self._block(df, has_row_labels, 0, len(col_labels))
+        return row_labels, col_labels, matrix
+
+    def edge_table(self, df: pd.DataFrame) -> EdgeTable:
+        row_labels, col_labels, matrix = self._labels_and_matrix(df)
+        rows, cols, weights = self._upper_triangle(matrix)
+
+        sources = pd.Index(row_labels, dtype=object)[rows]
+        targets = pd.Index(col_labels, dtype=object)[cols]
+        return sources, targets, weights, None
+
+    @instrumented('parse_stream')
+    def parse_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        progress: Optional[Callable[[int], None]] = None
+    ) -> CSRGraph:
+        # Cada bloco é uma faixa de linhas; o triângulo superior é tomado em
+        # relação ao índice global da linha. A forma é validada ao final.
+        buffer = EdgeBuffer()
+        rows = 0
+        has_row_labels = None
+        col_labels = None
+
+        for chunk in chunks:
+            if chunk.empty:
+                continue
+            if has_row_labels is None:
+                has_row_labels = self._has_row_labels(chunk)
+                col_labels = pd.Index(self._col_labels(chunk, has_row_labels), dtype=object)
+
+            if rows + len(chunk) > len(chunk.columns):
+                self._validate_shape(rows + len(chunk), len(chunk.columns))
+
+            row_labels, matrix = self._block(chunk, has_row_labels, rows, len(col_labels))
+            block_rows, block_cols, weights = self._upper_triangle(matrix, rows)
+            buffer.add_edges(pd.Index(row_labels, dtype=object)[block_rows], col_labels[block_cols], weights)
+
+            rows += len(chunk)
+            if progress is not None:
+                progress(rows)
+
+        if rows == 0:
+            raise ValueError("Arquivo CSV está vazio")
+        self._validate_shape(rows, len(col_labels) + (1 if has_row_labels else 0))
+        if has_row_labels and rows != len(col_labels):
+            raise ValueError(
+                f"Matriz deve ser quadrada. Recebido {rows} rótulos de linha "
+                f"e {len(col_labels)} rótulos de coluna"
+            )
+        if buffer.num_nodes == 0:
+            raise ValueError(self.empty_message)
+
+        return buffer.to_csr()
+
+    def parse_stream(
+        self,
+        source,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        progress: Optional[Callable[[int], None]] = None
+    ) -> CSRGraph:
+        # Uma coluna de rótulos sem cabeçalho é lida como texto, para que os
+        # rótulos de linha não mudem de tipo entre blocos
+        first_col = pd.read_csv(source, nrows=0).columns[0]
+        if hasattr(source, 'seek'):
+            source.seek(0)
+        dtype = {first_col: str} if str(first_col).startswith('Unnamed') else self.stream_dtype
+
+        chunks = pd.read_csv(source, chunksize=chunksize, dtype=dtype)
+        return self.parse_chunks(chunks, progress)
+
+    def parse_sparse(self, df: pd.DataFrame, format: str = 'coo'):
+        # Conjunto de arestas (triângulo superior) como matriz esparsa do SciPy,
+        # sem passar a matriz densa pelo NetworkX. Retorna (matriz, rótulos de linha, rótulos de coluna).
+        try:
+            from scipy import sparse
+        except ImportError as e:
+            raise ImportError("Saída esparsa requer o pacote 'scipy' (pip install scipy)") from e
+
+        if format not in ('coo', 'csr'):
+            raise ValueError(f"Formato esparso desconhecido: {format}")
+
+        self.validate(df)
+
+        row_labels, col_labels, matrix = self._labels_and_matrix(df)
+        rows, cols, weights = self._upper_triangle(matrix)
+        matrix = sparse.coo_matrix((weights, (rows, cols)), shape=(len(row_labels), len(col_labels)))
+        if format == 'csr':
+            matrix = matrix.tocsr()
+        return matrix, row_labels, col_labels
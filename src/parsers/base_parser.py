@@ -1,14 +1,83 @@
 from abc import ABC, abstractmethod
+from typing import Callable, Iterable, Optional, Tuple
+import numpy as np
 import pandas as pd
 import networkx as nx
+from src.models.csr_graph import CSRGraph
+from src.models.edge_buffer import EdgeBuffer
+from src.instrumentation import instrumented, count
+
+# Tabela de arestas de um bloco de linhas: (origens, destinos, pesos, ordem de aparição dos nós ou None)
+EdgeTable = Tuple[np.ndarray, np.ndarray, np.ndarray, Optional[np.ndarray]]
+
+# Linhas por bloco na leitura em streaming
+DEFAULT_CHUNKSIZE = 100_000
 
 
 class BaseParser(ABC):
 
+    # Mensagem de erro quando nenhum nó/aresta válido é encontrado
+    empty_message = "Nenhuma aresta válida encontrada no arquivo CSV"
+
+    # Tipo das colunas na leitura em blocos: texto, para que o mesmo rótulo não
+    # mude de tipo entre blocos (o pandas infere os tipos bloco a bloco)
+    stream_dtype = str
+
     @abstractmethod
-    def parse(self, df: pd.DataFrame) -> nx.Graph:
+    def edge_table(self, df: pd.DataFrame) -> EdgeTable:
         pass
 
+    @instrumented('parse')
+    def parse_csr(self, df: pd.DataFrame) -> CSRGraph:
+        self.validate(df)
+
+        sources, targets, weights, nodes = self.edge_table(df)
+        if len(sources) == 0 and (nodes is None or len(nodes) == 0):
+            raise ValueError(self.empty_message)
+
+        count('parsed_edges', len(sources))
+        return CSRGraph.from_edges(sources, targets, weights, nodes=nodes)
+
+    def parse(self, df: pd.DataFrame) -> nx.Graph:
+        return self.parse_csr(df).to_networkx()
+
+    @instrumented('parse_stream')
+    def parse_chunks(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        progress: Optional[Callable[[int], None]] = None
+    ) -> CSRGraph:
+        # Leitura em blocos: cada bloco vira uma tabela de arestas acumulada em um
+        # EdgeBuffer, então só um bloco do CSV fica em memória por vez.
+        # `progress` recebe o total de linhas processadas após cada bloco.
+        buffer = EdgeBuffer()
+        rows = 0
+
+        for chunk in chunks:
+            self.validate(chunk)
+            buffer.add_edges(*self.edge_table(chunk))
+            rows += len(chunk)
+            count('parsed_chunks')
+            if progress is not None:
+                progress(rows)
+
+        if rows == 0:
+            raise ValueError("Arquivo CSV está vazio")
+        if buffer.num_nodes == 0:
+            raise ValueError(self.empty_message)
+
+        return buffer.to_csr()
+
+    def parse_stream(
+        self,
+        source,
+        chunksize: int = DEFAULT_CHUNKSIZE,
+        progress: Optional[Callable[[int], None]] = None
+    ) -> CSRGraph:
+        # Ler um CSV (caminho ou arquivo) em blocos de `chunksize` linhas
+        chunks = pd.read_csv(source, chunksize=chunksize, dtype=self.stream_dtype)
+        return self.parse_chunks(chunks, progress)
+
     def validate(self, df: pd.DataFrame) -> None:
         if df.empty:
             raise ValueError("Arquivo CSV está vazio")
@@ -0,0 +1,102 @@
+import io
+import json
+import os
+import tempfile
+import zipfile
+from typing import Any
+import numpy as np
+from src.models.csr_graph import CSRGraph
+from src.instrumentation import instrumented
+
+# Formato binário nativo: um diretório com um .npy por array do CSR
+# (carregados com np.load(mmap_mode='r'), sem cópia) e a tabela de rótulos
+FORMAT_VERSION = 1
+ARRAY_NAMES = ('offsets', 'neighbors', 'weights', 'edge_src', 'edge_dst', 'edge_weight')
+LABELS_FILE = 'labels.json'
+META_FILE = 'meta.json'
+MEMBER_NAMES = tuple(f"{name}.npy" for name in ARRAY_NAMES) + (LABELS_FILE, META_FILE)
+
+
+def _plain_label(label) -> Any:
+    # Rótulos viram tipos JSON nativos; outros tipos são gravados como texto
+    if isinstance(label, np.generic):
+        label = label.item()
+    if isinstance(label, (str, int, float, bool)):
+        return label
+    return str(label)
+
+
+def save_graph(graph: CSRGraph, path: str) -> None:
+    os.makedirs(path, exist_ok=True)
+    for name in ARRAY_NAMES:
+        np.save(os.path.join(path, f"{name}.npy"), np.ascontiguousarray(getattr(graph, name)))
+
+    with open(os.path.join(path, LABELS_FILE), 'w', encoding='utf-8') as f:
+        json.dump([_plain_label(label) for label in graph.labels], f, ensure_ascii=False)
+
+    with open(os.path.join(path, META_FILE), 'w', encoding='utf-8') as f:
+        json.dump({
+            'version': FORMAT_VERSION,
+            'num_nodes': graph.num_nodes,
+            'num_edges': graph.num_edges
+        }, f)
+
+
+def load_graph(path: str, mmap: bool = True) -> CSRGraph:
+    missing = [name for name in MEMBER_NAMES if not os.path.exists(os.path.join(path, name))]
+    if missing:
+        raise ValueError(f"Grafo binário inválido: arquivos ausentes ({', '.join(missing)})")
+
+    with open(os.path.join(path, META_FILE), encoding='utf-8') as f:
+        meta = json.load(f)
+    if meta.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Versão do grafo binário não suportada: {meta.get('version')}")
+
+    with open(os.path.join(path, LABELS_FILE), encoding='utf-8') as f:
+        labels = json.load(f)
+
+    mmap_mode = 'r' if mmap else None
+    arrays = [np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode) for name in ARRAY_NAMES]
+
+    if len(labels) != meta['num_nodes'] or len(arrays[0]) != len(labels) + 1:
+        raise ValueError("Grafo binário inválido: tabela de rótulos não corresponde aos arrays")
+
+    return CSRGraph(labels, *arrays)
+
+
+def graph_to_archive(graph: CSRGraph) -> bytes:
+    # Empacotar o diretório do formato em um .zip (sem compressão) para download/upload
+    buffer = io.BytesIO()
+    with tempfile.TemporaryDirectory() as directory:
+        save_graph(graph, directory)
+        with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED) as archive:
+            for name in MEMBER_NAMES:
+                archive.write(os.path.join(directory, name), arcname=name)
+    return buffer.getvalue()
+
+
+class BinaryGraphParser:
+    # Formato binário nativo: lê um diretório salvo por save_graph (mapeado em
+    # memória) ou um .zip gerado por graph_to_archive (extraído para um diretório
+    # temporário, carregado em memória e removido em seguida)
+
+    @instrumented('parse_binary')
+    def parse_file(self, source) -> CSRGraph:
+        if isinstance(source, (str, os.PathLike)) and os.path.isdir(source):
+            return load_graph(source)
+
+        try:
+            with zipfile.ZipFile(source) as archive:
+                names = set(archive.namelist())
+                missing = [name for name in MEMBER_NAMES if name not in names]
+                if missing:
+                    raise ValueError(f"Grafo binário inválido: arquivos ausentes ({', '.join(missing)})")
+
+                with tempfile.TemporaryDirectory(prefix='graph_binary_') as directory:
+                    # Extrair apenas os membros conhecidos (nunca caminhos arbitrários)
+                    for name in MEMBER_NAMES:
+                        archive.extract(name, directory)
+                    # Sem mapeamento: os arrays precisam sobreviver ao diretório
+                    return load_graph(directory, mmap=False)
+        except zipfile.BadZipFile as e:
+            raise ValueError("Arquivo não é um grafo binário (.zip) válido") from e
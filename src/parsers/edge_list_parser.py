@@ -1,6 +1,6 @@
+import numpy as np
 import pandas as pd
-import networkx as nx
-from .base_parser import BaseParser
+from .base_parser import BaseParser, EdgeTable
 
 
 class EdgeListParser(BaseParser):
@@ -10,34 +10,22 @@ class EdgeListParser(BaseParser):
         if len(df.columns) < 2:
             raise ValueError("Lista de arestas deve ter pelo menos 2 colunas (origem, destino)")
 
-    def parse(self, df: pd.DataFrame) -> nx.Graph:
-        self.validate(df)
-
-        G = nx.Graph()
-
+    def edge_table(self, df: pd.DataFrame) -> EdgeTable:
         source_col = df.columns[0]
         target_col = df.columns[1]
 
         has_weight = len(df.columns) >= 3
         weight_col = df.columns[2] if has_weight else None
 
-        for _, row in df.iterrows():
-            source = row[source_col]
-            target = row[target_col]
-
-            if pd.notna(source) and pd.notna(target):
-                if has_weight:
-                    weight = row[weight_col]
-                    try:
-                        weight = float(weight) if pd.notna(weight) else 1.0
-                    except (ValueError, TypeError):
-                        weight = 1.0
-                else:
-                    weight = 1.0
-
-                G.add_edge(source, target, weight=weight)
+        # Descartar linhas sem origem ou destino (operação por coluna, sem iterrows)
+        valid = (df[source_col].notna() & df[target_col].notna()).to_numpy()
+        sources = df[source_col].to_numpy()[valid]
+        targets = df[target_col].to_numpy()[valid]
 
-        if len(G.nodes()) == 0:
-            raise ValueError("Nenhuma aresta válida encontrada no arquivo CSV")
+        if has_weight:
+            # Pesos ausentes ou não numéricos valem 1.0
+            weights = pd.to_numeric(df[weight_col], errors='coerce').fillna(1.0).to_numpy(dtype=np.float64)[valid]
+        else:
+            weights = np.ones(len(sources), dtype=np.float64)
 
-        return G
+        return sources, targets, weights, None
@@ -0,0 +1,174 @@
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+from src.models.csr_graph import CSRGraph
+from src.instrumentation import count
+from .binary_graph_parser import save_graph, load_graph
+
+# Orçamento padrão de memória do cache (MB) e variáveis de ambiente de configuração
+DEFAULT_MAX_MB = 512
+ENV_MAX_MB = 'GRAPH_CACHE_MB'
+ENV_DIRECTORY = 'GRAPH_CACHE_DIR'
+
+CacheKey = Tuple[str, str]
+
+
+def _estimate_size(graph: CSRGraph) -> int:
+    # Arrays do CSR mais rótulos e o índice rótulo -> id (o cache guarda o grafo
+    # sem caches derivados, então isto é tudo o que ele ocupa)
+    labels = sum(sys.getsizeof(label) for label in graph.labels)
+    return graph.nbytes + labels + sys.getsizeof(graph.labels) + sys.getsizeof(graph.index)
+
+
+class GraphCache:
+    # Cache LRU de grafos já processados, compartilhado pelo processo inteiro.
+    # A chave é (hash SHA-256 do conteúdo do arquivo, formato e variante do
+    # parser). Opcionalmente os grafos também são gravados em um diretório local,
+    # compartilhado entre sessões e usuários do Streamlit.
+    # O cache guarda cópias sem caches derivados (CSRGraph.shared_copy) e entrega
+    # uma cópia nova a cada acesso: os caches montados por quem usa o grafo
+    # (listas, matriz densa, adaptador NetworkX) não escapam do orçamento.
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024, directory: Optional[str] = None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: 'OrderedDict[CacheKey, Tuple[CSRGraph, int]]' = OrderedDict()
+        self._lock = threading.Lock()  # Sessões do Streamlit rodam em threads
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(content: bytes, format_type: str, variant: str = '') -> CacheKey:
+        # variant distingue caminhos do parser que dão grafos diferentes para o
+        # mesmo arquivo (ex.: leitura em blocos devolve rótulos numéricos como texto)
+        return hashlib.sha256(content).hexdigest(), f"{format_type}:{variant}" if variant else format_type
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: CacheKey) -> bool:
+        return key in self._entries
+
+    # ====== Memória ======
+
+    def get(self, key: CacheKey) -> Optional[CSRGraph]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0].shared_copy()
+
+        graph = self._load(key)
+        if graph is not None:
+            self._remember(key, graph)
+            with self._lock:
+                self.hits += 1
+            return graph.shared_copy()
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: CacheKey, graph: CSRGraph) -> None:
+        self._remember(key, graph)
+        self._store(key, graph)
+
+    def get_or_parse(
+        self, content: bytes, format_type: str, parse: Callable[[], CSRGraph], variant: str = ''
+    ) -> Tuple[CSRGraph, bool]:
+        # Retorna (grafo, veio_do_cache)
+        key = self.key(content, format_type, variant)
+        graph = self.get(key)
+        if graph is not None:
+            count('graph_cache_hits')
+            return graph, True
+        count('graph_cache_misses')
+
+        graph = parse()
+        self.put(key, graph)
+        return graph, False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def _remember(self, key: CacheKey, graph: CSRGraph) -> None:
+        graph = graph.shared_copy()
+        size = _estimate_size(graph)
+        with self._lock:
+            if key in self._entries:
+                self.current_bytes -= self._entries.pop(key)[1]
+
+            # Grafos maiores que o orçamento inteiro não ficam em memória
+            if size > self.max_bytes:
+                return
+
+            self._entries[key] = (graph, size)
+            self.current_bytes += size
+
+            # Remover os menos usados recentemente até caber no orçamento
+            while self.current_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.current_bytes -= evicted_size
+
+    # ====== Disco ======
+
+    def _path(self, key: CacheKey) -> str:
+        content_hash, format_type = key
+        format_slug = hashlib.sha1(format_type.encode('utf-8')).hexdigest()[:8]
+        return os.path.join(self.directory, f"{content_hash}_{format_slug}")
+
+    def _load(self, key: CacheKey) -> Optional[CSRGraph]:
+        # Grafos persistidos no formato binário nativo, mapeados em memória
+        if not self.directory:
+            return None
+        path = self._path(key)
+        if not os.path.isdir(path):
+            return None
+        try:
+            return load_graph(path)
+        except (OSError, ValueError):
+            return None
+
+    def _store(self, key: CacheKey, graph: CSRGraph) -> None:
+        if not self.directory:
+            return
+        path = self._path(key)
+        if os.path.isdir(path):
+            return
+
+        # Escrita atômica: gravar em um diretório temporário e renomear, para que
+        # outro processo nunca leia um grafo pela metade
+        tmp_path = tempfile.mkdtemp(dir=self.directory, suffix='.tmp')
+        try:
+            save_graph(graph, tmp_path)
+            os.replace(tmp_path, path)
+        except OSError:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+_default_cache: Optional[GraphCache] = None
+_default_lock = threading.Lock()
+
+
+def get_graph_cache() -> GraphCache:
+    # Instância única por processo, configurada por GRAPH_CACHE_MB e GRAPH_CACHE_DIR
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            max_mb = float(os.environ.get(ENV_MAX_MB, DEFAULT_MAX_MB))
+            directory = os.environ.get(ENV_DIRECTORY) or None
+            _default_cache = GraphCache(int(max_mb * 1024 * 1024), directory)
+        return _default_cache
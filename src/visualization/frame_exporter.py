@@ -0,0 +1,161 @@
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, Union
+import networkx as nx
+from src.algorithms import AlgorithmFactory, EuclideanHeuristic
+from src.models.csr_graph import CSRGraph
+from src.models.traversal_trace import TraversalTrace
+from src.visualization.graph_visualizer import GraphVisualizer
+from src.visualization.layout_engine import compute_layout
+
+# Formatos de saída suportados
+GIF = 'gif'
+MP4 = 'mp4'
+PNG = 'png'
+
+FRAME_PATTERN = 'frame_{:05d}.png'
+FFMPEG_PATTERN = 'frame_%05d.png'
+
+# Blocos por processo: mais blocos que processos equilibram a carga
+CHUNKS_PER_WORKER = 4
+
+
+@dataclass
+class ExportResult:
+    path: str      # Arquivo (.gif/.mp4) ou diretório com a sequência de PNGs
+    format: str    # Formato efetivamente gerado (MP4 cai para PNG sem codificador)
+    frames: int
+
+
+# ====== Processos de renderização ======
+
+_worker_graph: Optional[nx.Graph] = None
+_worker_trace: Optional[TraversalTrace] = None
+_worker_visualizer: Optional[GraphVisualizer] = None
+
+
+def _init_worker(trace: TraversalTrace, layout: Dict) -> None:
+    # Cada processo mantém seu próprio visualizador (figura persistente), com o
+    # layout calculado uma única vez pelo processo principal
+    global _worker_graph, _worker_trace, _worker_visualizer
+    _worker_trace = trace
+    _worker_graph = trace.graph.to_networkx()
+    _worker_visualizer = GraphVisualizer()
+    _worker_visualizer.layout = layout
+
+
+def _render_chunk(start: int, stop: int, directory: str) -> int:
+    from PIL import Image
+
+    # Quadros consecutivos no mesmo processo aproveitam o redesenho incremental
+    for step, state in enumerate(_worker_trace.states(start, stop), start):
+        frame = _worker_visualizer.render_frame(_worker_graph, state)
+        Image.fromarray(frame).convert('RGB').save(os.path.join(directory, FRAME_PATTERN.format(step)))
+    return stop - start
+
+
+# ====== Pipeline ======
+
+def find_encoder() -> Optional[str]:
+    # Codificador de vídeo local (ffmpeg), se instalado
+    return shutil.which('ffmpeg')
+
+
+def _chunks(total: int, workers: int) -> List[Tuple[int, int]]:
+    size = max(1, -(-total // (workers * CHUNKS_PER_WORKER)))
+    return [(start, min(start + size, total)) for start in range(0, total, size)]
+
+
+def _write_gif(directory: str, frames: int, output_path: str, fps: float) -> None:
+    from PIL import Image
+
+    def images():
+        for step in range(1, frames):
+            yield Image.open(os.path.join(directory, FRAME_PATTERN.format(step)))
+
+    first = Image.open(os.path.join(directory, FRAME_PATTERN.format(0)))
+    first.save(
+        output_path,
+        save_all=True,
+        append_images=images(),
+        duration=int(1000 / fps),
+        loop=0
+    )
+
+
+def _write_mp4(encoder: str, directory: str, output_path: str, fps: float) -> None:
+    subprocess.run(
+        [
+            encoder, '-y', '-loglevel', 'error',
+            '-framerate', str(fps),
+            '-i', os.path.join(directory, FFMPEG_PATTERN),
+            '-c:v', 'libx264', '-pix_fmt', 'yuv420p',
+            '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2',  # yuv420p exige dimensões pares
+            output_path
+        ],
+        check=True
+    )
+
+
+def export_animation(
+    graph: Union[nx.Graph, CSRGraph],
+    algorithm_type: str,
+    start_node,
+    output_path: str,
+    format: str = GIF,
+    fps: float = 2.0,
+    layout_type: str = "Automático",
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+    target=None
+) -> ExportResult:
+    # Gravar a animação completa de uma travessia: o trace é calculado uma vez
+    # e os quadros são renderizados em paralelo, um visualizador por processo.
+    # Para PNG, output_path é o diretório da sequência.
+    if format not in (GIF, MP4, PNG):
+        raise ValueError(f"Formato de exportação desconhecido: {format}")
+
+    csr = CSRGraph.of(graph)
+    positions = compute_layout(csr, layout_type)
+    layout = dict(zip(csr.labels, positions))
+
+    # Destino opcional (caminho mínimo ponto a ponto); o A* usa as posições do layout
+    algorithm = AlgorithmFactory.create_algorithm(algorithm_type, target, EuclideanHeuristic(positions))
+    trace = algorithm.build_trace(csr, start_node)
+    trace.graph = csr  # Os processos reconstroem o grafo NetworkX a partir do CSR
+    total = len(trace)
+    workers = workers or os.cpu_count() or 1
+
+    encoder = find_encoder() if format == MP4 else None
+    if format == MP4 and encoder is None:
+        format = PNG  # Sem codificador de vídeo: entregar a sequência de quadros
+        output_path = os.path.splitext(output_path)[0]
+
+    if format == PNG:
+        os.makedirs(output_path, exist_ok=True)
+        directory = output_path
+    else:
+        directory = tempfile.mkdtemp(prefix='graph_frames_')
+
+    try:
+        done = 0
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(trace, layout)) as pool:
+            futures = [pool.submit(_render_chunk, start, stop, directory) for start, stop in _chunks(total, workers)]
+            for future in as_completed(futures):
+                done += future.result()
+                if progress is not None:
+                    progress(done, total)
+
+        if format == GIF:
+            _write_gif(directory, total, output_path, fps)
+        elif format == MP4:
+            _write_mp4(encoder, directory, output_path, fps)
+    finally:
+        if directory != output_path:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    return ExportResult(path=output_path, format=format, frames=total)
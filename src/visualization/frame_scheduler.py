@@ -0,0 +1,65 @@
+import math
+import time
+from typing import Optional, Tuple
+
+
+class FrameScheduler:
+    # Ritmo da animação em tempo real. Mede o custo real de cada quadro
+    # (renderização e reexecução, sem contar a pausa) e, quando ele passa do
+    # tempo alvo por passo, agrupa vários passos do algoritmo em um único quadro
+    # e dispensa a pausa, mantendo o ritmo pedido.
+
+    def __init__(self, smoothing: float = 0.3):
+        self.smoothing = smoothing          # Peso da última medida na média móvel
+        self.latency: Optional[float] = None
+        self.stride = 1                     # Passos avançados por quadro
+        self._frame_start: Optional[float] = None
+        self._last_sleep = 0.0
+        self._continuous = False
+
+    @staticmethod
+    def step_time(total_steps: int, speed_interval: float, target_duration: Optional[float] = None) -> float:
+        # Tempo alvo por passo: duração total dividida pelos passos ou a pausa da velocidade
+        if target_duration:
+            return target_duration / max(total_steps, 1)
+        return speed_interval
+
+    def reset(self) -> None:
+        # Pausa ou salto no slider: o próximo intervalo entre quadros não é uma medida válida
+        self._frame_start = None
+        self._continuous = False
+
+    def begin_frame(self, now: Optional[float] = None) -> None:
+        now = time.perf_counter() if now is None else now
+        if self._continuous and self._frame_start is not None:
+            self._record(now - self._frame_start - self._last_sleep)
+        self._frame_start = now
+        self._continuous = False
+
+    def end_frame(self, step_time: float, now: Optional[float] = None) -> Tuple[int, float]:
+        # Retorna (passos a avançar, segundos de pausa) para o próximo quadro
+        now = time.perf_counter() if now is None else now
+        if self.latency is None and self._frame_start is not None:
+            self._record(now - self._frame_start)  # Primeiro quadro: só a renderização
+
+        cost = self.latency or 0.0
+        if step_time <= 0:
+            stride, pause = 1, 0.0
+        elif cost <= step_time:
+            stride, pause = 1, step_time - cost
+        else:
+            # Atrasado: agrupar passos; a pausa só completa o que sobrar do orçamento
+            stride = math.ceil(cost / step_time)
+            pause = max(0.0, stride * step_time - cost)
+
+        self.stride = stride
+        self._last_sleep = pause
+        self._continuous = True
+        return stride, pause
+
+    def _record(self, latency: float) -> None:
+        latency = max(latency, 0.0)
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.smoothing * (latency - self.latency)
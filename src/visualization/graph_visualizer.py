@@ -1,12 +1,105 @@
+import math
+from typing import List, Optional
+import numpy as np
 import networkx as nx
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.colors import to_rgba_array
 from matplotlib.figure import Figure
+from matplotlib.transforms import Bbox
+from src.models.csr_graph import CSRGraph
 from src.models.graph_state import GraphState
+from src.visualization.layout_engine import compute_layout
+from src.visualization.lod_scene import LODScene
+from src.instrumentation import instrumented, count
+
+# Códigos de estado usados para indexar as paletas de cores/espessuras
+UNVISITED, VISITED, CURRENT = 0, 1, 2
+
+NODE_SIZE = 700
+EDGE_WIDTHS = np.array([1.5, 2.5, 4.0])
+
+# Acima destes tamanhos, rótulos de nós e de pesos não são desenhados
+LABEL_MAX_NODES = 200
+LABEL_MAX_EDGES = 200
+
+# A partir deste número de nós, a cena usa nível de detalhe (LODScene)
+LOD_MIN_NODES = 5000
+
+# Fração máxima da figura redesenhada por regiões antes de cair no desenho completo
+BLIT_MAX_AREA = 0.4
+
+
+def _node_size(num_nodes: int) -> float:
+    # Tamanho dos nós (pt²): NODE_SIZE até 100 nós, depois encolhendo com a contagem
+    return max(NODE_SIZE * min(1.0, 100 / max(num_nodes, 1)), 20.0)
+
+
+def _merge_boxes(boxes: List[np.ndarray]) -> List[np.ndarray]:
+    # Unir regiões sobrepostas para que nenhum artista seja redesenhado duas vezes
+    merged = []
+    for box in boxes:
+        box = box.copy()
+        overlapping = True
+        while overlapping:
+            overlapping = False
+            for i, other in enumerate(merged):
+                if box[0] < other[2] and other[0] < box[2] and box[1] < other[3] and other[1] < box[3]:
+                    box = np.array([min(box[0], other[0]), min(box[1], other[1]),
+                                    max(box[2], other[2]), max(box[3], other[3])])
+                    merged.pop(i)
+                    overlapping = True
+                    break
+        merged.append(box)
+    return merged
+
+
+class _Scene:
+    # Figura e artistas de um grafo, construídos uma única vez
+
+    def __init__(self, graph: nx.Graph, fig: Figure, ax, nodes: List, edges: List, node_artist, edge_artist, texts,
+                 node_size: float = NODE_SIZE):
+        self.graph = graph
+        self.node_size = node_size
+        self.fig = fig
+        self.ax = ax
+        self.nodes = nodes
+        self.node_index = {node: i for i, node in enumerate(nodes)}
+        self.edges = edges
+
+        # Aresta -> índice no LineCollection, nos dois sentidos: dispensa
+        # normalizar (sorted por str) as arestas a cada quadro
+        self.edge_index = {}
+        for i, (u, v) in enumerate(edges):
+            self.edge_index[(u, v)] = i
+            self.edge_index[(v, u)] = i
+
+        self.node_artist = node_artist
+        self.edge_artist = edge_artist
+        self.texts = texts
+
+        self.node_codes = np.full(len(nodes), -1, dtype=np.int8)
+        self.edge_codes = np.full(len(edges), -1, dtype=np.int8)
+
+        # Artistas dinâmicos na ordem de desenho dos eixos (zorder, depois inserção)
+        dynamic = {id(artist) for artist in [node_artist, edge_artist] + texts if artist is not None}
+        self.layers = sorted(
+            [artist for artist in ax.get_children() if id(artist) in dynamic],
+            key=lambda artist: artist.get_zorder()
+        )
+
+        # Preenchidos no primeiro desenho completo (coordenadas de tela)
+        self.background = None
+        self.node_px = None
+        self.edge_px = None
+        self.layer_boxes = None
+        self.title_box = None
 
 
 class GraphVisualizer:
-    def __init__(self):
+    def __init__(self, layout_type: str = "Automático", level_of_detail: Optional[bool] = None):
         self.layout = None  # Cachear layout para consistência
+        self.layout_type = layout_type  # Algoritmo de layout (ver LayoutFactory)
+        self.level_of_detail = level_of_detail  # None = automático (a partir de LOD_MIN_NODES nós)
         self.node_colors = {
             'unvisited': '#D3D3D3',   # Cinza claro
             'visited': '#87CEEB',     # Azul céu
@@ -17,77 +110,70 @@ class GraphVisualizer:
             'visited': '#87CEEB',     # Azul céu (combinando com nós visitados)
             'current': '#00FF00'      # Verde brilhante
         }
+        self._scene = None  # _Scene ou LODScene
 
-    def render(self, graph: nx.Graph, state: GraphState) -> Figure:
-        # Calcular layout uma vez e cachear
+    # ====== Construção da cena (uma vez por grafo) ======
+
+    def uses_level_of_detail(self, graph: nx.Graph) -> bool:
+        if self.level_of_detail is not None:
+            return self.level_of_detail
+        return graph.number_of_nodes() >= LOD_MIN_NODES
+
+    @instrumented('scene_build')
+    def _build_scene(self, graph: nx.Graph):
+        # Calcular layout uma vez e cachear (também em disco, pelo hash do grafo)
         if self.layout is None:
-            self.layout = nx.spring_layout(graph, seed=42)
-
-        # Mapear nós para cores baseado no estado
-        node_colors = []
-        for node in graph.nodes():
-            if node == state.current:
-                node_colors.append(self.node_colors['current'])
-            elif node in state.visited:
-                node_colors.append(self.node_colors['visited'])
-            else:
-                node_colors.append(self.node_colors['unvisited'])
-
-        # Criar figura
-        fig, ax = plt.subplots(figsize=(10, 9))
-
-        # Mapear arestas para cores e espessuras baseado no estado
-        edge_colors = []
-        edge_widths = []
-
-        for edge in graph.edges():
-            edge_normalized = tuple(sorted(edge, key=str))  # Normalizar para grafo não direcionado
-
-            # Verificar se esta é a aresta atual sendo percorrida
-            if state.previous is not None:
-                current_edge = tuple(sorted([state.previous, state.current], key=str))
-                if edge_normalized == current_edge:
-                    edge_colors.append(self.edge_colors['current'])  # Verde para aresta atual
-                    edge_widths.append(4.0)  # Mais espessa
-                    continue
-
-            # Verificar se a aresta foi visitada
-            if state.visited_edges and edge_normalized in [tuple(sorted(e, key=str)) for e in state.visited_edges]:
-                edge_colors.append(self.edge_colors['visited'])  # Azul para arestas visitadas
-                edge_widths.append(2.5)
-            else:
-                edge_colors.append(self.edge_colors['unvisited'])  # Cinza para arestas não visitadas
-                edge_widths.append(1.5)
+            csr = CSRGraph.of(graph)
+            positions = compute_layout(csr, self.layout_type)
+            self.layout = dict(zip(csr.labels, positions))
+
+        if self.uses_level_of_detail(graph):
+            return LODScene(graph, self.layout, self.node_colors, self.edge_colors)
+
+        # Figura fora do pyplot: persiste entre passos sem acumular no gerenciador global
+        fig = Figure(figsize=(10, 9))
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+
+        nodes = list(graph.nodes())
+        edges = list(graph.edges())
+        node_size = _node_size(len(nodes))
 
         # Desenhar arestas primeiro (para ficarem atrás dos nós)
-        nx.draw_networkx_edges(
-            graph,
-            self.layout,
-            edge_color=edge_colors,
-            width=edge_widths,
-            ax=ax
-        )
+        edge_artist = None
+        if edges:
+            edge_artist = nx.draw_networkx_edges(
+                graph,
+                self.layout,
+                edgelist=edges,
+                edge_color=self.edge_colors['unvisited'],
+                width=EDGE_WIDTHS[UNVISITED],
+                ax=ax
+            )
 
         # Desenhar nós
-        nx.draw_networkx_nodes(
+        node_artist = nx.draw_networkx_nodes(
             graph,
             self.layout,
-            node_color=node_colors,
-            node_size=700,
+            nodelist=nodes,
+            node_color=self.node_colors['unvisited'],
+            node_size=node_size,
             ax=ax
         )
 
-        # Desenhar rótulos de nós
-        nx.draw_networkx_labels(
-            graph,
-            self.layout,
-            font_size=12,
-            font_weight='bold',
-            ax=ax
-        )
+        # Desenhar rótulos de nós (só em grafos pequenos: acima disso ficam ilegíveis)
+        texts = []
+        if len(nodes) <= LABEL_MAX_NODES:
+            texts = list(nx.draw_networkx_labels(
+                graph,
+                self.layout,
+                font_size=12,
+                font_weight='bold',
+                ax=ax
+            ).values())
 
         # Desenhar labels de peso nas arestas
-        edge_labels = nx.get_edge_attributes(graph, 'weight')
+        edge_labels = nx.get_edge_attributes(graph, 'weight') if len(edges) <= LABEL_MAX_EDGES else {}
         if edge_labels:
             # Formatar pesos: 2 casas decimais, ocultar peso=1
             edge_labels_formatted = {
@@ -99,7 +185,7 @@ class GraphVisualizer:
 
             # Desenhar labels nas arestas
             if edge_labels_formatted:
-                nx.draw_networkx_edge_labels(
+                texts.extend(nx.draw_networkx_edge_labels(
                     graph,
                     self.layout,
                     edge_labels=edge_labels_formatted,
@@ -107,19 +193,232 @@ class GraphVisualizer:
                     font_color='red',
                     bbox=dict(boxstyle="round,pad=0.3", facecolor="white", edgecolor="red", alpha=0.8),
                     ax=ax
-                )
+                ).values())
 
+        return _Scene(graph, fig, ax, nodes, edges, node_artist, edge_artist, texts, node_size)
+
+    def _scene_for(self, graph: nx.Graph):
+        if self._scene is None or self._scene.graph is not graph:
+            self._scene = self._build_scene(graph)
+        return self._scene
+
+    # ====== Estado -> códigos ======
+
+    def _node_codes(self, scene: _Scene, state: GraphState) -> np.ndarray:
+        codes = np.zeros(len(scene.nodes), dtype=np.int8)
+        index = scene.node_index
+        visited = [index[node] for node in state.visited if node in index]
+        codes[visited] = VISITED
+        if state.current in index:
+            codes[index[state.current]] = CURRENT
+        return codes
+
+    def _edge_codes(self, scene: _Scene, state: GraphState) -> np.ndarray:
+        codes = np.zeros(len(scene.edges), dtype=np.int8)
+        lookup = scene.edge_index.get
+
+        # Arestas visitadas: mapa de bits preenchido de uma vez
+        if state.visited_edges:
+            visited = [i for i in map(lookup, state.visited_edges) if i is not None]
+            codes[visited] = VISITED
+
+        # Aresta atual sendo percorrida (verde e mais espessa)
+        if state.previous is not None:
+            current = lookup((state.previous, state.current))
+            if current is not None:
+                codes[current] = CURRENT
+
+        return codes
+
+    def _title(self, graph: nx.Graph, state: GraphState) -> str:
         # Atualizar título para mostrar aresta atual
         if state.previous is not None:
-            ax.set_title(
+            return (
                 f"Aresta Atual: {state.previous} → {state.current} | "
                 f"Visitados: {len(state.visited)}/{len(graph.nodes())}"
             )
+        return f"Nó Atual: {state.current} | Visitados: {len(state.visited)}/{len(graph.nodes())}"
+
+    def _apply(self, scene: _Scene, graph: nx.Graph, state: GraphState):
+        # Atualizar apenas cores/espessuras dos artistas cujo estado mudou.
+        # Retorna os índices de nós e arestas alterados.
+        node_codes = self._node_codes(scene, state)
+        changed_nodes = np.flatnonzero(node_codes != scene.node_codes)
+        if len(changed_nodes):
+            palette = to_rgba_array([
+                self.node_colors['unvisited'], self.node_colors['visited'], self.node_colors['current']
+            ])
+            scene.node_artist.set_facecolor(palette[node_codes])
+            scene.node_codes = node_codes
+
+        changed_edges = np.empty(0, dtype=np.int64)
+        if scene.edge_artist is not None:
+            edge_codes = self._edge_codes(scene, state)
+            changed_edges = np.flatnonzero(edge_codes != scene.edge_codes)
+            if len(changed_edges):
+                palette = to_rgba_array([
+                    self.edge_colors['unvisited'], self.edge_colors['visited'], self.edge_colors['current']
+                ])
+                scene.edge_artist.set_color(palette[edge_codes])
+                scene.edge_artist.set_linewidths(EDGE_WIDTHS[edge_codes])
+                scene.edge_codes = edge_codes
+
+        scene.ax.set_title(self._title(graph, state))
+        return changed_nodes, changed_edges
+
+    # ====== Renderização ======
+
+    @instrumented('render')
+    def render(self, graph: nx.Graph, state: GraphState) -> Figure:
+        # Mesma figura em todos os passos: só as propriedades dos artistas mudam
+        scene = self._scene_for(graph)
+        if isinstance(scene, LODScene):
+            scene.apply(state, self._title(graph, state))
+            return scene.fig
+        self._apply(scene, graph, state)
+        scene.background = None  # Quem desenhar a figura (ex.: savefig) invalida o blit
+        return scene.fig
+
+    @instrumented('render')
+    def render_frame(self, graph: nx.Graph, state: GraphState) -> np.ndarray:
+        # Quadro RGBA do passo atual. Após o primeiro quadro, apenas as regiões
+        # dos nós/arestas alterados (e do título) são restauradas e redesenhadas.
+        scene = self._scene_for(graph)
+        canvas = scene.fig.canvas
+        if isinstance(scene, LODScene):
+            # Fundo estático restaurado e só os artistas dinâmicos redesenhados
+            scene.apply(state, self._title(graph, state))
+            if scene.draw_frame():
+                count('full_redraws')
+            return np.asarray(canvas.buffer_rgba()).copy()
+
+        changed_nodes, changed_edges = self._apply(scene, graph, state)
+
+        if scene.background is None or self._canvas_shape(scene) != scene.background.shape:
+            self._full_draw(scene)
+            count('full_redraws')
         else:
-            ax.set_title(f"Nó Atual: {state.current} | Visitados: {len(state.visited)}/{len(graph.nodes())}")
+            boxes = self._dirty_boxes(scene, changed_nodes, changed_edges)
+            width, height = canvas.get_width_height()
+            dirty_area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in boxes)
+            if dirty_area > BLIT_MAX_AREA * width * height:
+                # Mudança grande demais: redesenhar tudo sai mais barato
+                canvas.draw()
+                count('full_redraws')
+            else:
+                self._blit(scene, boxes)
+                count('blit_regions', len(boxes))
+
+        return np.asarray(canvas.buffer_rgba()).copy()
+
+    def _canvas_shape(self, scene: _Scene):
+        width, height = scene.fig.canvas.get_width_height()
+        return (height, width, 4)
+
+    def _full_draw(self, scene: _Scene) -> None:
+        canvas = scene.fig.canvas
+        dynamic = [scene.node_artist, scene.edge_artist, scene.ax.title] + scene.texts
+        dynamic = [artist for artist in dynamic if artist is not None]
+
+        # Fundo estático (eixos sem nós, arestas e textos) para restaurar regiões
+        for artist in dynamic:
+            artist.set_visible(False)
+        canvas.draw()
+        scene.background = np.asarray(canvas.buffer_rgba()).copy()
+        for artist in dynamic:
+            artist.set_visible(True)
+        canvas.draw()
+
+        # Posições em tela, válidas enquanto os limites dos eixos não mudarem
+        renderer = canvas.get_renderer()
+        transform = scene.ax.transData
+        scene.node_px = transform.transform(np.array([self.layout[node] for node in scene.nodes]))
+        if scene.edges:
+            scene.edge_px = np.stack([
+                scene.node_px[[scene.node_index[u] for u, _ in scene.edges]],
+                scene.node_px[[scene.node_index[v] for _, v in scene.edges]]
+            ], axis=1)
+        # Retângulo de cada camada; coleções ocupam os eixos inteiros
+        everywhere = np.array([-np.inf, -np.inf, np.inf, np.inf])
+        scene.layer_boxes = np.array([
+            layer.get_window_extent(renderer).extents if layer in scene.texts else everywhere
+            for layer in scene.layers
+        ]).reshape(-1, 4)
+        scene.title_box = scene.ax.title.get_window_extent(renderer).extents
+
+    def _dirty_boxes(self, scene: _Scene, changed_nodes: np.ndarray, changed_edges: np.ndarray) -> List[np.ndarray]:
+        dpi = scene.fig.dpi
+        boxes = []
+
+        # Nós: círculo de área node_size (pt²) mais a borda
+        radius = math.sqrt(scene.node_size) / 2 * dpi / 72 + 3
+        for i in changed_nodes:
+            x, y = scene.node_px[i]
+            boxes.append(np.array([x - radius, y - radius, x + radius, y + radius]))
 
-        return fig
+        # Arestas: retângulo do segmento com folga para a maior espessura
+        pad = EDGE_WIDTHS.max() * dpi / 72 + 3
+        for i in changed_edges:
+            (x0, y0), (x1, y1) = scene.edge_px[i]
+            boxes.append(np.array([min(x0, x1) - pad, min(y0, y1) - pad, max(x0, x1) + pad, max(y0, y1) + pad]))
+
+        # Título: região antiga e nova
+        renderer = scene.fig.canvas.get_renderer()
+        new_title = scene.ax.title.get_window_extent(renderer).extents
+        title_box = np.array([
+            min(scene.title_box[0], new_title[0]) - 2, min(scene.title_box[1], new_title[1]) - 2,
+            max(scene.title_box[2], new_title[2]) + 2, max(scene.title_box[3], new_title[3]) + 2
+        ])
+        scene.title_box = new_title
+        boxes.append(title_box)
+
+        # Alinhar ao grid de pixels para que restauração e recorte coincidam
+        width, height = scene.fig.canvas.get_width_height()
+        snapped = []
+        for x0, y0, x1, y1 in boxes:
+            x0, y0 = max(math.floor(x0), 0), max(math.floor(y0), 0)
+            x1, y1 = min(math.ceil(x1), width), min(math.ceil(y1), height)
+            if x1 > x0 and y1 > y0:
+                snapped.append(np.array([x0, y0, x1, y1]))
+        return _merge_boxes(snapped)
+
+    def _blit(self, scene: _Scene, boxes: List[np.ndarray]) -> None:
+        canvas = scene.fig.canvas
+        renderer = canvas.get_renderer()
+        buffer = np.asarray(canvas.buffer_rgba())
+        height = buffer.shape[0]
+        axes_clip = scene.ax.bbox
+        lb = scene.layer_boxes
+
+        for x0, y0, x1, y1 in boxes:
+            # Restaurar o fundo (linhas da imagem crescem para baixo, y da tela para cima)
+            buffer[height - y1:height - y0, x0:x1] = scene.background[height - y1:height - y0, x0:x1]
+
+            # Redesenhar, recortadas à região, as camadas que a cruzam (com folga
+            # para a moldura dos rótulos de peso)
+            clip = Bbox.from_extents(x0, y0, x1, y1)
+            hits = np.flatnonzero(
+                (lb[:, 0] - 6 < x1) & (lb[:, 2] + 6 > x0) & (lb[:, 1] - 6 < y1) & (lb[:, 3] + 6 > y0)
+            )
+            for i in hits:
+                layer = scene.layers[i]
+                layer.set_clip_box(clip)
+                layer.draw(renderer)
+                layer.set_clip_box(axes_clip)
+
+            title = scene.ax.title
+            title.set_clip_box(clip)
+            title.set_clip_on(True)
+            title.draw(renderer)
+            title.set_clip_on(False)
 
     def reset_layout(self):
         """Resetar layout cacheado (chamar quando novo grafo for carregado)"""
         self.layout = None
+        self._scene = None
+
+    def set_layout_type(self, layout_type: str):
+        # Trocar o algoritmo de layout descarta as posições atuais
+        if layout_type != self.layout_type:
+            self.layout_type = layout_type
+            self.reset_layout()
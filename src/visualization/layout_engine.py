@@ -0,0 +1,408 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, Optional
+import numpy as np
+import networkx as nx
+from src.models.csr_graph import CSRGraph
+from src.instrumentation import instrumented, count
+
+# Diretório padrão do cache de layouts e variável de ambiente para alterá-lo
+DEFAULT_LAYOUT_DIR = os.path.join('.graph_cache', 'layouts')
+ENV_LAYOUT_DIR = 'LAYOUT_CACHE_DIR'
+
+# Até este número de nós o modo automático usa o spring layout exato do NetworkX
+AUTO_SPRING_MAX_NODES = 500
+
+# Orçamento de trabalho padrão de um layout, em operações elementares estimadas
+# (ex.: nó × célula + aresta por iteração no layout de força): cerca de 10 s
+# numa máquina comum. O número de iterações sai dele e do tamanho do grafo,
+# nunca do relógio, então o resultado é determinístico e sempre vai para o cache.
+DEFAULT_WORK_BUDGET = 10 ** 9
+
+
+def _rescale(positions: np.ndarray) -> np.ndarray:
+    # Centralizar e escalar para [-1, 1], como nx.rescale_layout
+    positions = positions - positions.mean(axis=0)
+    extent = np.abs(positions).max()
+    if extent > 0:
+        positions = positions / extent
+    return positions
+
+
+class BaseLayout(ABC):
+    # Algoritmo de posicionamento dos nós. Todos respeitam um orçamento de
+    # iterações e de trabalho e retornam posições (V, 2) na ordem dos ids do
+    # grafo. As iterações executadas dependem só do grafo e dos parâmetros.
+
+    name = ''
+    weighted = False  # O resultado depende dos pesos das arestas (entram na chave do cache)
+
+    def __init__(self, max_iterations: int = 50, work_budget: int = DEFAULT_WORK_BUDGET, seed: int = 42):
+        self.max_iterations = max_iterations
+        self.work_budget = work_budget
+        self.seed = seed
+
+    @abstractmethod
+    def compute(self, graph: CSRGraph) -> np.ndarray:
+        pass
+
+    def params(self) -> Dict:
+        # Parâmetros que influenciam o resultado (fazem parte da chave do cache;
+        # com o hash do grafo, determinam o número de iterações)
+        return {
+            'engine': self.name,
+            'max_iterations': self.max_iterations,
+            'work_budget': self.work_budget,
+            'seed': self.seed
+        }
+
+    def iteration_cost(self, graph: CSRGraph) -> int:
+        # Trabalho estimado de uma iteração
+        return graph.num_nodes + graph.num_edges
+
+    def fits(self, graph: CSRGraph) -> bool:
+        # Pelo menos uma iteração cabe no orçamento
+        return self.iteration_cost(graph) <= self.work_budget
+
+    def iterations(self, graph: CSRGraph) -> int:
+        # Iterações que cabem no orçamento (no máximo max_iterations); nunca o excede
+        cost = self.iteration_cost(graph)
+        if cost > self.work_budget:
+            raise ValueError(
+                f"Uma iteração do layout '{self.name}' ({cost:,} operações) "
+                f"excede o orçamento de trabalho ({self.work_budget:,})"
+            )
+        return min(self.max_iterations, self.work_budget // max(1, cost))
+
+    def _initial(self, n: int) -> np.ndarray:
+        return np.random.default_rng(self.seed).random((n, 2))
+
+
+class SpringLayout(BaseLayout):
+    # Spring layout exato do NetworkX (O(V²) por iteração): grafos pequenos
+
+    name = 'spring'
+    weighted = True  # nx.spring_layout usa o atributo 'weight' das arestas
+
+    def iteration_cost(self, graph: CSRGraph) -> int:
+        return graph.num_nodes * graph.num_nodes + graph.num_edges
+
+    def compute(self, graph: CSRGraph) -> np.ndarray:
+        layout = nx.spring_layout(graph.to_networkx(), iterations=self.iterations(graph), seed=self.seed)
+        return np.array([layout[label] for label in graph.labels], dtype=np.float64).reshape(-1, 2)
+
+
+class ForceLayout(BaseLayout):
+    # Fruchterman-Reingold com repulsão aproximada por grade: cada nó é repelido
+    # pelo centro de massa de cada célula (O(V·C) por iteração, C = células)
+    # em vez de por todos os outros nós. Atração exata ao longo das arestas.
+
+    name = 'force'
+
+    def __init__(self, max_iterations: int = 100, work_budget: int = DEFAULT_WORK_BUDGET, seed: int = 42,
+                 grid_size: int = 32, block_size: int = 4096):
+        super().__init__(max_iterations, work_budget, seed)
+        self.grid_size = grid_size
+        self.block_size = block_size
+
+    def params(self) -> Dict:
+        return {**super().params(), 'grid_size': self.grid_size}
+
+    def _grid(self, n: int) -> int:
+        return max(1, min(self.grid_size, int(np.sqrt(n / 4))))
+
+    def iteration_cost(self, graph: CSRGraph) -> int:
+        # Repulsão de cada nó por cada célula, mais a atração nas arestas
+        return graph.num_nodes * self._grid(graph.num_nodes) ** 2 + graph.num_edges
+
+    def compute(self, graph: CSRGraph) -> np.ndarray:
+        n = graph.num_nodes
+        positions = self._initial(n)
+        if n < 2:
+            return positions
+
+        k = 1.0 / np.sqrt(n)  # Distância ideal entre nós (área unitária)
+        grid = self._grid(n)
+        loops = graph.edge_src == graph.edge_dst
+        src = graph.edge_src[~loops].astype(np.int64)
+        dst = graph.edge_dst[~loops].astype(np.int64)
+
+        # Resfriamento completo ao longo das iterações que cabem no orçamento
+        iterations = self.iterations(graph)
+        temperature = 0.1
+        cooling = temperature / (iterations + 1)
+
+        for _ in range(iterations):
+            displacement = self._repulsion(positions, k, grid)
+
+            # Atração: d²/k ao longo de cada aresta
+            delta = positions[src] - positions[dst]
+            distance = np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 1e-9)
+            pull = delta * (distance / k)[:, None]
+            for axis in range(2):
+                displacement[:, axis] -= np.bincount(src, weights=pull[:, axis], minlength=n)
+                displacement[:, axis] += np.bincount(dst, weights=pull[:, axis], minlength=n)
+
+            # Deslocamento limitado pela temperatura
+            length = np.maximum(np.hypot(displacement[:, 0], displacement[:, 1]), 1e-9)
+            positions += displacement * (np.minimum(length, temperature) / length)[:, None]
+
+            temperature -= cooling
+
+        return _rescale(positions)
+
+    def _repulsion(self, positions: np.ndarray, k: float, grid: int) -> np.ndarray:
+        n = len(positions)
+        low = positions.min(axis=0)
+        span = np.maximum(positions.max(axis=0) - low, 1e-9)
+        cell_xy = np.minimum(((positions - low) / span * grid).astype(np.int64), grid - 1)
+        cell = cell_xy[:, 0] * grid + cell_xy[:, 1]
+
+        # Massa e centro de massa de cada célula ocupada
+        _, cell_of = np.unique(cell, return_inverse=True)
+        mass = np.bincount(cell_of).astype(np.float64)
+        centroid = np.stack([
+            np.bincount(cell_of, weights=positions[:, 0]),
+            np.bincount(cell_of, weights=positions[:, 1])
+        ], axis=1)
+
+        centers = centroid / mass[:, None]
+        floor = 1e-9 * k * k
+
+        displacement = np.zeros_like(positions)
+        for start in range(0, n, self.block_size):
+            block = positions[start:start + self.block_size]
+            own = cell_of[start:start + self.block_size]
+
+            # Repulsão k²/d vinda de cada célula, ponderada pela massa
+            delta = block[:, None, :] - centers[None, :, :]
+            distance2 = np.maximum((delta ** 2).sum(axis=2), floor)
+            push = (delta * (mass * k * k / distance2)[:, :, None]).sum(axis=1)
+
+            # Na própria célula, trocar o centro de massa por um que exclui o nó
+            delta = block - centers[own]
+            push -= delta * (mass[own] * k * k / np.maximum((delta ** 2).sum(axis=1), floor))[:, None]
+            others = mass[own] - 1
+            rest = (centroid[own] - block) / np.maximum(others, 1)[:, None]
+            delta = block - rest
+            push += delta * (others * k * k / np.maximum((delta ** 2).sum(axis=1), floor))[:, None]
+
+            displacement[start:start + self.block_size] = push
+
+        return displacement
+
+
+class SpectralLayout(BaseLayout):
+    # Autovetores de grau normalizado do Laplaciano (Koren), obtidos por
+    # iteração de potência esparsa: cada iteração custa O(E), sem matriz densa
+
+    name = 'spectral'
+
+    def __init__(self, max_iterations: int = 1000, work_budget: int = DEFAULT_WORK_BUDGET, seed: int = 42,
+                 tolerance: float = 1e-7):
+        super().__init__(max_iterations, work_budget, seed)
+        self.tolerance = tolerance
+
+    def params(self) -> Dict:
+        return {**super().params(), 'tolerance': self.tolerance}
+
+    def compute(self, graph: CSRGraph) -> np.ndarray:
+        n = graph.num_nodes
+        positions = self._initial(n) - 0.5
+        if n < 3:
+            return positions
+
+        sources = graph.entry_sources()
+        neighbors = np.asarray(graph.neighbors, dtype=np.int64)
+        degree = np.maximum(np.diff(graph.offsets), 1).astype(np.float64)
+        constant = np.ones(n) / np.sqrt(degree.sum())
+
+        for _ in range(self.iterations(graph)):
+            previous = positions
+
+            # X <- (X + D⁻¹ A X) / 2
+            smoothed = np.empty_like(positions)
+            for axis in range(2):
+                smoothed[:, axis] = np.bincount(sources, weights=positions[neighbors, axis], minlength=n)
+            positions = 0.5 * (positions + smoothed / degree[:, None])
+
+            # Ortogonalizar (produto interno com peso D) contra o vetor constante e entre si
+            for axis in range(2):
+                column = positions[:, axis]
+                column -= (column * degree) @ constant * constant
+                if axis == 1:
+                    first = positions[:, 0]
+                    column -= (column * degree) @ first * first
+                norm = np.sqrt((column * column * degree).sum())
+                if norm > 0:
+                    column /= norm
+
+            if np.abs(positions - previous).max() < self.tolerance:
+                break
+
+        return _rescale(positions)
+
+
+class HierarchicalLayout(BaseLayout):
+    # Camadas por nível de BFS: y = -nível, x = ordem de descoberta dentro do
+    # nível (filhos ficam perto dos pais). Componentes lado a lado. O(V + E).
+
+    name = 'hierarchical'
+
+    def __init__(self, max_iterations: int = 1, work_budget: int = DEFAULT_WORK_BUDGET, seed: int = 42,
+                 root: Optional[int] = None):
+        super().__init__(max_iterations, work_budget, seed)
+        self.root = root
+
+    def params(self) -> Dict:
+        return {**super().params(), 'root': self.root}
+
+    def compute(self, graph: CSRGraph) -> np.ndarray:
+        n = graph.num_nodes
+        offsets, neighbors, _ = graph.adjacency_lists()
+        level = [-1] * n
+        positions = np.zeros((n, 2))
+        x_offset = 0.0
+
+        roots = list(range(n))
+        if self.root is not None:
+            roots.insert(0, self.root)
+
+        for root in roots:
+            if level[root] != -1:
+                continue
+
+            # BFS de uma componente registrando a ordem dentro de cada nível
+            level[root] = 0
+            layers = [[root]]
+            queue = deque([root])
+            while queue:
+                node = queue.popleft()
+                for i in range(offsets[node], offsets[node + 1]):
+                    neighbor = neighbors[i]
+                    if level[neighbor] == -1:
+                        level[neighbor] = level[node] + 1
+                        if level[neighbor] == len(layers):
+                            layers.append([])
+                        layers[level[neighbor]].append(neighbor)
+                        queue.append(neighbor)
+
+            width = max(len(layer) for layer in layers)
+            for depth, layer in enumerate(layers):
+                # Centralizar cada nível na largura da componente
+                start = x_offset + (width - len(layer)) / 2
+                positions[layer, 0] = start + np.arange(len(layer))
+                positions[layer, 1] = -depth
+            x_offset += width + 1
+
+        return _rescale(positions)
+
+
+class LayoutCache:
+    # Layouts gravados em disco (.npy), chaveados pelo hash do grafo (e dos
+    # pesos, se o algoritmo os usa) e pelos parâmetros do algoritmo: um grafo
+    # recarregado reaproveita as posições
+
+    def __init__(self, directory: Optional[str]):
+        self.directory = directory
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(graph: CSRGraph, layout: BaseLayout) -> str:
+        params = json.dumps(layout.params(), sort_keys=True)
+        digest = hashlib.sha256(f"{graph.fingerprint}:{params}".encode('utf-8'))
+        if layout.weighted:
+            digest.update(np.ascontiguousarray(graph.edge_weight, dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    def get(self, key: str, num_nodes: int) -> Optional[np.ndarray]:
+        if not self.directory:
+            return None
+        path = os.path.join(self.directory, f"{key}.npy")
+        try:
+            positions = np.load(path)
+        except (OSError, ValueError):
+            return None
+        if positions.shape != (num_nodes, 2):
+            return None
+        return positions
+
+    def put(self, key: str, positions: np.ndarray) -> None:
+        if not self.directory:
+            return
+        # Escrita atômica (arquivo temporário + rename)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, positions)
+            os.replace(tmp_path, os.path.join(self.directory, f"{key}.npy"))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+
+_default_cache: Optional[LayoutCache] = None
+_default_lock = threading.Lock()
+
+
+def get_layout_cache() -> LayoutCache:
+    # Instância única por processo; LAYOUT_CACHE_DIR vazio desativa o disco
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = LayoutCache(os.environ.get(ENV_LAYOUT_DIR, DEFAULT_LAYOUT_DIR) or None)
+        return _default_cache
+
+
+class LayoutFactory:
+
+    @staticmethod
+    def create_layout(layout_type: str, num_nodes: int = 0) -> BaseLayout:
+
+        layout_mapping = {
+            "Automático": "auto",
+            "Spring (NetworkX)": "spring",
+            "Força (grade)": "force",
+            "Espectral": "spectral",
+            "Hierárquico (BFS)": "hierarchical"
+        }
+
+        layout_key = layout_mapping.get(layout_type, layout_type)
+        if layout_key == "auto":
+            layout_key = "spring" if num_nodes <= AUTO_SPRING_MAX_NODES else "force"
+
+        layouts = {
+            "spring": SpringLayout,
+            "force": ForceLayout,
+            "spectral": SpectralLayout,
+            "hierarchical": HierarchicalLayout
+        }
+        if layout_key not in layouts:
+            raise ValueError(f"Layout desconhecido: {layout_type}")
+        return layouts[layout_key]()
+
+
+@instrumented('layout')
+def compute_layout(graph: CSRGraph, layout_type: str = "auto", cache: Optional[LayoutCache] = None) -> np.ndarray:
+    # Posições (V, 2) na ordem dos ids, reaproveitando o cache em disco
+    layout = LayoutFactory.create_layout(layout_type, graph.num_nodes)
+    if not layout.fits(graph) and not isinstance(layout, ForceLayout):
+        # Uma única iteração estouraria o orçamento (ex.: spring num grafo grande)
+        count('layout_fallback')
+        layout = ForceLayout(work_budget=layout.work_budget, seed=layout.seed)
+    cache = cache if cache is not None else get_layout_cache()
+
+    key = cache.key(graph, layout)
+    positions = cache.get(key, graph.num_nodes)
+    if positions is None:
+        positions = layout.compute(graph)
+        cache.put(key, positions)
+    else:
+        count('layout_cache_hits')
+    return positions
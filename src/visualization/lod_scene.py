@@ -0,0 +1,295 @@
+from typing import Dict, List, Tuple
+import numpy as np
+import networkx as nx
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.patches import Rectangle
+from matplotlib.colors import to_rgba_array
+from matplotlib.figure import Figure
+from src.models.csr_graph import CSRGraph
+from src.models.frontier import LogView
+from src.models.graph_state import GraphState
+
+# Nível de detalhe para grafos grandes: as arestas viram uma imagem de
+# densidade estática, os nós são agregados em super-nós (células de uma grade
+# sobre o layout) e só a vizinhança do nó atual é desenhada em detalhe, com
+# nós, arestas e rótulos individuais, num quadro ampliado.
+
+# Células por eixo da grade de super-nós. Os limites das células seguem os
+# quantis das posições: regiões densas ganham células menores e nós
+# afastados ficam agregados em poucas células grandes.
+LOD_GRID = 48
+
+# Resolução (por eixo) da imagem de densidade das arestas
+RASTER_SIZE = 512
+
+# Pontos amostrados por bloco ao rasterizar as arestas (limita a memória)
+RASTER_CHUNK_SAMPLES = 4_000_000
+
+# Vizinhança do nó atual desenhada em detalhe: saltos e limite de nós
+FOCUS_HOPS = 2
+FOCUS_MAX_NODES = 30
+
+# Rótulos no quadro ampliado: o nó atual e os mais próximos dele (texto é o
+# artista mais caro de desenhar)
+FOCUS_MAX_LABELS = 12
+
+FOCUS_NODE_SIZE = 200
+FOCUS_EDGE_WIDTHS = np.array([1.0, 2.0, 4.0])
+
+# Posição do quadro ampliado (fração da figura), no canto superior direito dos eixos
+FOCUS_INSET = (0.6, 0.56, 0.29, 0.31)
+
+
+def edge_density(positions: np.ndarray, sources: np.ndarray, targets: np.ndarray,
+                 extent: tuple, size: int = RASTER_SIZE) -> np.ndarray:
+    # Imagem (size x size, linha 0 embaixo) com quantas arestas passam por cada
+    # pixel: pontos amostrados ao longo de cada segmento, um por pixel percorrido
+    x0, x1, y0, y1 = extent
+    scale = np.array([(size - 1) / max(x1 - x0, 1e-12), (size - 1) / max(y1 - y0, 1e-12)])
+    origin = np.array([x0, y0])
+    a = (positions[sources] - origin) * scale
+    b = (positions[targets] - origin) * scale
+    samples = np.maximum(np.ceil(np.hypot(*(b - a).T)).astype(np.int64), 1)
+
+    counts = np.zeros(size * size, dtype=np.int64)
+    bounds = np.searchsorted(np.cumsum(samples), np.arange(0, samples.sum(), RASTER_CHUNK_SAMPLES), side='right')
+    bounds = np.unique(np.r_[0, bounds, len(samples)])
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        k = samples[start:stop]
+        edge = np.repeat(np.arange(len(k)), k)
+        t = (np.arange(len(edge)) - np.repeat(np.cumsum(k) - k, k) + 0.5) / k[edge]
+        points = a[start:stop][edge] + t[:, None] * (b - a)[start:stop][edge]
+        pixels = np.clip(np.rint(points).astype(np.int64), 0, size - 1)
+        counts += np.bincount(pixels[:, 1] * size + pixels[:, 0], minlength=size * size)
+    return counts.reshape(size, size)
+
+
+class LODScene:
+    # Cena de um grafo grande, construída uma vez. Fundo estático (eixos e
+    # densidade de arestas) guardado em pixels; a cada quadro ele é restaurado
+    # e só os super-nós, a vizinhança do nó atual e o título são redesenhados.
+
+    def __init__(self, graph: nx.Graph, layout: Dict, node_colors: Dict, edge_colors: Dict):
+        self.graph = graph
+        self.csr = CSRGraph.from_networkx(graph)
+        csr = self.csr
+        positions = np.array([layout[label] for label in csr.labels], dtype=np.float64).reshape(-1, 2)
+        self.positions = positions
+        states = ['unvisited', 'visited', 'current']
+        self.node_palette = to_rgba_array([node_colors[state] for state in states])
+        self.edge_palette = to_rgba_array([edge_colors[state] for state in states])
+        self.focus_edge_palette = self.edge_palette.copy()
+        self.focus_edge_palette[0, :3] *= 0.6  # Arestas não visitadas do foco mais escuras que o fundo
+
+        self.fig = Figure(figsize=(10, 9))
+        FigureCanvasAgg(self.fig)
+        ax = self.fig.add_subplot()
+        self.ax = ax
+        ax.set_xticks([])
+        ax.set_yticks([])
+
+        # Limites fixos com margem: o fundo em pixels vale para todos os quadros
+        low = positions.min(axis=0) if len(positions) else np.zeros(2)
+        high = positions.max(axis=0) if len(positions) else np.ones(2)
+        margin = np.maximum((high - low) * 0.05, 1e-3)
+        low, high = low - margin, high + margin
+        extent = (low[0], high[0], low[1], high[1])
+        ax.set_xlim(low[0], high[0])
+        ax.set_ylim(low[1], high[1])
+
+        # Arestas: imagem de densidade em escala log, desenhada só no fundo
+        if csr.num_edges:
+            density = edge_density(positions, np.asarray(csr.edge_src), np.asarray(csr.edge_dst), extent)
+            ax.imshow(
+                np.log1p(density), cmap='Greys', origin='lower', extent=extent, aspect='auto',
+                interpolation='nearest', vmin=0, vmax=max(float(np.log1p(density.max())), 1e-12) * 1.5,
+                zorder=0
+            )
+
+        # Super-nós: uma célula da grade por grupo, no centroide dos seus nós
+        cell_xy = np.zeros(positions.shape, dtype=np.int64)
+        cell_span = []
+        for axis in range(2):
+            coordinate = positions[:, axis]
+            if len(positions):
+                edges = np.unique(np.quantile(coordinate, np.linspace(0, 1, LOD_GRID + 1)))
+            else:
+                edges = np.zeros(1)
+            cell = np.searchsorted(edges, coordinate, side='right') - 1
+            cell_xy[:, axis] = np.clip(cell, 0, max(len(edges) - 2, 0))
+            cell_span.append(np.diff(edges) if len(edges) > 1 else np.ones(1))
+        cells, self.node_cell = np.unique(cell_xy[:, 1] * LOD_GRID + cell_xy[:, 0], return_inverse=True)
+        self.node_cell = self.node_cell.reshape(-1)
+        self.cell_sizes = np.bincount(self.node_cell)
+        centers = np.stack([
+            np.bincount(self.node_cell, weights=positions[:, 0]),
+            np.bincount(self.node_cell, weights=positions[:, 1])
+        ], axis=1) / self.cell_sizes[:, None]
+
+        # Diâmetro do marcador: 80% do menor lado da célula na tela (pontos), entre 2 e 12 pt
+        box = ax.get_window_extent()
+        points_per_unit = np.array([box.width, box.height]) / (high - low) * 72 / self.fig.dpi
+        sides = np.minimum(
+            cell_span[0][cells % LOD_GRID] * points_per_unit[0],
+            cell_span[1][cells // LOD_GRID] * points_per_unit[1]
+        )
+        self.super_nodes = ax.scatter(
+            centers[:, 0], centers[:, 1], s=np.clip(0.8 * sides, 2.0, 12.0) ** 2,
+            c=np.repeat(self.node_palette[:1], len(centers), axis=0), linewidths=0, zorder=1
+        )
+
+        # Na visão geral: nó atual e contorno da região ampliada
+        self.current_marker = ax.scatter([], [], s=60, c=self.node_palette[2:], edgecolors='black', zorder=3)
+        self.focus_box = Rectangle(
+            (0, 0), 0, 0, fill=False, edgecolor=self.node_palette[2], linewidth=1.2, zorder=3
+        )
+        ax.add_patch(self.focus_box)
+
+        # Quadro ampliado com a vizinhança do nó atual (atualizado a cada quadro)
+        inset = self.fig.add_axes(FOCUS_INSET)
+        inset.set_xticks([])
+        inset.set_yticks([])
+        self.inset = inset
+        self.focus_edges = LineCollection([], zorder=1)
+        inset.add_collection(self.focus_edges)
+        self.focus_nodes = inset.scatter([], [], s=FOCUS_NODE_SIZE, edgecolors='black', linewidths=0.5, zorder=2)
+        self.focus_labels = [
+            inset.text(0, 0, '', fontsize=8, fontweight='bold', ha='center', va='center', zorder=3, visible=False,
+                       clip_on=True)
+            for _ in range(FOCUS_MAX_LABELS)
+        ]
+        self.min_focus_span = 0.02 * float(max(high - low))
+        self.dynamic = [self.super_nodes, self.focus_box, self.current_marker, inset, ax.title]
+
+        # Visitados por célula, atualizados só com os nós novos de cada estado
+        self.visited_mask = np.zeros(csr.num_nodes, dtype=bool)
+        self.cell_visited = np.zeros(len(self.cell_sizes), dtype=np.int64)
+        self._seen_log = None
+        self._seen_length = 0
+
+        self.background = None
+
+    # ====== Estado -> artistas ======
+
+    def _update_visited(self, visited) -> None:
+        # Com o mesmo log compartilhado e um prefixo maior, processar só o que
+        # entrou desde o quadro anterior; do contrário, recalcular tudo
+        index = self.csr.index
+        if isinstance(visited, LogView) and visited.log is self._seen_log and len(visited) >= self._seen_length:
+            new = [index[node] for node in visited[self._seen_length:] if node in index]
+        else:
+            self.visited_mask[:] = False
+            self.cell_visited[:] = 0
+            new = [index[node] for node in visited if node in index]
+        new = np.array(new, dtype=np.int64)
+        new = np.unique(new[~self.visited_mask[new]])
+        self.visited_mask[new] = True
+        np.add.at(self.cell_visited, self.node_cell[new], 1)
+        self._seen_log = visited.log if isinstance(visited, LogView) else None
+        self._seen_length = len(visited)
+
+    def _focus(self, current: int) -> Tuple[List[int], int]:
+        # Nós a até FOCUS_HOPS saltos do atual, em largura, limitados a
+        # FOCUS_MAX_NODES, e quantos deles são o atual e seus vizinhos diretos
+        offsets, neighbors, _ = self.csr.adjacency_lists()
+        focus = {current: None}
+        level = [current]
+        near = None
+        for _ in range(FOCUS_HOPS):
+            following = []
+            for node in level:
+                for neighbor in neighbors[offsets[node]:offsets[node + 1]]:
+                    if len(focus) >= FOCUS_MAX_NODES:
+                        return list(focus), near or len(focus)
+                    if neighbor not in focus:
+                        focus[neighbor] = None
+                        following.append(neighbor)
+            near = near or len(focus)
+            level = following
+        return list(focus), near or len(focus)
+
+    def apply(self, state: GraphState, title: str) -> None:
+        self._update_visited(state.visited)
+        fraction = (self.cell_visited / self.cell_sizes)[:, None]
+        self.super_nodes.set_facecolor(self.node_palette[0] * (1 - fraction) + self.node_palette[1] * fraction)
+
+        csr = self.csr
+        labels = csr.labels
+        current = csr.index.get(state.current)
+        focus, near = self._focus(current) if current is not None else ([], 0)
+        focus_set = set(focus)
+
+        # Arestas entre nós do foco, com o código de estado de cada uma
+        offsets, neighbors, _ = csr.adjacency_lists()
+        visited_edges = state.visited_edges or ()
+        current_edge = {state.previous, state.current} if state.previous is not None else None
+        segments = []
+        codes = []
+        for u in focus:
+            for v in neighbors[offsets[u]:offsets[u + 1]]:
+                if u < v and v in focus_set:
+                    a, b = labels[u], labels[v]
+                    segments.append(self.positions[[u, v]])
+                    if current_edge is not None and {a, b} == current_edge:
+                        codes.append(2)
+                    else:
+                        codes.append(1 if tuple(sorted([a, b], key=str)) in visited_edges else 0)
+        codes = np.array(codes, dtype=np.int64)
+        self.focus_edges.set_segments(segments)
+        self.focus_edges.set_color(self.focus_edge_palette[codes])
+        self.focus_edges.set_linewidths(FOCUS_EDGE_WIDTHS[codes])
+
+        # Nós do foco e seus rótulos (o atual, primeiro da lista, desenhado por último)
+        focus = focus[::-1]
+        focus_ids = np.array(focus, dtype=np.int64)
+        focus_positions = self.positions[focus_ids].reshape(-1, 2)
+        node_codes = self.visited_mask[focus_ids].astype(np.int64)
+        if current is not None:
+            node_codes[-1] = 2
+        self.focus_nodes.set_offsets(focus_positions)
+        self.focus_nodes.set_facecolor(self.node_palette[node_codes])
+        for i, text in enumerate(self.focus_labels, 1):
+            if i <= len(focus):
+                text.set_position(focus_positions[-i])
+                text.set_text(str(labels[focus[-i]]))
+                text.set_visible(True)
+            else:
+                text.set_visible(False)
+
+        # Região ampliada: quadrada, em volta do atual e dos vizinhos diretos, com
+        # margem (nós a dois saltos aparecem quando cabem)
+        self.inset.set_visible(bool(focus))
+        self.current_marker.set_offsets(focus_positions[-1:])
+        if focus:
+            closest = focus_positions[len(focus) - near:]
+            center = (closest.min(axis=0) + closest.max(axis=0)) / 2
+            half = max(float(np.ptp(closest, axis=0).max()), self.min_focus_span) * 0.6
+            self.inset.set_xlim(center[0] - half, center[0] + half)
+            self.inset.set_ylim(center[1] - half, center[1] + half)
+            self.focus_box.set_bounds(center[0] - half, center[1] - half, 2 * half, 2 * half)
+        self.focus_box.set_visible(bool(focus))
+
+        self.ax.set_title(title)
+
+    # ====== Desenho ======
+
+    def draw_frame(self) -> bool:
+        # Desenhar o quadro atual; True se foi preciso um desenho completo
+        canvas = self.fig.canvas
+        full = self.background is None
+        if full:
+            visible = [artist.get_visible() for artist in self.dynamic]
+            for artist in self.dynamic:
+                artist.set_visible(False)
+            canvas.draw()
+            self.background = canvas.copy_from_bbox(self.fig.bbox)
+            for artist, shown in zip(self.dynamic, visible):
+                artist.set_visible(shown)
+
+        canvas.restore_region(self.background)
+        renderer = canvas.get_renderer()
+        for artist in self.dynamic:
+            if artist.get_visible():
+                artist.draw(renderer)
+        return full
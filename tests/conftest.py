@@ -0,0 +1,4 @@
+import os
+
+# Layouts só em memória: os testes não gravam em .graph_cache
+os.environ['LAYOUT_CACHE_DIR'] = ''
@@ -0,0 +1,25 @@
+import random
+import networkx as nx
+
+# Grafos aleatórios com semente fixa e pesos contínuos (sem empates entre
+# caminhos ou arestas, então a ordem de visita é única)
+
+
+def random_graph(num_nodes: int, num_edges: int, seed: int) -> nx.Graph:
+    graph = nx.gnm_random_graph(num_nodes, num_edges, seed=seed)
+    rng = random.Random(seed)
+    for u, v in graph.edges():
+        graph[u][v]['weight'] = rng.uniform(1.0, 10.0)
+    return graph
+
+
+def dense_graph(num_nodes: int, seed: int, density: float = 0.4) -> nx.Graph:
+    num_edges = int(density * num_nodes * (num_nodes - 1) / 2)
+    return random_graph(num_nodes, num_edges, seed)
+
+
+def state_tuple(state) -> tuple:
+    return (
+        list(state.visited), state.current, list(state.queue_or_stack),
+        state.previous, list(state.visited_edges)
+    )
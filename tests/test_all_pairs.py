@@ -0,0 +1,32 @@
+import math
+import networkx as nx
+import numpy as np
+import pytest
+from src.algorithms import distance_matrix, eccentricity
+from tests.helpers import dense_graph, random_graph
+
+# Matriz de distâncias (paralela, em blocos de linhas) contra o NetworkX
+
+GRAPHS = [random_graph(40, 60, 1), random_graph(80, 70, 2), dense_graph(50, 3)]
+
+
+def _expected(graph) -> np.ndarray:
+    nodes = list(graph.nodes())
+    lengths = dict(nx.all_pairs_dijkstra_path_length(graph))
+    return np.array([[lengths[u].get(v, math.inf) for v in nodes] for u in nodes])
+
+
+@pytest.mark.parametrize('graph', GRAPHS)
+@pytest.mark.parametrize('workers,tile_rows', [(1, None), (2, 7)])
+def test_distance_matrix_matches_networkx(graph, workers, tile_rows, tmp_path):
+    matrix = distance_matrix(graph, output_path=str(tmp_path / 'd.npy'), workers=workers, tile_rows=tile_rows)
+    np.testing.assert_allclose(np.asarray(matrix), _expected(graph))
+
+
+@pytest.mark.parametrize('graph', GRAPHS)
+def test_eccentricity_within_component(graph):
+    expected = _expected(graph)
+    values = eccentricity(graph, workers=1)
+    for i, node in enumerate(graph.nodes()):
+        row = expected[i]
+        assert values[node] == pytest.approx(row[np.isfinite(row)].max())
@@ -0,0 +1,45 @@
+import networkx as nx
+import numpy as np
+import pytest
+from src.algorithms import AlgorithmFactory
+from src.instrumentation import Instrumentation, use_instrumentation
+from src.visualization.graph_visualizer import GraphVisualizer
+from tests.helpers import random_graph
+
+# Quadros redesenhados só nas regiões alteradas (blit) devem coincidir com um
+# redesenho completo da figura. O primeiro quadro é um desenho completo e deve
+# ser idêntico; nos demais, o Agg corta os traços no retângulo de recorte em
+# ponto fixo e a cobertura do anti-aliasing pode variar em 1 nível de cor.
+ANTIALIAS_TOLERANCE = 1
+
+
+def _visualizer(graph) -> GraphVisualizer:
+    visualizer = GraphVisualizer()
+    visualizer.layout = nx.spring_layout(graph, seed=0)
+    return visualizer
+
+
+def _full_redraw(visualizer: GraphVisualizer, graph, state) -> np.ndarray:
+    figure = visualizer.render(graph, state)
+    figure.canvas.draw()
+    return np.asarray(figure.canvas.buffer_rgba()).copy()
+
+
+@pytest.mark.parametrize('algorithm_type', ["BFS", "Dijkstra"])
+@pytest.mark.parametrize('num_nodes,num_edges,seed', [(15, 25, 1), (40, 60, 2)])
+def test_blitted_frames_match_full_redraw(algorithm_type, num_nodes, num_edges, seed):
+    graph = random_graph(num_nodes, num_edges, seed)
+    states = list(AlgorithmFactory.create_algorithm(algorithm_type).traverse(graph, 0))
+    blitted, reference = _visualizer(graph), _visualizer(graph)
+
+    instrumentation = Instrumentation()
+    with use_instrumentation(instrumentation):
+        first = blitted.render_frame(graph, states[0])
+        np.testing.assert_array_equal(first, _full_redraw(reference, graph, states[0]))
+        for state in states[1:]:
+            frame = blitted.render_frame(graph, state).astype(np.int16)
+            expected = _full_redraw(reference, graph, state).astype(np.int16)
+            assert np.abs(frame - expected).max() <= ANTIALIAS_TOLERANCE
+
+    # Os quadros após o primeiro precisam ter passado pelo blit
+    assert instrumentation.counters.get('blit_regions', 0) > 0
@@ -0,0 +1,97 @@
+import math
+import networkx as nx
+import numpy as np
+import pytest
+from src.algorithms import AlgorithmFactory, EuclideanHeuristic
+from src.algorithms.bfs import LEVEL_SYNC_MIN_NODES
+from src.models.csr_graph import CSRGraph
+from tests.helpers import dense_graph, random_graph
+
+# run() (resultado sem trace) deve visitar na mesma ordem que build_trace() e
+# concordar com o NetworkX, inclusive nos kernels escolhidos pelo tamanho
+# (BFS por níveis) e pela densidade do grafo (Dijkstra/Prim O(V²))
+
+ALGORITHMS = ["BFS", "DFS", "Dijkstra", "MST (Prim)", "MST (Kruskal)", "MST (Borůvka)"]
+
+SPARSE = [random_graph(60, 90, 1), random_graph(200, 180, 2)]
+LARGE = [random_graph(LEVEL_SYNC_MIN_NODES + 500, 4000, 3), random_graph(2 * LEVEL_SYNC_MIN_NODES, 1800, 4)]
+DENSE = [dense_graph(60, 5), dense_graph(120, 6, density=0.6)]
+
+
+def _edge_set(edges) -> set:
+    return {tuple(sorted(edge, key=str)) for edge in edges}
+
+
+@pytest.mark.parametrize('algorithm_type', ALGORITHMS)
+@pytest.mark.parametrize('graph', SPARSE + LARGE + DENSE)
+def test_run_matches_trace(algorithm_type, graph):
+    algorithm = AlgorithmFactory.create_algorithm(algorithm_type)
+    csr = CSRGraph.of(graph)
+    result = algorithm.run(csr, 0)
+    trace = algorithm.build_trace(csr, 0)
+    assert result.visited_order == trace.visited_order
+    assert _edge_set(result.edge_labels()) == _edge_set(trace.visited_edges)
+
+
+def test_kernel_switches_are_exercised():
+    assert all(CSRGraph.of(graph).num_nodes >= LEVEL_SYNC_MIN_NODES for graph in LARGE)
+    assert all(CSRGraph.of(graph).prefers_dense() for graph in DENSE)
+    assert not any(CSRGraph.of(graph).prefers_dense() for graph in SPARSE + LARGE)
+
+
+@pytest.mark.parametrize('graph', SPARSE + LARGE)
+def test_bfs_levels_match_networkx(graph):
+    result = AlgorithmFactory.create_algorithm("BFS").run(graph, 0)
+    depth = nx.single_source_shortest_path_length(graph, 0)
+    levels = result.levels()
+    assert sum(len(level) for level in levels) == len(depth)
+    for k, level in enumerate(levels):
+        assert all(depth[node] == k for node in level)
+
+
+@pytest.mark.parametrize('graph', SPARSE + DENSE)
+def test_dijkstra_distances_match_networkx(graph):
+    result = AlgorithmFactory.create_algorithm("Dijkstra").run(graph, 0)
+    expected = nx.single_source_dijkstra_path_length(graph, 0)
+    for node in graph.nodes():
+        assert result.distance_to(node) == pytest.approx(expected.get(node, math.inf))
+
+
+@pytest.mark.parametrize('graph', SPARSE + DENSE)
+def test_prim_weight_matches_networkx(graph):
+    # Prim cobre só o componente da origem
+    component = graph.subgraph(nx.node_connected_component(graph, 0))
+    expected = nx.minimum_spanning_tree(component).size(weight='weight')
+    result = AlgorithmFactory.create_algorithm("MST (Prim)").run(graph, 0)
+    assert result.total_weight == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('algorithm_type', ["MST (Kruskal)", "MST (Borůvka)"])
+@pytest.mark.parametrize('graph', SPARSE + LARGE + DENSE)
+def test_forest_weight_matches_networkx(algorithm_type, graph):
+    expected = nx.minimum_spanning_tree(graph).size(weight='weight')
+    result = AlgorithmFactory.create_algorithm(algorithm_type).run(graph, 0)
+    assert result.total_weight == pytest.approx(expected)
+
+
+@pytest.mark.parametrize('algorithm_type', ["Dijkstra", "Dijkstra (bidirecional)", "A*"])
+@pytest.mark.parametrize('graph', SPARSE + DENSE)
+def test_path_cost_matches_networkx(algorithm_type, graph):
+    positions = np.random.default_rng(0).random((graph.number_of_nodes(), 2))
+    reachable = nx.single_source_dijkstra_path_length(graph, 0)
+    for target in list(reachable)[-3:]:
+        algorithm = AlgorithmFactory.create_algorithm(algorithm_type, target, EuclideanHeuristic(positions))
+        result = algorithm.run(graph, 0)
+        assert result.path_cost == pytest.approx(reachable[target])
+        assert result.path[0] == 0 and result.path[-1] == target
+        cost = sum(graph[u][v]['weight'] for u, v in zip(result.path, result.path[1:]))
+        assert cost == pytest.approx(reachable[target])
+
+
+@pytest.mark.parametrize('graph', SPARSE + LARGE)
+def test_traverse_levels_ends_each_level(graph):
+    algorithm = AlgorithmFactory.create_algorithm("BFS")
+    ends = algorithm.run(graph, 0).level_offsets[1:].tolist()
+    trace = algorithm.build_trace(graph, 0)
+    states = [(list(state.visited), state.current) for state in algorithm.traverse_levels(graph, 0)]
+    assert states == [(list(trace.state(end - 1).visited), trace.state(end - 1).current) for end in ends]
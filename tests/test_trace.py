@@ -0,0 +1,50 @@
+import pickle
+import random
+import pytest
+from src.algorithms import AlgorithmFactory
+from src.models.frontier import FIFO, LIFO, PRIORITY
+from src.models.traversal_trace import TraversalTrace
+from tests.helpers import random_graph, state_tuple
+
+# Acesso aleatório (checkpoints) deve reconstruir exatamente o estado da
+# reprodução sequencial, para qualquer tipo de fronteira
+
+
+def _assert_seeks_match(trace: TraversalTrace, seed: int) -> None:
+    sequential = [state_tuple(state) + (state.frontier_size,) for state in trace.states()]
+    steps = list(range(len(trace)))
+    random.Random(seed).shuffle(steps)
+    for step in steps:
+        state = trace.state(step)
+        assert state_tuple(state) + (state.frontier_size,) == sequential[step]
+
+
+@pytest.mark.parametrize('kind', [FIFO, LIFO, PRIORITY])
+@pytest.mark.parametrize('seed', range(5))
+def test_random_seeks_match_sequential_replay(kind, seed):
+    # Operações arbitrárias na fronteira, com checkpoints frequentes e visão curta
+    rng = random.Random(seed)
+    num_nodes = rng.randint(5, 60)
+    trace = TraversalTrace(
+        None, list(range(num_nodes)), kind,
+        checkpoint_interval=rng.randint(1, 5), display_limit=rng.randint(1, 6)
+    )
+    size = 0
+    for _ in range(rng.randint(20, 150)):
+        for _ in range(rng.randint(0, 6)):
+            trace.push(rng.randrange(num_nodes), rng.choice([rng.random(), 0.5]))
+            size += 1
+        for _ in range(rng.randint(0, min(size, 5))):
+            trace.pop()
+            size -= 1
+        trace.step(rng.randrange(num_nodes), rng.choice([-1, rng.randrange(num_nodes)]))
+
+    _assert_seeks_match(trace, seed)
+    _assert_seeks_match(pickle.loads(pickle.dumps(trace)), seed)
+
+
+@pytest.mark.parametrize('algorithm_type', ["BFS", "DFS", "Dijkstra", "MST (Prim)"])
+def test_algorithm_trace_seeks(algorithm_type):
+    trace = AlgorithmFactory.create_algorithm(algorithm_type).build_trace(random_graph(400, 1200, 7), 0)
+    trace.checkpoint_interval = 16
+    _assert_seeks_match(trace, 0)
@@ -0,0 +1,104 @@
+import heapq
+from collections import deque
+import pytest
+from src.algorithms import AlgorithmFactory
+from src.models.frontier import DISPLAY_LIMIT
+from tests.helpers import random_graph, state_tuple
+
+# Travessias de referência: os algoritmos originais em Python puro, com listas
+# copiadas a cada passo. traverse() deve produzir os mesmos estados (a fila
+# exibida é limitada a DISPLAY_LIMIT nós).
+
+GRAPHS = [(12, 20, 1), (30, 45, 2), (40, 120, 3), (25, 15, 4)]
+
+
+def _edge(u, v) -> tuple:
+    return tuple(sorted([u, v], key=str))
+
+
+def reference_search(graph, start, depth_first: bool):
+    visited, edges = [], []
+    frontier = [start] if depth_first else deque([start])
+    parent = {start: None}
+    while frontier:
+        current = frontier.pop() if depth_first else frontier.popleft()
+        if current in visited:
+            continue
+        visited.append(current)
+        previous = parent[current]
+        if previous is not None:
+            edges.append(_edge(previous, current))
+        shown = list(frontier)[-DISPLAY_LIMIT:] if depth_first else list(frontier)[:DISPLAY_LIMIT]
+        yield list(visited), current, shown, previous, list(edges)
+
+        neighbors = list(graph.neighbors(current))
+        for neighbor in reversed(neighbors) if depth_first else neighbors:
+            if neighbor not in visited and neighbor not in frontier:
+                frontier.append(neighbor)
+                parent[neighbor] = current
+
+
+def reference_dijkstra(graph, start):
+    distances = {node: float('inf') for node in graph.nodes()}
+    distances[start] = 0
+    previous = {start: None}
+    visited, edges = [], []
+    pq = [(0, start)]
+    while pq:
+        distance, current = heapq.heappop(pq)
+        if current in visited:
+            continue
+        visited.append(current)
+        if previous[current] is not None:
+            edges.append(_edge(previous[current], current))
+        shown = [node for _, node in sorted(pq)][:DISPLAY_LIMIT]
+        yield list(visited), current, shown, previous[current], list(edges)
+
+        for neighbor in graph.neighbors(current):
+            if neighbor not in visited:
+                candidate = distance + graph[current][neighbor]['weight']
+                if candidate < distances[neighbor]:
+                    distances[neighbor] = candidate
+                    previous[neighbor] = current
+                    heapq.heappush(pq, (candidate, neighbor))
+
+
+def reference_prim(graph, start):
+    visited, edges = [], []
+    pq = [(0, start, None)]
+    while pq and len(visited) < graph.number_of_nodes():
+        _, current, previous = heapq.heappop(pq)
+        if current in visited:
+            continue
+        visited.append(current)
+        if previous is not None:
+            edges.append(_edge(previous, current))
+        shown = [node for _, node, _ in sorted(pq)][:DISPLAY_LIMIT]
+        yield list(visited), current, shown, previous, list(edges)
+
+        for neighbor in graph.neighbors(current):
+            if neighbor not in visited:
+                heapq.heappush(pq, (graph[current][neighbor]['weight'], neighbor, current))
+
+
+REFERENCES = {
+    "BFS": lambda graph, start: reference_search(graph, start, depth_first=False),
+    "DFS": lambda graph, start: reference_search(graph, start, depth_first=True),
+    "Dijkstra": reference_dijkstra,
+    "MST (Prim)": reference_prim
+}
+
+
+@pytest.mark.parametrize('algorithm_type', list(REFERENCES))
+@pytest.mark.parametrize('num_nodes,num_edges,seed', GRAPHS)
+def test_traverse_matches_reference(algorithm_type, num_nodes, num_edges, seed):
+    graph = random_graph(num_nodes, num_edges, seed)
+    algorithm = AlgorithmFactory.create_algorithm(algorithm_type)
+    states = [state_tuple(state) for state in algorithm.traverse(graph, 0)]
+    expected = [tuple(state) for state in REFERENCES[algorithm_type](graph, 0)]
+    assert states == expected
+
+
+def test_traverse_rejects_unknown_start():
+    with pytest.raises(ValueError):
+        next(AlgorithmFactory.create_algorithm("BFS").traverse(random_graph(5, 4, 0), 'x'))